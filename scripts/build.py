@@ -46,9 +46,9 @@ def prepare_src() -> None:
     shutil.rmtree("build", ignore_errors=True)
     shutil.copytree("src", "build")
 
-    # Set version string in app file
-    logging.debug("Setting version string in app file...")
-    app_file: Path = Path("build") / "app.py"
+    # Set version string in app context file
+    logging.debug("Setting version string in app context file...")
+    app_file: Path = Path("build") / "app_context.py"
     app_file.write_text(
         VERSION_PATTERN.sub(str(project_version), app_file.read_text(encoding="utf8"))
     )
@@ -18,17 +18,24 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication, QMessageBox
 
 import resources_rc  # type: ignore # noqa: F401
+from app_context import AppContext
 from core.config.app_config import AppConfig
+from core.utilities.download_cache import DownloadCache
+from core.utilities.downloader import Downloader
 from core.utilities.env_resolver import resolve
 from core.utilities.exception_handler import ExceptionHandler
 from core.utilities.filesystem import get_documents_folder
 from core.utilities.localisation import Language, detect_system_locale
 from core.utilities.logger import Logger
 from core.utilities.path_limit_fixer import PathLimitFixer
+from core.utilities.startup_scheduler import StartupScheduler
+from core.utilities.tracer import Tracer
+from core.utilities.transfer_log import TransferLog
 from core.utilities.updater import Updater
 from ui.main_window import MainWindow
 from ui.utilities.stylesheet_processor import StylesheetProcessor
 from ui.utilities.ui_mode import UIMode
+from ui.widgets.loading_dialog import LoadingDialog
 
 
 class App(QApplication):
@@ -36,8 +43,8 @@ class App(QApplication):
     Main application class.
     """
 
-    APP_NAME: str = "Mod Manager Migrator"
-    APP_VERSION: str = "development"
+    APP_NAME: str = AppContext.APP_NAME
+    APP_VERSION: str = AppContext.APP_VERSION
 
     args: Namespace
     app_config: AppConfig
@@ -46,6 +53,7 @@ class App(QApplication):
     data_path: Path = cur_path / "data"
     res_path: Path = cur_path / "res"
     config_path: Path = data_path / "config"
+    cache_path: Path = data_path / "cache"
 
     log: logging.Logger = logging.getLogger("App")
     logger: Logger
@@ -54,6 +62,7 @@ class App(QApplication):
     main_window: MainWindow
     stylesheet_processor: StylesheetProcessor
     exception_handler: ExceptionHandler
+    startup_scheduler: StartupScheduler
 
     doc_path: Path
 
@@ -61,31 +70,52 @@ class App(QApplication):
         super().__init__()
 
         self.args = args
+        self.startup_scheduler = StartupScheduler()
 
     def init(self) -> None:
         """
         Initializes application.
         """
 
-        self.app_config = AppConfig.load(self.config_path)
-        self.doc_path = get_documents_folder()
+        with self.startup_scheduler.measure("config"):
+            self.app_config = AppConfig.load(self.config_path)
+            self.doc_path = get_documents_folder()
+            Downloader.cache = DownloadCache(self.cache_path / "downloads")
 
-        log_file: Path = self.log_path / time.strftime(self.app_config.log_file_name)
-        self.logger = Logger(
-            log_file, self.app_config.log_format, self.app_config.log_date_format
-        )
-        self.logger.setLevel(self.app_config.log_level)
+        with self.startup_scheduler.measure("logger"):
+            log_file: Path = self.log_path / time.strftime(
+                self.app_config.log_file_name
+            )
+            self.logger = Logger(
+                log_file, self.app_config.log_format, self.app_config.log_date_format
+            )
+            self.logger.setLevel(self.app_config.log_level)
+            Tracer.set_enabled(self.app_config.log_trace)
+            TransferLog.configure(
+                self.app_config.log_transfer_summary,
+                (
+                    log_file.with_suffix(".transfers.gz")
+                    if self.app_config.log_transfer_details
+                    else None
+                ),
+            )
 
         self.setApplicationName(App.APP_NAME)
         self.setApplicationDisplayName(f"{App.APP_NAME} v{App.APP_VERSION}")
         self.setApplicationVersion(App.APP_VERSION)
         self.setWindowIcon(QIcon(":/icons/mmm.ico"))
-        self.load_translation()
 
-        ui_mode: UIMode = UIMode.get(self.app_config.ui_mode, UIMode.System)
-        self.stylesheet_processor = StylesheetProcessor(self, ui_mode)
+        with self.startup_scheduler.measure("translation"):
+            self.load_translation()
+
+        with self.startup_scheduler.measure("stylesheet"):
+            ui_mode: UIMode = UIMode.get(self.app_config.ui_mode, UIMode.System)
+            self.stylesheet_processor = StylesheetProcessor(self, ui_mode)
+
         self.exception_handler = ExceptionHandler(self)
-        self.main_window = MainWindow(self.app_config)
+
+        with self.startup_scheduler.measure("main window"):
+            self.main_window = MainWindow(self.app_config)
 
         self.log_basic_info()
         self.app_config.print_settings_to_log()
@@ -134,17 +164,29 @@ class App(QApplication):
     def exec(self) -> int:
         """
         Executes application and shows main window.
+        The remaining startup tasks are run after the main window is shown.
         """
 
-        self.__clean_old_data()
+        self.main_window.show()
 
+        self.startup_scheduler.run_in_background(
+            "clean old data", self.__clean_old_data
+        )
         try:
-            Updater(self.APP_VERSION).run()
+            updater = Updater(self.APP_VERSION, self.cache_path / "update.json")
+
+            def show_update(update_available: bool) -> None:
+                if update_available:
+                    updater.show_dialog()
+
+            self.startup_scheduler.run_in_background(
+                "update check", updater.check, show_update
+            )
         except Exception as ex:
             self.log.warning(f"Failed to check for updates: {ex}", exc_info=ex)
-
-        self.main_window.show()
-        self.detect_path_limit()
+        self.startup_scheduler.defer("taskbar", LoadingDialog.get_taskbar)
+        self.startup_scheduler.defer("path limit", self.detect_path_limit)
+        self.startup_scheduler.start()
 
         retcode: int = super().exec()
 
@@ -197,12 +239,38 @@ class App(QApplication):
 
         self.log.info("Cleaning...")
 
+        self.export_trace()
+        TransferLog.close()
+
         # Clean up log files
         self.logger.clean_log_folder(
             self.log_path,
             self.app_config.log_file_name,
             self.app_config.log_num_of_files,
         )
+        self.logger.clean_log_folder(
+            self.log_path,
+            str(Path(self.app_config.log_file_name).with_suffix(".trace.json")),
+            self.app_config.log_num_of_files,
+        )
+        self.logger.clean_log_folder(
+            self.log_path,
+            str(Path(self.app_config.log_file_name).with_suffix(".transfers.gz")),
+            self.app_config.log_num_of_files,
+        )
+
+    def export_trace(self) -> None:
+        """
+        Exports the recorded performance trace (if any) next to the current log file.
+        """
+
+        if not Tracer.has_data():
+            return
+
+        try:
+            Tracer.export(self.logger.get_file_path().with_suffix(".trace.json"))
+        except Exception as ex:
+            self.log.error(f"Failed to export trace: {ex}", exc_info=ex)
 
     def restart_application(self) -> None:
         """
@@ -10,6 +10,17 @@ class AppContext:
     Singleton context for storing the main application instance.
     """
 
+    APP_NAME: str = "Mod Manager Migrator"
+    """The name of the application."""
+
+    APP_VERSION: str = "development"
+    """
+    The version of the application, replaced by the build script.
+
+    Defined here instead of in `App`, so that the commandline interface doesn't have
+    to import the GUI.
+    """
+
     _app_instance: Optional["App"] = None
 
     @classmethod
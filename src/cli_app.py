@@ -0,0 +1,834 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import json
+import logging
+import re
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser, BooleanOptionalAction, Namespace
+from pathlib import Path
+from shutil import disk_usage
+from typing import TYPE_CHECKING, Any, Optional, cast
+
+from PySide6.QtCore import QCoreApplication
+
+import resources_rc  # type: ignore # noqa: F401
+from core.config.app_config import AppConfig
+from core.game.game import Game
+from core.instance.instance import Instance
+from core.migrator.file_blacklist import FileBlacklist
+from core.migrator.migration_report import MigrationReport
+from core.migrator.migrator import Migrator
+from core.mod_manager.exceptions import InstanceNotFoundError
+from core.mod_manager.instance_info import InstanceInfo
+from core.mod_manager.mod_manager import ModManager
+from core.mod_manager.modorganizer.mo2_instance_info import MO2InstanceInfo
+from core.mod_manager.modorganizer.modorganizer import ModOrganizer
+from core.mod_manager.vortex.profile_info import ProfileInfo
+from core.mod_manager.vortex.vortex import Vortex
+from core.utilities.console_progress import ConsoleProgress
+from core.utilities.download_cache import DownloadCache
+from core.utilities.downloader import Downloader
+from core.utilities.env_resolver import resolve
+from core.utilities.logger import Logger
+from core.utilities.scale import scale_value
+from core.utilities.tracer import Tracer
+from core.utilities.transfer_log import TransferLog
+
+if TYPE_CHECKING:
+    from ui.widgets.loading_dialog import LoadingDialog
+
+
+class CliApp:
+    """
+    Headless application class for loading, planning, migrating and verifying
+    instances from the commandline without creating any widgets.
+
+    Progress is written to stdout, the log is written to the log folder only. No Qt
+    application is created since neither an event loop nor widgets are required.
+    """
+
+    RETURN_OK: int = 0
+    """Return code when the command was successful."""
+
+    RETURN_ERRORS: int = 1
+    """Return code when the command completed with errors (see report)."""
+
+    RETURN_FAILED: int = 2
+    """Return code when the command failed."""
+
+    SIZE_KEYS: set[str] = {"size", "required_space", "free_space"}
+    """Keys of sizes in bytes that are printed human-readable."""
+
+    args: Namespace
+    app_config: AppConfig
+
+    cur_path: Path
+    data_path: Path
+    config_path: Path
+    cache_path: Path
+
+    log: logging.Logger = logging.getLogger("CliApp")
+    log_path: Path
+    log_file: Path
+
+    progress: Optional[ConsoleProgress]
+
+    __mod_managers: dict[type[ModManager], ModManager]
+    __log_handlers: list[logging.Handler]
+
+    def __init__(self, args: Namespace, app_name: str, app_version: str) -> None:
+        """
+        Args:
+            args (Namespace): Parsed commandline arguments.
+            app_name (str): Name of the application.
+            app_version (str): Version of the application.
+        """
+
+        self.args = args
+        self.__mod_managers = {}
+
+        # Resolved here instead of on import, so that they follow the working
+        # directory the app is created in
+        self.cur_path = Path.cwd()
+        self.data_path = self.cur_path / "data"
+        self.config_path = self.data_path / "config"
+        self.cache_path = self.data_path / "cache"
+        self.log_path = self.data_path / "logs"
+        self.__log_handlers = []
+
+        QCoreApplication.setApplicationName(app_name)
+        QCoreApplication.setApplicationVersion(app_version)
+
+    @staticmethod
+    def add_commands(parser: ArgumentParser) -> None:
+        """
+        Adds the subcommands of the headless mode to the specified parser.
+
+        Args:
+            parser (ArgumentParser): Commandline argument parser.
+        """
+
+        common = ArgumentParser(add_help=False)
+        common.add_argument(
+            "--game", required=True, help="Id of the game, for eg. 'skyrimse'."
+        )
+        common.add_argument(
+            "--game-folder",
+            type=Path,
+            help="Game folder to use if it cannot be detected from the instance.",
+        )
+        common.add_argument(
+            "--modname-limit",
+            type=int,
+            help="Character limit for mod names. Defaults to the app settings.",
+        )
+        common.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the result as JSON (implies --quiet).",
+        )
+        common.add_argument(
+            "-q", "--quiet", action="store_true", help="Do not print any progress."
+        )
+        common.add_argument(
+            "-v",
+            "--verbose",
+            action="store_true",
+            help="Print the log to stderr in addition to the log file.",
+        )
+        common.add_argument(
+            "--log-file",
+            type=Path,
+            help="Path to the log file. Defaults to a new file in the log folder.",
+        )
+
+        source = ArgumentParser(add_help=False)
+        src_group = source.add_mutually_exclusive_group(required=True)
+        src_group.add_argument(
+            "--src-mo2", type=Path, metavar="PATH", help="Portable source MO2 instance."
+        )
+        src_group.add_argument(
+            "--src-mo2-global", metavar="NAME", help="Global source MO2 instance."
+        )
+        src_group.add_argument(
+            "--src-vortex", metavar="PROFILE", help="Name or id of a Vortex profile."
+        )
+        source.add_argument(
+            "--src-profile",
+            default="Default",
+            help="Profile of the source MO2 instance. Defaults to 'Default'.",
+        )
+
+        destination = ArgumentParser(add_help=False)
+        dst_group = destination.add_mutually_exclusive_group(required=True)
+        dst_group.add_argument(
+            "--dst-mo2",
+            type=Path,
+            metavar="PATH",
+            help="Portable destination MO2 instance.",
+        )
+        dst_group.add_argument(
+            "--dst-mo2-global", metavar="NAME", help="Global destination MO2 instance."
+        )
+        dst_group.add_argument(
+            "--dst-vortex",
+            metavar="PROFILE",
+            help="Name of a new or name or id of an existing Vortex profile.",
+        )
+        destination.add_argument(
+            "--dst-profile",
+            default="Default",
+            help="Profile of the destination MO2 instance. Defaults to 'Default'.",
+        )
+        destination.add_argument(
+            "--dst-mods-folder",
+            type=Path,
+            help="Mods folder of a new MO2 instance. Defaults to '<instance>/mods'.",
+        )
+        destination.add_argument(
+            "--no-install-mo2",
+            action="store_true",
+            help="Do not download and install MO2 to a new portable instance.",
+        )
+        destination.add_argument(
+            "--no-root-builder",
+            action="store_true",
+            help="Do not use the root builder structure for a new MO2 instance.",
+        )
+
+        options = ArgumentParser(add_help=False)
+        options.add_argument(
+            "--hardlinks",
+            action=BooleanOptionalAction,
+            help="Use hardlinks if possible. Defaults to the app settings.",
+        )
+        options.add_argument(
+            "--replace",
+            action=BooleanOptionalAction,
+            help="Replace existing files. Defaults to the app settings.",
+        )
+
+        subparsers = parser.add_subparsers(
+            dest="command", metavar="COMMAND", help="Run headless without GUI."
+        )
+
+        load_parser: ArgumentParser = subparsers.add_parser(
+            "load", parents=[common, source], help="Load and summarize an instance."
+        )
+        load_parser.add_argument(
+            "--list", action="store_true", help="List the mods and tools."
+        )
+
+        subparsers.add_parser(
+            "plan",
+            parents=[common, source, destination, options],
+            help="Check a migration without changing anything.",
+        )
+
+        migrate_parser: ArgumentParser = subparsers.add_parser(
+            "migrate",
+            parents=[common, source, destination, options],
+            help="Migrate an instance.",
+        )
+        migrate_parser.add_argument(
+            "--activate",
+            action=BooleanOptionalAction,
+            help="Activate the migrated instance. Defaults to the app settings.",
+        )
+        migrate_parser.add_argument(
+            "--verify",
+            action=BooleanOptionalAction,
+            help="Verify the migrated files. Defaults to the app settings.",
+        )
+        migrate_parser.add_argument(
+            "--no-tools", action="store_true", help="Do not migrate any tools."
+        )
+
+        subparsers.add_parser(
+            "verify",
+            parents=[common, source, destination],
+            help="Verify an already migrated instance against its source.",
+        )
+
+    def init(self) -> None:
+        """
+        Initializes the headless application.
+        """
+
+        self.app_config = AppConfig.load(self.config_path)
+
+        self.log_file = self.args.log_file or self.log_path / time.strftime(
+            self.app_config.log_file_name
+        )
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        formatter = logging.Formatter(
+            self.app_config.log_format, self.app_config.log_date_format
+        )
+        root_logger: logging.Logger = logging.getLogger()
+        root_logger.setLevel(self.app_config.log_level.value)
+
+        self.__log_handlers.append(logging.FileHandler(self.log_file, encoding="utf8"))
+        if self.args.verbose:
+            self.__log_handlers.append(logging.StreamHandler(sys.stderr))
+
+        for handler in self.__log_handlers:
+            handler.setFormatter(formatter)
+            root_logger.addHandler(handler)
+
+        Tracer.set_enabled(self.app_config.log_trace)
+        TransferLog.configure(
+            self.app_config.log_transfer_summary,
+            (
+                self.log_file.with_suffix(".transfers.gz")
+                if self.app_config.log_transfer_details
+                else None
+            ),
+        )
+        Downloader.cache = DownloadCache(self.cache_path / "downloads")
+
+        self.progress = None
+        if not self.args.quiet and not self.args.json:
+            self.progress = ConsoleProgress()
+
+        self.log.info(
+            f"{QCoreApplication.applicationName()} v{QCoreApplication.applicationVersion()} "
+            "started headless."
+        )
+        self.log.info(f"Executed command: {subprocess.list2cmdline(sys.argv)}")
+        self.app_config.print_settings_to_log()
+
+    def exec(self) -> int:
+        """
+        Executes the selected command.
+
+        Returns:
+            int: Return code of the command.
+        """
+
+        retcode: int
+
+        try:
+            match self.args.command:
+                case "load":
+                    retcode = self.load()
+                case "plan":
+                    retcode = self.plan()
+                case "migrate":
+                    retcode = self.migrate()
+                case "verify":
+                    retcode = self.verify()
+                case command:
+                    raise ValueError(f"Unknown command: {command!r}")
+        except Exception as ex:
+            self.log.critical(f"Command {self.args.command!r} failed!", exc_info=ex)
+            print(f"Error: {ex}", file=sys.stderr)
+            retcode = CliApp.RETURN_FAILED
+        finally:
+            if self.progress is not None:
+                self.progress.flush()
+
+        self.clean()
+
+        return retcode
+
+    def load(self) -> int:
+        """
+        Loads the source instance and prints a summary.
+
+        Returns:
+            int: Return code.
+        """
+
+        game: Game = self.get_game()
+        mod_manager, instance_info = self.get_source(game)
+        instance: Instance = self.load_instance(mod_manager, instance_info)
+
+        result: dict[str, Any] = CliApp.summarize_instance(instance)
+        if self.args.list:
+            result["mod_list"] = {
+                mod.display_name: {
+                    "enabled": mod.enabled,
+                    "version": mod.metadata.version,
+                    "files": len(mod.files),
+                    "size": mod.size,
+                }
+                for mod in instance.loadorder
+            }
+            result["tool_list"] = [tool.display_name for tool in instance.tools]
+
+        self.output(result)
+
+        return CliApp.RETURN_OK
+
+    def plan(self) -> int:
+        """
+        Loads the source instance and checks the migration to the destination
+        without changing anything.
+
+        Returns:
+            int: Return code.
+        """
+
+        game: Game = self.get_game()
+        src_mod_manager, src_info = self.get_source(game)
+        dst_mod_manager, dst_info = self.get_destination(game)
+        src_instance: Instance = self.load_instance(src_mod_manager, src_info)
+
+        use_hardlinks: bool = self.get_option("hardlinks", "use_hardlinks")
+        replace: bool = self.get_option("replace", "replace_when_merge")
+
+        src_mods_path: Path = src_mod_manager.get_mods_path(src_info)
+        dst_mods_path: Path = dst_mod_manager.get_mods_path(dst_info)
+        hardlinks_possible: bool = (
+            use_hardlinks and src_mods_path.drive == dst_mods_path.drive
+        )
+
+        mods: int = len(src_instance.mods)
+        dst_exists: bool = dst_mod_manager.is_instance_existing(dst_info)
+        if dst_exists and not replace:
+            dst_instance: Instance = self.load_instance(dst_mod_manager, dst_info)
+            mods = len(
+                [
+                    mod
+                    for mod in src_instance.mods
+                    if not dst_instance.is_mod_installed(mod)
+                ]
+            )
+
+        required_space: int = 0 if hardlinks_possible else src_instance.size
+        free_space: int = CliApp.get_free_space(dst_mods_path)
+
+        result: dict[str, Any] = {
+            "source": CliApp.summarize_instance(src_instance),
+            "destination": {
+                "mod_manager": dst_mod_manager.get_display_name(),
+                "name": dst_info.display_name,
+                "mods_path": str(dst_mods_path),
+                "exists": dst_exists,
+            },
+            "mods_to_migrate": mods,
+            "hardlinks": hardlinks_possible,
+            "required_space": required_space,
+            "free_space": free_space,
+            "enough_space": free_space >= required_space,
+        }
+        self.output(result)
+
+        return CliApp.RETURN_OK if result["enough_space"] else CliApp.RETURN_ERRORS
+
+    def migrate(self) -> int:
+        """
+        Migrates the source instance to the destination.
+
+        Returns:
+            int: Return code.
+        """
+
+        game: Game = self.get_game()
+        src_mod_manager, src_info = self.get_source(game)
+        dst_mod_manager, dst_info = self.get_destination(game)
+        src_instance: Instance = self.load_instance(src_mod_manager, src_info)
+
+        report: MigrationReport = Migrator().migrate(
+            src_instance=src_instance,
+            src_info=src_info,
+            dst_info=dst_info,
+            src_mod_manager=src_mod_manager,
+            dst_mod_manager=dst_mod_manager,
+            use_hardlinks=self.get_option("hardlinks", "use_hardlinks"),
+            replace=self.get_option("replace", "replace_when_merge"),
+            modname_limit=self.get_modname_limit(),
+            activate_new_instance=self.get_option("activate", "activate_new_instance"),
+            included_tools=[] if self.args.no_tools else src_instance.tools,
+            verify_files=self.get_option("verify", "verify_migrated_files"),
+            ldialog=self.get_ldialog(),
+        )
+
+        result: dict[str, Any] = CliApp.summarize_report(report)
+        result["message"] = dst_mod_manager.get_completed_message(dst_info).strip()
+        self.output(result)
+
+        return CliApp.RETURN_ERRORS if report.has_errors else CliApp.RETURN_OK
+
+    def verify(self) -> int:
+        """
+        Verifies an already migrated destination instance against its source.
+
+        Returns:
+            int: Return code.
+        """
+
+        game: Game = self.get_game()
+        src_mod_manager, src_info = self.get_source(game)
+        dst_mod_manager, dst_info = self.get_destination(game)
+        src_instance: Instance = self.load_instance(src_mod_manager, src_info)
+        dst_instance: Instance = self.load_instance(dst_mod_manager, dst_info)
+
+        report: MigrationReport = Migrator().verify(
+            src_instance, dst_instance, src_mod_manager, ldialog=self.get_ldialog()
+        )
+        self.output(CliApp.summarize_report(report))
+
+        return CliApp.RETURN_ERRORS if report.has_errors else CliApp.RETURN_OK
+
+    def get_game(self) -> Game:
+        """
+        Returns:
+            Game: The game specified by the `--game` argument.
+        """
+
+        return Game.get_game_by_id(self.args.game)
+
+    def get_option(self, arg_name: str, config_name: str) -> bool:
+        """
+        Gets a boolean option from the commandline or from the app settings if it was
+        not specified.
+
+        Args:
+            arg_name (str): Name of the commandline argument.
+            config_name (str): Name of the app setting.
+
+        Returns:
+            bool: The value of the option.
+        """
+
+        value: Optional[bool] = getattr(self.args, arg_name, None)
+        if value is None:
+            value = getattr(self.app_config, config_name)
+
+        return bool(value)
+
+    def get_modname_limit(self) -> int:
+        """
+        Returns:
+            int: The character limit for mod names.
+        """
+
+        if self.args.modname_limit is not None:
+            return self.args.modname_limit
+
+        return self.app_config.modname_limit
+
+    def get_ldialog(self) -> Optional["LoadingDialog"]:
+        """
+        Returns:
+            Optional[LoadingDialog]:
+                The console progress in place of a loading dialog or None if quiet.
+        """
+
+        return cast(Optional["LoadingDialog"], self.progress)
+
+    def get_mod_manager[M: ModManager](self, mod_manager_type: type[M]) -> M:
+        """
+        Gets the shared instance of the specified mod manager, so that source and
+        destination use the same one.
+
+        Args:
+            mod_manager_type (type[M]): Type of the mod manager.
+
+        Returns:
+            M: The mod manager.
+        """
+
+        if mod_manager_type not in self.__mod_managers:
+            self.__mod_managers[mod_manager_type] = mod_manager_type()
+
+        return cast(M, self.__mod_managers[mod_manager_type])
+
+    def get_source(self, game: Game) -> tuple[ModManager, InstanceInfo]:
+        """
+        Gets the mod manager and the info of the source instance.
+
+        Args:
+            game (Game): The selected game.
+
+        Raises:
+            ValueError: when the source instance does not exist.
+
+        Returns:
+            tuple[ModManager, InstanceInfo]: Mod manager and instance info.
+        """
+
+        if self.args.src_vortex is not None:
+            vortex: Vortex = self.get_mod_manager(Vortex)
+            return vortex, CliApp.get_vortex_profile(
+                vortex, game, self.args.src_vortex, create=False
+            )
+
+        mo2_path: Path
+        is_global: bool = self.args.src_mo2_global is not None
+        if is_global:
+            mo2_path = CliApp.get_global_mo2_path(self.args.src_mo2_global)
+        else:
+            mo2_path = self.args.src_mo2.absolute()
+
+        mo2_ini_path: Path = mo2_path / "ModOrganizer.ini"
+        if not mo2_ini_path.is_file():
+            raise ValueError(f"Invalid MO2 instance: {str(mo2_path)!r}!")
+
+        return self.get_mod_manager(ModOrganizer), MO2InstanceInfo(
+            display_name=mo2_path.name if is_global else "Portable",
+            game=game,
+            profile=self.args.src_profile,
+            is_global=is_global,
+            base_folder=mo2_path,
+            mods_folder=ModOrganizer.get_mods_folder(mo2_ini_path),
+            profiles_folder=ModOrganizer.get_profiles_folder(mo2_ini_path),
+        )
+
+    def get_destination(self, game: Game) -> tuple[ModManager, InstanceInfo]:
+        """
+        Gets the mod manager and the info of the destination instance.
+        The destination instance is not required to exist.
+
+        Args:
+            game (Game): The selected game.
+
+        Returns:
+            tuple[ModManager, InstanceInfo]: Mod manager and instance info.
+        """
+
+        if self.args.dst_vortex is not None:
+            vortex: Vortex = self.get_mod_manager(Vortex)
+            return vortex, CliApp.get_vortex_profile(
+                vortex, game, self.args.dst_vortex, create=True
+            )
+
+        mo2_path: Path
+        is_global: bool = self.args.dst_mo2_global is not None
+        if is_global:
+            mo2_path = CliApp.get_global_mo2_path(self.args.dst_mo2_global)
+        else:
+            mo2_path = self.args.dst_mo2.absolute()
+
+        mods_folder: Path = (self.args.dst_mods_folder or mo2_path / "mods").absolute()
+        profiles_folder: Path = mo2_path / "profiles"
+
+        # Use the configured folders of an existing instance
+        mo2_ini_path: Path = mo2_path / "ModOrganizer.ini"
+        if mo2_ini_path.is_file():
+            mods_folder = ModOrganizer.get_mods_folder(mo2_ini_path)
+            profiles_folder = ModOrganizer.get_profiles_folder(mo2_ini_path)
+
+        return self.get_mod_manager(ModOrganizer), MO2InstanceInfo(
+            display_name=mo2_path.name,
+            game=game,
+            profile=self.args.dst_profile,
+            is_global=is_global,
+            base_folder=mo2_path,
+            mods_folder=mods_folder,
+            profiles_folder=profiles_folder,
+            install_mo2=not is_global and not self.args.no_install_mo2,
+            use_root_builder=not self.args.no_root_builder,
+        )
+
+    def load_instance[I: InstanceInfo](
+        self, mod_manager: ModManager[I], instance_info: I
+    ) -> Instance:
+        """
+        Loads the specified instance.
+
+        Args:
+            mod_manager (ModManager[I]): Mod manager of the instance.
+            instance_info (I): Info of the instance.
+
+        Returns:
+            Instance: The loaded instance.
+        """
+
+        return mod_manager.load_instance(
+            instance_info,
+            self.get_modname_limit(),
+            FileBlacklist.get_matcher(),
+            self.args.game_folder,
+            self.get_ldialog(),
+        )
+
+    def output(self, result: dict[str, Any]) -> None:
+        """
+        Prints the result of a command to stdout, either as JSON or as human-readable
+        text.
+
+        Args:
+            result (dict[str, Any]): Result of the command.
+        """
+
+        if self.progress is not None:
+            self.progress.flush()
+
+        if self.args.json:
+            print(json.dumps(result, indent=4))
+            return
+
+        def print_dict(data: dict[str, Any], indent: int = 0) -> None:
+            for key, value in data.items():
+                if isinstance(value, (dict, list)) and not value:
+                    continue
+                elif isinstance(value, dict):
+                    print(f"{' ' * indent}{key}:")
+                    print_dict(value, indent + 4)
+                elif isinstance(value, list):
+                    print(f"{' ' * indent}{key}:")
+                    for item in value:
+                        print(f"{' ' * (indent + 4)}{item}")
+                elif key in CliApp.SIZE_KEYS:
+                    print(f"{' ' * indent}{key}: {scale_value(value)}")
+                elif value != "":
+                    print(f"{' ' * indent}{key}: {value}")
+
+        print_dict(result)
+
+    def clean(self) -> None:
+        """
+        Exports the performance trace (if any), closes the transfer details and
+        cleans up old log files.
+        """
+
+        if Tracer.has_data():
+            try:
+                Tracer.export(self.log_file.with_suffix(".trace.json"))
+            except Exception as ex:
+                self.log.error(f"Failed to export trace: {ex}", exc_info=ex)
+
+        TransferLog.close()
+
+        if self.args.log_file is None:
+            Logger.clean_log_folder(
+                self.log_path,
+                self.app_config.log_file_name,
+                self.app_config.log_num_of_files,
+            )
+            Logger.clean_log_folder(
+                self.log_path,
+                str(Path(self.app_config.log_file_name).with_suffix(".trace.json")),
+                self.app_config.log_num_of_files,
+            )
+            Logger.clean_log_folder(
+                self.log_path,
+                str(Path(self.app_config.log_file_name).with_suffix(".transfers.gz")),
+                self.app_config.log_num_of_files,
+            )
+
+        for handler in self.__log_handlers:
+            logging.getLogger().removeHandler(handler)
+            handler.close()
+
+    @staticmethod
+    def get_vortex_profile(
+        vortex: Vortex, game: Game, profile: str, create: bool
+    ) -> ProfileInfo:
+        """
+        Gets the info of a Vortex profile by its name or id.
+
+        Args:
+            vortex (Vortex): Vortex mod manager.
+            game (Game): The selected game.
+            profile (str): Name or id of the profile.
+            create (bool):
+                Whether to return the info for a new profile if it does not exist.
+
+        Raises:
+            InstanceNotFoundError:
+                when the profile does not exist and `create` is `False`.
+
+        Returns:
+            ProfileInfo: The info of the profile.
+        """
+
+        for instance_name in vortex.get_instance_names(game):
+            match: Optional[re.Match] = re.match(r"^(.*) \((.*)\)$", instance_name)
+
+            if match is not None and profile in match.groups():
+                return ProfileInfo(
+                    display_name=instance_name, game=game, id=match.group(2)
+                )
+
+        if not create:
+            raise InstanceNotFoundError(profile)
+
+        return ProfileInfo(display_name=profile, game=game, id=Vortex.generate_id())
+
+    @staticmethod
+    def get_global_mo2_path(instance_name: str) -> Path:
+        """
+        Args:
+            instance_name (str): Name of a global MO2 instance.
+
+        Returns:
+            Path: Path to the folder of the global MO2 instance.
+        """
+
+        return resolve(Path("%LOCALAPPDATA%") / "ModOrganizer") / instance_name
+
+    @staticmethod
+    def get_free_space(path: Path) -> int:
+        """
+        Gets the free space of the disk of the specified path, even if it does not
+        exist yet.
+
+        Args:
+            path (Path): The path.
+
+        Returns:
+            int: Free space in bytes.
+        """
+
+        path = path.absolute()
+        while not path.exists() and path.parent != path:
+            path = path.parent
+
+        return disk_usage(path).free
+
+    @staticmethod
+    def summarize_instance(instance: Instance) -> dict[str, Any]:
+        """
+        Summarizes a loaded instance.
+
+        Args:
+            instance (Instance): The instance.
+
+        Returns:
+            dict[str, Any]: The summary.
+        """
+
+        return {
+            "name": instance.display_name,
+            "game_folder": str(instance.game_folder),
+            "mods": len(instance.mods),
+            "enabled_mods": len([mod for mod in instance.mods if mod.enabled]),
+            "tools": len(instance.tools),
+            "files": sum(len(mod.files) for mod in instance.mods),
+            "size": instance.size,
+            "order_matters": instance.order_matters,
+        }
+
+    @staticmethod
+    def summarize_report(report: MigrationReport) -> dict[str, Any]:
+        """
+        Summarizes a migration report.
+
+        Args:
+            report (MigrationReport): The migration report.
+
+        Returns:
+            dict[str, Any]: The summary.
+        """
+
+        return {
+            "success": not report.has_errors,
+            "failed_mods": {
+                mod.display_name: str(ex) for mod, ex in report.failed_mods.items()
+            },
+            "failed_tools": {
+                tool.display_name: str(ex) for tool, ex in report.failed_tools.items()
+            },
+            "failed_files": {
+                str(path): str(ex) for path, ex in report.failed_files.items()
+            },
+            "other_errors": {name: str(ex) for name, ex in report.other_errors.items()},
+        }
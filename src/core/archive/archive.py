@@ -4,18 +4,75 @@ Copyright (c) Cutleast
 
 import logging
 import os
+import shutil
+import tempfile
+import threading
 from abc import ABC, abstractmethod
-from pathlib import Path
-
-from virtual_glob import InMemoryPath, glob
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path, PurePosixPath
+from typing import IO, Callable, Optional
 
 from core.utilities.process_runner import run_process
+from core.utilities.progress_update import (
+    ProgressCallback,
+    ProgressUpdate,
+    safe_run_callback,
+)
+
+from .archive_index import ArchiveEntry, ArchiveIndex
+
+
+class ExtractionProgress:
+    """
+    Class for collecting the progress of an extraction from several threads.
+    """
+
+    total: int
+    """Total size of the extracted files in bytes."""
+
+    current: int
+    """Size of the already extracted data in bytes."""
+
+    __callback: Optional[ProgressCallback]
+    __lock: threading.Lock
+
+    def __init__(self, total: int, callback: Optional[ProgressCallback]) -> None:
+        self.total = total
+        self.current = 0
+        self.__callback = callback
+        self.__lock = threading.Lock()
+
+    def add(self, size: int) -> None:
+        """
+        Adds extracted data. Thread-safe.
+
+        Args:
+            size (int): Size of the extracted data in bytes.
+        """
+
+        with self.__lock:
+            self.current += size
+
+    def report(self) -> None:
+        """
+        Calls the progress callback with the current progress.
+        """
+
+        safe_run_callback(
+            self.__callback, ProgressUpdate(current=self.current, maximum=self.total)
+        )
 
 
 class Archive(ABC):
     """
     Base class for archives.
 
+    Archives are extracted in-process with multiple threads if the archive type
+    supports it and with the 7-zip commandline otherwise or if that fails.
+
+    The metadata of an archive is read once into an `ArchiveIndex`, which is shared
+    between all instances until the archive file is modified.
+
     **Do not instantiate directly, use Archive.load_archive() instead!**
     """
 
@@ -23,13 +80,26 @@ class Archive(ABC):
 
     _bin_path = Path("res") / "7-zip" / "7z.exe"
 
-    __files: list[str] | None = None
+    MAX_WORKERS: int = min(8, os.cpu_count() or 1)
+    """Maximum number of threads for extracting an archive."""
+
+    CHUNK_SIZE: int = 1024 * 1024  # 1 MB
+
+    PROGRESS_INTERVAL: float = 0.1
+    """Interval in seconds in which the progress callback is called."""
 
     def __init__(self, path: Path):
         self.path = path
 
     @property
-    @abstractmethod
+    def index(self) -> ArchiveIndex:
+        """
+        The (cached) metadata of the files in the archive.
+        """
+
+        return ArchiveIndex.get(self.path, self._read_index)
+
+    @property
     def files(self) -> list[str]:
         """
         Gets a list of files in the archive.
@@ -38,6 +108,18 @@ class Archive(ABC):
             list[str]: List of filenames, relative to archive root.
         """
 
+        return self.index.files
+
+    @abstractmethod
+    def _read_index(self) -> ArchiveIndex:
+        """
+        Reads the metadata of all files in the archive. The archive must be closed
+        before this method returns.
+
+        Returns:
+            ArchiveIndex: The metadata of the files in the archive.
+        """
+
     def get_files(self) -> list[str]:
         """
         Alias method for `Archive.files` property.
@@ -48,7 +130,12 @@ class Archive(ABC):
 
         return self.files
 
-    def extract_all(self, dest: Path, full_paths: bool = True) -> None:
+    def extract_all(
+        self,
+        dest: Path,
+        full_paths: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> None:
         """
         Extracts archive content.
 
@@ -56,23 +143,23 @@ class Archive(ABC):
             dest (Path): Folder to extract archive content to.
             full_paths (bool, optional):
                 Toggles whether paths within archive are retained. Defaults to True.
+            progress_callback (Optional[ProgressCallback], optional):
+                Optional function or method to call with a ProgressUpdate of the
+                extracted bytes. Defaults to None.
 
         Raises:
             RuntimeError: When the 7-zip commandline returns a non-zero exit code.
         """
 
-        cmd: list[str] = [
-            str(Archive._bin_path),
-            "x" if full_paths else "e",
-            str(self.path),
-            f"-o{dest}",
-            "-aoa",
-            "-y",
-        ]
-
-        run_process(cmd)
+        self._extract(None, dest, full_paths, progress_callback)
 
-    def extract(self, filename: str, dest: Path, full_paths: bool = True) -> None:
+    def extract(
+        self,
+        filename: str,
+        dest: Path,
+        full_paths: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> None:
         """
         Extracts a single file.
 
@@ -81,26 +168,22 @@ class Archive(ABC):
             dest (Path): Folder to extract file to.
             full_paths (bool, optional):
                 Toggles whether path within archives is retained. Defaults to True.
+            progress_callback (Optional[ProgressCallback], optional):
+                Optional function or method to call with a ProgressUpdate of the
+                extracted bytes. Defaults to None.
 
         Raises:
             RuntimeError: When the 7-zip commandline returns a non-zero exit code.
         """
 
-        cmd: list[str] = [
-            str(Archive._bin_path),
-            "x" if full_paths else "e",
-            f"-o{dest}",
-            "-aoa",
-            "-y",
-            "--",
-            str(self.path),
-            filename,
-        ]
-
-        run_process(cmd)
+        self._extract([filename], dest, full_paths, progress_callback)
 
     def extract_files(
-        self, filenames: list[str], dest: Path, full_paths: bool = True
+        self,
+        filenames: list[str],
+        dest: Path,
+        full_paths: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> None:
         """
         Extracts multiple files.
@@ -110,6 +193,9 @@ class Archive(ABC):
             dest (Path): Folder to extract files to.
             full_paths (bool, optional):
                 Toggles whether paths within archive are retained. Defaults to True.
+            progress_callback (Optional[ProgressCallback], optional):
+                Optional function or method to call with a ProgressUpdate of the
+                extracted bytes. Defaults to None.
 
         Raises:
             RuntimeError: When the 7-zip commandline returns a non-zero exit code.
@@ -118,8 +204,119 @@ class Archive(ABC):
         if not len(filenames):
             return
 
+        self._extract(filenames, dest, full_paths, progress_callback)
+
+    def _extract(
+        self,
+        filenames: Optional[list[str]],
+        dest: Path,
+        full_paths: bool,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        try:
+            self._extract_in_process(filenames, dest, full_paths, progress_callback)
+            return
+        except NotImplementedError:
+            pass
+        except Exception as ex:
+            self.log.warning(
+                f"Failed to extract {self.path.name!r} in-process, "
+                f"falling back to 7-zip: {ex}"
+            )
+
+        self._extract_with_7zip(filenames, dest, full_paths)
+
+    def _extract_in_process(
+        self,
+        filenames: Optional[list[str]],
+        dest: Path,
+        full_paths: bool,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        """
+        Extracts files without the 7-zip commandline. The files are grouped by the
+        blocks of the archive index and the groups are extracted in parallel.
+
+        Args:
+            filenames (Optional[list[str]]):
+                List of filenames to extract or None to extract all files.
+            dest (Path): Folder to extract files to.
+            full_paths (bool): Toggles whether paths within archive are retained.
+            progress_callback (Optional[ProgressCallback]): Progress callback.
+
+        Raises:
+            NotImplementedError: When the archive type is not supported.
+        """
+
+        index: ArchiveIndex = self.index
+        entries: list[ArchiveEntry] = index.get_entries(filenames)
+
+        destinations: dict[str, Path] = {
+            entry.filename: Archive._get_destination(entry.filename, dest, full_paths)
+            for entry in entries
+        }
+        progress = ExtractionProgress(
+            sum(entry.size for entry in entries), progress_callback
+        )
+
+        groups: list[list[list[ArchiveEntry]]] = Archive._split_tasks(
+            [
+                (block, sum(entry.size for entry in block))
+                for block in index.get_blocks(entries)
+            ],
+            Archive.MAX_WORKERS,
+        )
+        Archive._run_parallel(
+            [
+                lambda group=group: self._extract_entries(
+                    [entry for block in group for entry in block],
+                    destinations,
+                    progress,
+                )
+                for group in groups
+            ],
+            progress,
+        )
+
+    def _extract_entries(
+        self,
+        entries: list[ArchiveEntry],
+        destinations: dict[str, Path],
+        progress: ExtractionProgress,
+    ) -> None:
+        """
+        Extracts files in a worker thread. Every call has to open its own handle of
+        the archive.
+
+        Args:
+            entries (list[ArchiveEntry]): The files to extract, in archive order.
+            destinations (dict[str, Path]): Map of filenames to destination paths.
+            progress (ExtractionProgress): The progress of the extraction.
+
+        Raises:
+            NotImplementedError: When the archive type is not supported.
+        """
+
+        raise NotImplementedError
+
+    def _extract_with_7zip(
+        self, filenames: Optional[list[str]], dest: Path, full_paths: bool
+    ) -> None:
+        """
+        Extracts files with the 7-zip commandline.
+
+        Args:
+            filenames (Optional[list[str]]):
+                List of filenames to extract or None to extract all files.
+            dest (Path): Folder to extract files to.
+            full_paths (bool): Toggles whether paths within archive are retained.
+
+        Raises:
+            RuntimeError: When the 7-zip commandline returns a non-zero exit code.
+        """
+
         cmd: list[str] = [
-            str(Archive._bin_path),
+            Archive.get_bin_path(),
             "x" if full_paths else "e",
             f"-o{dest}",
             "-aoa",
@@ -127,17 +324,139 @@ class Archive(ABC):
             str(self.path),
         ]
 
+        if filenames is None:
+            run_process(cmd)
+            return
+
         # Write filenames to a txt file to workaround commandline length limit
-        filenames_txt = self.path.with_suffix(".txt")
-        with open(filenames_txt, "w", encoding="utf8") as file:
-            file.write("\n".join(filenames))
-        cmd.append(f"@{filenames_txt}")
+        with tempfile.TemporaryDirectory(prefix="MMM_") as tmp_dir:
+            filenames_txt = Path(tmp_dir) / "filenames.txt"
+            filenames_txt.write_text("\n".join(filenames), encoding="utf8")
+            cmd.append(f"@{filenames_txt}")
 
-        try:
             run_process(cmd)
-        except RuntimeError:
-            os.remove(filenames_txt)
-            raise
+
+    @staticmethod
+    def get_bin_path() -> str:
+        """
+        Returns the path to the 7-zip commandline, either the bundled one or one
+        from the PATH.
+
+        Raises:
+            FileNotFoundError: When no 7-zip commandline is found.
+
+        Returns:
+            str: Path to the 7-zip commandline.
+        """
+
+        if Archive._bin_path.is_file():
+            return str(Archive._bin_path)
+
+        for name in ["7z", "7zz", "7za"]:
+            bin_path: Optional[str] = shutil.which(name)
+            if bin_path is not None:
+                return bin_path
+
+        raise FileNotFoundError("7-zip commandline not found!")
+
+    @staticmethod
+    def _get_destination(filename: str, dest: Path, full_paths: bool) -> Path:
+        """
+        Returns the destination path of a file in an archive.
+
+        Args:
+            filename (str): The filename within the archive.
+            dest (Path): Folder to extract the file to.
+            full_paths (bool): Toggles whether paths within archive are retained.
+
+        Raises:
+            ValueError: When the destination path would be outside the folder.
+
+        Returns:
+            Path: The destination path.
+        """
+
+        path = PurePosixPath(filename.replace("\\", "/"))
+        parts: tuple[str, ...] = path.parts if full_paths else path.parts[-1:]
+
+        if (
+            not parts
+            or path.is_absolute()
+            or any(part == ".." or ":" in part for part in parts)
+        ):
+            raise ValueError(f"Invalid path in archive: {filename!r}")
+
+        return dest.joinpath(*parts)
+
+    @staticmethod
+    def _extract_stream(
+        stream: IO[bytes], dst_path: Path, progress: ExtractionProgress
+    ) -> None:
+        """
+        Writes a file from an archive to its destination path.
+
+        Args:
+            stream (IO[bytes]): The opened file in the archive.
+            dst_path (Path): The destination path.
+            progress (ExtractionProgress): The progress of the extraction.
+        """
+
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        with dst_path.open("wb") as dst_file:
+            while data := stream.read(Archive.CHUNK_SIZE):
+                dst_file.write(data)
+                progress.add(len(data))
+
+    @staticmethod
+    def _run_parallel(
+        tasks: list[Callable[[], None]], progress: ExtractionProgress
+    ) -> None:
+        """
+        Runs extraction tasks in parallel and reports their progress from the
+        calling thread.
+
+        Args:
+            tasks (list[Callable[[], None]]): The tasks to run.
+            progress (ExtractionProgress): The progress of the tasks.
+        """
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(tasks), Archive.MAX_WORKERS)),
+            thread_name_prefix="Archiver",
+        ) as executor:
+            futures: list[Future[None]] = [executor.submit(task) for task in tasks]
+
+            pending: set[Future[None]] = set(futures)
+            while pending:
+                progress.report()
+                pending = wait(pending, timeout=Archive.PROGRESS_INTERVAL).not_done
+
+            for future in futures:
+                future.result()
+
+        progress.report()
+
+    @staticmethod
+    def _split_tasks[T](items: list[tuple[T, int]], count: int) -> list[list[T]]:
+        """
+        Splits items into groups of about the same total size.
+
+        Args:
+            items (list[tuple[T, int]]): Items and their sizes.
+            count (int): Maximum number of groups.
+
+        Returns:
+            list[list[T]]: Non-empty groups of items.
+        """
+
+        groups: list[list[T]] = [[] for _ in range(max(1, count))]
+        group_sizes: list[int] = [0] * len(groups)
+        for item, size in sorted(items, key=lambda i: i[1], reverse=True):
+            g: int = group_sizes.index(min(group_sizes))
+            groups[g].append(item)
+            group_sizes[g] += size
+
+        return [group for group in groups if group]
 
     def glob(self, pattern: str) -> list[str]:
         """
@@ -150,13 +469,7 @@ class Archive(ABC):
             list: List of matching filenames.
         """
 
-        # Workaround case-sensitivity
-        files: dict[str, str] = {file.lower(): file for file in self.files}
-
-        fs: InMemoryPath = InMemoryPath.from_list(list(files.keys()))
-        matches: list[str] = [files[p.path] for p in glob(fs, pattern)]
-
-        return matches
+        return self.index.glob(pattern)
 
     @staticmethod
     def load_archive(archive_path: Path) -> "Archive":
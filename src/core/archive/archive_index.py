@@ -0,0 +1,197 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from virtual_glob import InMemoryPath, glob
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """
+    Class for the metadata of a single file in an archive.
+    """
+
+    filename: str
+    """The filename, relative to archive root."""
+
+    size: int
+    """The uncompressed size in bytes."""
+
+    compressed_size: int
+    """The compressed size in bytes (0 if it is part of a solid block)."""
+
+    crc: Optional[int]
+    """The CRC32 of the file, if known."""
+
+    block: Optional[int]
+    """
+    The solid block the file is stored in, if any. Files in the same block can only
+    be decompressed together.
+    """
+
+
+class ArchiveIndex:
+    """
+    Class for the metadata of all files in an archive, which is read once and shared
+    between all `Archive` instances of the same unchanged file.
+    """
+
+    log: logging.Logger = logging.getLogger("ArchiveIndex")
+
+    MAX_CACHED: int = 64
+    """Maximum number of indexes that are kept in the cache."""
+
+    entries: list[ArchiveEntry]
+    """The files in the archive."""
+
+    solid: bool
+    """Whether the files in the archive can only be decompressed in order."""
+
+    __entries_by_name: dict[str, ArchiveEntry]
+    __lower_names: dict[str, str]
+    __tree: Optional[InMemoryPath]
+
+    __cache: OrderedDict[tuple[str, int, int], "ArchiveIndex"] = OrderedDict()
+    __cache_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, entries: list[ArchiveEntry], solid: bool = False) -> None:
+        """
+        Args:
+            entries (list[ArchiveEntry]): The files in the archive.
+            solid (bool, optional):
+                Whether the files in the archive can only be decompressed in order.
+                Defaults to False.
+        """
+
+        self.entries = entries
+        self.solid = solid
+        self.__entries_by_name = {entry.filename: entry for entry in entries}
+        self.__lower_names = {
+            entry.filename.lower(): entry.filename for entry in entries
+        }
+        self.__tree = None
+
+    @property
+    def files(self) -> list[str]:
+        """
+        List of filenames, relative to archive root.
+        """
+
+        return list(self.__entries_by_name)
+
+    def get_entries(self, filenames: Optional[list[str]] = None) -> list[ArchiveEntry]:
+        """
+        Args:
+            filenames (Optional[list[str]], optional):
+                Filenames to get the entries of or None to get all entries. Unknown
+                filenames are ignored. Defaults to None.
+
+        Returns:
+            list[ArchiveEntry]: The entries in archive order.
+        """
+
+        if filenames is None:
+            return self.entries
+
+        selected: set[str] = set(filenames)
+        return [entry for entry in self.entries if entry.filename in selected]
+
+    def get_blocks(self, entries: list[ArchiveEntry]) -> list[list[ArchiveEntry]]:
+        """
+        Groups entries by the blocks they have to be decompressed in. Entries that
+        are not in a solid block get their own group.
+
+        Args:
+            entries (list[ArchiveEntry]): The entries to group.
+
+        Returns:
+            list[list[ArchiveEntry]]: The groups.
+        """
+
+        if self.solid:
+            return [entries] if entries else []
+
+        blocks: dict[int, list[ArchiveEntry]] = {}
+        groups: list[list[ArchiveEntry]] = []
+        for entry in entries:
+            if entry.block is None:
+                groups.append([entry])
+            elif entry.block in blocks:
+                blocks[entry.block].append(entry)
+            else:
+                blocks[entry.block] = [entry]
+                groups.append(blocks[entry.block])
+
+        return groups
+
+    def glob(self, pattern: str) -> list[str]:
+        """
+        Gets a list of file paths that match a specified pattern, ignoring case.
+
+        Args:
+            pattern (str): Pattern that matches everything that fnmatch supports
+
+        Returns:
+            list: List of matching filenames.
+        """
+
+        if self.__tree is None:
+            self.__tree = InMemoryPath.from_list(list(self.__lower_names))
+
+        return [self.__lower_names[p.path] for p in glob(self.__tree, pattern.lower())]
+
+    @staticmethod
+    def get(path: Path, reader: Callable[[], "ArchiveIndex"]) -> "ArchiveIndex":
+        """
+        Returns the cached index of an archive or reads it if the archive is not
+        cached or was modified.
+
+        Args:
+            path (Path): The path to the archive.
+            reader (Callable[[], ArchiveIndex]): Function that reads the index.
+
+        Returns:
+            ArchiveIndex: The index of the archive.
+        """
+
+        stat: os.stat_result = path.stat()
+        key: tuple[str, int, int] = (
+            os.path.normcase(path.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+
+        with ArchiveIndex.__cache_lock:
+            index: Optional[ArchiveIndex] = ArchiveIndex.__cache.get(key)
+            if index is not None:
+                ArchiveIndex.__cache.move_to_end(key)
+                return index
+
+        index = reader()
+        ArchiveIndex.log.debug(
+            f"Indexed {len(index.entries)} file(s) in {str(path)!r}."
+        )
+
+        with ArchiveIndex.__cache_lock:
+            ArchiveIndex.__cache[key] = index
+            while len(ArchiveIndex.__cache) > ArchiveIndex.MAX_CACHED:
+                ArchiveIndex.__cache.popitem(last=False)
+
+        return index
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Removes all indexes from the cache.
+        """
+
+        with ArchiveIndex.__cache_lock:
+            ArchiveIndex.__cache.clear()
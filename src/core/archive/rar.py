@@ -2,28 +2,80 @@
 Copyright (c) Cutleast
 """
 
-from typing import override
+from pathlib import Path
+from typing import Optional, override
 
 import rarfile
 
-from .archive import Archive
+from core.utilities.progress_update import ProgressCallback
+
+from .archive import Archive, ExtractionProgress
+from .archive_index import ArchiveEntry, ArchiveIndex
 
 
 class RARArchive(Archive):
     """
     Class for RAR Archives.
+
+    Only stored (uncompressed) files of non-solid archives are extracted in-process.
+    `rarfile` starts a separate unrar process for every compressed file, which has
+    to decompress a solid archive from its start each time, so those archives are
+    extracted with a single call of the 7-zip commandline instead.
     """
 
-    __files: list[str] | None = None
+    @override
+    def _read_index(self) -> ArchiveIndex:
+        with rarfile.RarFile(self.path) as archive:
+            return ArchiveIndex(
+                [
+                    ArchiveEntry(
+                        filename=entry.filename,
+                        size=entry.file_size,
+                        compressed_size=entry.compress_size,
+                        crc=entry.CRC,
+                        block=None,
+                    )
+                    for entry in archive.infolist()
+                    if entry.is_file()
+                ],
+                solid=archive.is_solid(),
+            )
+
+    @override
+    def _extract_in_process(
+        self,
+        filenames: Optional[list[str]],
+        dest: Path,
+        full_paths: bool,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        if self.index.solid:
+            raise NotImplementedError
+
+        requested_files: Optional[set[str]] = (
+            set(filenames) if filenames is not None else None
+        )
+        with rarfile.RarFile(self.path) as archive:
+            for entry in archive.infolist():
+                if (
+                    entry.is_file()
+                    and (requested_files is None or entry.filename in requested_files)
+                    and entry.compress_type != rarfile.RAR_M0
+                ):
+                    raise NotImplementedError
+
+        super()._extract_in_process(filenames, dest, full_paths, progress_callback)
 
-    @property
     @override
-    def files(self) -> list[str]:
-        if self.__files is None:
-            self.__files = [
-                file.filename
-                for file in rarfile.RarFile(self.path).infolist()
-                if file.is_file()
-            ]
-
-        return self.__files
+    def _extract_entries(
+        self,
+        entries: list[ArchiveEntry],
+        destinations: dict[str, Path],
+        progress: ExtractionProgress,
+    ) -> None:
+        with rarfile.RarFile(self.path) as archive:
+            for entry in entries:
+                with archive.open(entry.filename) as stream:
+                    Archive._extract_stream(
+                        stream, destinations[entry.filename], progress
+                    )
@@ -2,11 +2,14 @@
 Copyright (c) Cutleast
 """
 
-from typing import override
+from pathlib import Path
+from typing import IO, Optional, override
 
 import py7zr
+from py7zr.io import Py7zIO, WriterFactory
 
-from .archive import Archive
+from .archive import Archive, ExtractionProgress
+from .archive_index import ArchiveEntry, ArchiveIndex
 
 
 class SevenZipArchive(Archive):
@@ -14,16 +17,125 @@ class SevenZipArchive(Archive):
     Class for 7z Archives.
     """
 
-    __files: list[str] | None = None
+    @override
+    def _read_index(self) -> ArchiveIndex:
+        entries: list[ArchiveEntry] = []
+
+        # Files in the same (solid) folder can only be decompressed together
+        blocks: dict[int, int] = {}
+
+        with py7zr.SevenZipFile(self.path) as archive:
+            for file in archive.files:
+                if file.is_directory or file.is_symlink:
+                    continue
+
+                block: Optional[int] = None
+                if file.folder is not None:
+                    block = blocks.setdefault(id(file.folder), len(blocks))
+
+                entries.append(
+                    ArchiveEntry(
+                        filename=file.filename,
+                        size=file.uncompressed,
+                        compressed_size=file.compressed or 0,
+                        crc=file.crc32,
+                        block=block,
+                    )
+                )
+
+        return ArchiveIndex(entries)
 
-    @property
     @override
-    def files(self) -> list[str]:
-        if self.__files is None:
-            self.__files = [
-                file.filename
-                for file in py7zr.SevenZipFile(self.path).files
-                if not file.is_directory
-            ]
+    def _extract_entries(
+        self,
+        entries: list[ArchiveEntry],
+        destinations: dict[str, Path],
+        progress: ExtractionProgress,
+    ) -> None:
+        factory = _FileWriterFactory(destinations, progress)
+
+        try:
+            with py7zr.SevenZipFile(self.path) as archive:
+                archive.extract(
+                    targets=[entry.filename for entry in entries], factory=factory
+                )
+        finally:
+            factory.close()
+
+
+class _FileWriterFactory(WriterFactory):
+    """
+    Factory that lets py7zr write the extracted files directly to their destination
+    paths.
+    """
+
+    __destinations: dict[str, Path]
+    __progress: ExtractionProgress
+    __writers: list["_FileWriter"]
+
+    def __init__(
+        self, destinations: dict[str, Path], progress: ExtractionProgress
+    ) -> None:
+        self.__destinations = destinations
+        self.__progress = progress
+        self.__writers = []
+
+    @override
+    def create(self, filename: str) -> Py7zIO:
+        writer = _FileWriter(self.__destinations[filename], self.__progress)
+        self.__writers.append(writer)
+
+        return writer
+
+    def close(self) -> None:
+        """
+        Closes all created writers.
+        """
+
+        for writer in self.__writers:
+            writer.close()
+
 
-        return self.__files
+class _FileWriter(Py7zIO):
+    """
+    Writer for a single extracted file.
+    """
+
+    __progress: ExtractionProgress
+    __size: int
+    __file: IO[bytes]
+
+    def __init__(self, path: Path, progress: ExtractionProgress) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.__progress = progress
+        self.__size = 0
+        self.__file = path.open("w+b")
+
+    @override
+    def write(self, s: bytes | bytearray) -> int:
+        written: int = self.__file.write(s)
+        self.__size += written
+        self.__progress.add(written)
+
+        return written
+
+    @override
+    def read(self, size: int | None = None) -> bytes:
+        return self.__file.read(size)
+
+    @override
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self.__file.seek(offset, whence)
+
+    @override
+    def flush(self) -> None:
+        self.__file.flush()
+
+    @override
+    def size(self) -> int:
+        return self.__size
+
+    @override
+    def close(self) -> None:
+        self.__file.close()
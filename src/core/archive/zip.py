@@ -3,9 +3,11 @@ Copyright (c) Cutleast
 """
 
 import zipfile
+from pathlib import Path
 from typing import override
 
-from .archive import Archive
+from .archive import Archive, ExtractionProgress
+from .archive_index import ArchiveEntry, ArchiveIndex
 
 
 class ZIPARchive(Archive):
@@ -13,16 +15,33 @@ class ZIPARchive(Archive):
     Class for ZIP Archives.
     """
 
-    __files: list[str] | None = None
-
-    @property
     @override
-    def files(self) -> list[str]:
-        if self.__files is None:
-            self.__files = [
-                file.filename
-                for file in zipfile.ZipFile(self.path).filelist
-                if not file.is_dir()
-            ]
+    def _read_index(self) -> ArchiveIndex:
+        with zipfile.ZipFile(self.path) as archive:
+            return ArchiveIndex(
+                [
+                    ArchiveEntry(
+                        filename=entry.filename,
+                        size=entry.file_size,
+                        compressed_size=entry.compress_size,
+                        crc=entry.CRC,
+                        block=None,
+                    )
+                    for entry in archive.infolist()
+                    if not entry.is_dir()
+                ]
+            )
 
-        return self.__files
+    @override
+    def _extract_entries(
+        self,
+        entries: list[ArchiveEntry],
+        destinations: dict[str, Path],
+        progress: ExtractionProgress,
+    ) -> None:
+        with zipfile.ZipFile(self.path) as archive:
+            for entry in entries:
+                with archive.open(entry.filename) as stream:
+                    Archive._extract_stream(
+                        stream, destinations[entry.filename], progress
+                    )
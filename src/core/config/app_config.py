@@ -39,6 +39,15 @@ class AppConfig(BaseConfig):
     )
     """Log file name"""
 
+    log_trace: Annotated[bool, Field(alias="log.trace")] = False
+    """Record a performance trace of loading and migrating instances"""
+
+    log_transfer_summary: Annotated[bool, Field(alias="log.transfer_summary")] = True
+    """Log only one summary line per mod instead of every migrated file"""
+
+    log_transfer_details: Annotated[bool, Field(alias="log.transfer_details")] = False
+    """Write every migrated file to a compressed file next to the log file"""
+
     language: Language = Language.System
     """App language"""
 
@@ -54,6 +63,9 @@ class AppConfig(BaseConfig):
     activate_new_instance: bool = True
     """Activate the migrated instance (if supported by the mod manager)"""
 
+    verify_migrated_files: bool = True
+    """Verify the migrated mod files against their source files after the migration"""
+
     modname_limit: Annotated[int, Field(ge=-1, le=255)] = 100
     """
     Character limit for mod names
@@ -4,6 +4,7 @@ Copyright (c) Cutleast
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
@@ -88,6 +89,12 @@ class Mod:
     Each file is handled separately and has no impact on the loadorder.
     """
 
+    archive_path: Optional[Path] = None
+    """
+    Path to the downloaded archive the mod was installed from
+    or `None` if it is unknown or doesn't exist anymore.
+    """
+
     @property
     def files(self) -> list[Path]:
         """
@@ -96,10 +103,51 @@ class Mod:
 
         return Mod.__get_files(self.path)
 
+    @property
+    def file_sizes(self) -> dict[Path, int]:
+        """
+        Map of files and their sizes in bytes.
+        """
+
+        return Mod.__scan_files(self.path)
+
     @staticmethod
     @cache
     def __get_files(path: Path) -> list[Path]:
-        return [file.relative_to(path) for file in path.rglob("*") if file.is_file()]
+        return list(Mod.__scan_files(path))
+
+    @staticmethod
+    @cache
+    def __scan_files(path: Path) -> dict[Path, int]:
+        """
+        Recursively scans the specified folder and collects the sizes of all files
+        from the directory listings, without additional stat calls on Windows.
+
+        Args:
+            path (Path): Folder to scan.
+
+        Returns:
+            dict[Path, int]: Map of relative file paths and their sizes, sorted by name.
+        """
+
+        file_sizes: dict[Path, int] = {}
+
+        def scan(folder: Path, relative_folder: Path) -> None:
+            try:
+                with os.scandir(folder) as it:
+                    entries: list[os.DirEntry[str]] = sorted(it, key=lambda e: e.name)
+            except (FileNotFoundError, NotADirectoryError):
+                return
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    scan(folder / entry.name, relative_folder / entry.name)
+                elif entry.is_file():
+                    file_sizes[relative_folder / entry.name] = entry.stat().st_size
+
+        scan(path, Path())
+
+        return file_sizes
 
     @staticmethod
     def copy(mod: Mod) -> Mod:
@@ -124,6 +172,7 @@ class Mod:
             mod_type=mod.mod_type,
             mod_conflicts=mod.mod_conflicts,
             file_conflicts=mod.file_conflicts,
+            archive_path=mod.archive_path,
         )
 
     @property
@@ -137,7 +186,7 @@ class Mod:
     @staticmethod
     @cache
     def __get_size(path: Path) -> int:
-        return sum((path / file).stat().st_size for file in Mod.__get_files(path))
+        return sum(Mod.__scan_files(path).values())
 
     @cache
     def get_modpage_url(self, direct: bool = False) -> Optional[str]:
@@ -0,0 +1,68 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import override
+
+from PySide6.QtWidgets import QApplication
+
+from core.utilities.exceptions import ExceptionBase
+
+
+class VerificationError(ExceptionBase):
+    """
+    Exception for general verification errors of migrated files.
+    """
+
+    @override
+    def getLocalizedMessage(self) -> str:
+        return QApplication.translate(
+            "exceptions", "The migrated file could not be verified!"
+        )
+
+
+class FileMissingError(VerificationError):
+    """
+    Exception when a migrated file does not exist at its destination.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+
+    @override
+    def getLocalizedMessage(self) -> str:
+        return QApplication.translate(
+            "exceptions", "The migrated file {0} does not exist!"
+        )
+
+
+class FileSizeMismatchError(VerificationError):
+    """
+    Exception when a migrated file has a different size than its source file.
+    """
+
+    def __init__(self, path: str, expected_size: str, actual_size: str) -> None:
+        super().__init__(path, expected_size, actual_size)
+
+    @override
+    def getLocalizedMessage(self) -> str:
+        return QApplication.translate(
+            "exceptions",
+            "The migrated file {0} has a size of {2} but {1} were expected!",
+        )
+
+
+class FileChecksumMismatchError(VerificationError):
+    """
+    Exception when the content of a migrated file differs from its source file.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+
+    @override
+    def getLocalizedMessage(self) -> str:
+        return QApplication.translate(
+            "exceptions",
+            "The content of the migrated file {0} differs from its source!",
+        )
@@ -2,17 +2,88 @@
 Copyright (c) Cutleast
 """
 
-from typing import Optional
+import fnmatch
+import re
+from typing import Container, Iterable, Optional, override
 
 from core.utilities.qt_res_provider import read_resource
 
 
+class FileBlacklistMatcher(Container[str]):
+    """
+    Class for checking file names against a blacklist, ignoring case.
+
+    Plain file names are looked up in a set. Entries with glob wildcards, like
+    `*.bak` or `thumbs*.db`, are compiled into a single regular expression and its
+    results are cached per file name.
+    """
+
+    WILDCARDS: str = "*?["
+    """Characters that mark an entry as glob pattern."""
+
+    names: frozenset[str]
+    """The lowercase plain file names."""
+
+    patterns: list[str]
+    """The lowercase glob patterns."""
+
+    __regex: Optional[re.Pattern[str]]
+    __results: dict[str, bool]
+
+    def __init__(self, entries: Iterable[str]) -> None:
+        """
+        Args:
+            entries (Iterable[str]): File names and glob patterns. Empty lines are
+                ignored.
+        """
+
+        names: set[str] = set()
+        self.patterns = []
+        for entry in entries:
+            entry = entry.strip().lower()
+
+            if not entry:
+                continue
+            elif any(c in entry for c in FileBlacklistMatcher.WILDCARDS):
+                self.patterns.append(entry)
+            else:
+                names.add(entry)
+
+        self.names = frozenset(names)
+        self.__regex = None
+        if self.patterns:
+            self.__regex = re.compile(
+                "|".join(f"(?:{fnmatch.translate(p)})" for p in self.patterns),
+                re.DOTALL,
+            )
+        self.__results = {}
+
+    @override
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+
+        name = name.lower()
+        if name in self.names:
+            return True
+        elif self.__regex is None:
+            return False
+
+        result: Optional[bool] = self.__results.get(name)
+        if result is None:
+            result = self.__regex.match(name) is not None
+            self.__results[name] = result
+
+        return result
+
+
 class FileBlacklist:
     """
     Class that holds a list of files that should not be migrated.
     """
 
     _files: Optional[list[str]] = None
+    _matcher: Optional[FileBlacklistMatcher] = None
 
     @classmethod
     def get_files(cls) -> list[str]:
@@ -28,3 +99,18 @@ class FileBlacklist:
             cls._files = read_resource(":/blacklist").splitlines()
 
         return cls._files
+
+    @classmethod
+    def get_matcher(cls) -> FileBlacklistMatcher:
+        """
+        Gets a matcher for the files that should not be migrated, which is built once
+        from `FileBlacklist.get_files()`.
+
+        Returns:
+            FileBlacklistMatcher: The matcher for the blacklisted file names.
+        """
+
+        if cls._matcher is None:
+            cls._matcher = FileBlacklistMatcher(cls.get_files())
+
+        return cls._matcher
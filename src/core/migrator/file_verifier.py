@@ -0,0 +1,181 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import hashlib
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Optional
+
+from core.utilities.progress_update import (
+    ProgressCallback,
+    ProgressUpdate,
+    safe_run_callback,
+)
+from core.utilities.scale import scale_value
+
+from .exceptions import (
+    FileChecksumMismatchError,
+    FileMissingError,
+    FileSizeMismatchError,
+)
+
+
+class FileVerifier:
+    """
+    Class for verifying migrated files against their source files.
+
+    The files are compared by their size and, if they are not hardlinked, by a
+    checksum of their content. The checks run in a thread pool with a limited number
+    of pending files and a fixed chunk size per worker to keep the memory usage
+    bounded, even for very large modlists.
+    """
+
+    log: logging.Logger = logging.getLogger("FileVerifier")
+
+    CHUNK_SIZE: int = 1024 * 1024  # 1 MiB
+    """Number of bytes that are read at once when calculating a checksum."""
+
+    __max_workers: int
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Args:
+            max_workers (Optional[int], optional):
+                Maximum number of worker threads. Defaults to the number of CPUs
+                (max. 8).
+        """
+
+        self.__max_workers = max_workers or min(8, os.cpu_count() or 1)
+
+    def verify(
+        self,
+        files: dict[Path, Path],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> dict[Path, Exception]:
+        """
+        Verifies the specified files in parallel.
+
+        Args:
+            files (dict[Path, Path]): Map of source file paths to destination paths.
+            progress_callback (Optional[ProgressCallback], optional):
+                Progress callback. Defaults to None.
+
+        Returns:
+            dict[Path, Exception]:
+                Map of destination paths that failed the verification and their
+                exceptions.
+        """
+
+        self.log.info(f"Verifying {len(files)} file(s)...")
+
+        failed_files: dict[Path, Exception] = {}
+        max_pending: int = self.__max_workers * 4
+        pending: dict[Future[bool], Path] = {}
+        hashed_files: int = 0
+        done: int = 0
+
+        def process(finished: set[Future[bool]]) -> None:
+            nonlocal hashed_files, done
+
+            for future in finished:
+                dst_path: Path = pending.pop(future)
+                done += 1
+
+                ex: Optional[BaseException] = future.exception()
+                if isinstance(ex, Exception):
+                    self.log.error(f"Failed to verify file {str(dst_path)!r}: {ex}")
+                    failed_files[dst_path] = ex
+                elif ex is None and future.result():
+                    hashed_files += 1
+
+            safe_run_callback(progress_callback, ProgressUpdate(done, len(files)))
+
+        with ThreadPoolExecutor(
+            self.__max_workers, thread_name_prefix="FileVerifier"
+        ) as executor:
+            for src_path, dst_path in files.items():
+                if len(pending) >= max_pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    process(finished)
+
+                future: Future[bool] = executor.submit(
+                    FileVerifier.verify_file, src_path, dst_path
+                )
+                pending[future] = dst_path
+
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                process(finished)
+
+        self.log.info(
+            f"Verified {len(files)} file(s) ({hashed_files} by checksum), "
+            f"{len(failed_files)} file(s) failed the verification."
+        )
+
+        return failed_files
+
+    @staticmethod
+    def verify_file(src_path: Path, dst_path: Path) -> bool:
+        """
+        Verifies a single file against its source file.
+
+        Args:
+            src_path (Path): Path to the source file.
+            dst_path (Path): Path to the migrated file.
+
+        Raises:
+            FileMissingError: when the migrated file does not exist.
+            FileSizeMismatchError: when the file sizes differ.
+            FileChecksumMismatchError: when the file contents differ.
+
+        Returns:
+            bool: Whether the file contents had to be compared by their checksums.
+        """
+
+        try:
+            dst_stat: os.stat_result = dst_path.stat()
+        except FileNotFoundError as ex:
+            raise FileMissingError(str(dst_path)) from ex
+
+        src_stat: os.stat_result = src_path.stat()
+
+        # Hardlinks share their content with the source file
+        if os.path.samestat(src_stat, dst_stat):
+            return False
+
+        if src_stat.st_size != dst_stat.st_size:
+            raise FileSizeMismatchError(
+                str(dst_path),
+                scale_value(src_stat.st_size),
+                scale_value(dst_stat.st_size),
+            )
+
+        if FileVerifier.get_checksum(src_path) != FileVerifier.get_checksum(dst_path):
+            raise FileChecksumMismatchError(str(dst_path))
+
+        return True
+
+    @staticmethod
+    def get_checksum(path: Path) -> bytes:
+        """
+        Calculates a fast checksum of the specified file by reading it in chunks.
+
+        Args:
+            path (Path): Path to the file.
+
+        Returns:
+            bytes: The checksum of the file.
+        """
+
+        checksum = hashlib.blake2b(digest_size=16)
+        buffer = bytearray(FileVerifier.CHUNK_SIZE)
+        view = memoryview(buffer)
+
+        with path.open("rb", buffering=0) as file:
+            while read_bytes := file.readinto(buffer):
+                checksum.update(view[:read_bytes])
+
+        return checksum.digest()
@@ -3,6 +3,7 @@ Copyright (c) Cutleast
 """
 
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from core.instance.mod import Mod
 from core.instance.tool import Tool
@@ -12,7 +13,7 @@ from core.instance.tool import Tool
 class MigrationReport:
     """
     Class for a migration report.
-    Contains information about the failed mods, tools and other errors.
+    Contains information about the failed mods, tools, files and other errors.
     """
 
     failed_mods: dict[Mod, Exception] = field(default_factory=dict)
@@ -21,6 +22,9 @@ class MigrationReport:
     failed_tools: dict[Tool, Exception] = field(default_factory=dict)
     """Map of failed tools and their exceptions."""
 
+    failed_files: dict[Path, Exception] = field(default_factory=dict)
+    """Map of migrated files that failed the verification and their exceptions."""
+
     other_errors: dict[str, Exception] = field(default_factory=dict)
     """Map of display name of errors and their exceptions."""
 
@@ -28,4 +32,9 @@ class MigrationReport:
     def has_errors(self) -> bool:
         """Whether the report contains errors in any category."""
 
-        return bool(self.failed_mods or self.failed_tools or self.other_errors)
+        return bool(
+            self.failed_mods
+            or self.failed_tools
+            or self.failed_files
+            or self.other_errors
+        )
@@ -4,11 +4,12 @@ Copyright (c) Cutleast
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Container, Optional
 
 from PySide6.QtCore import QObject
 
 from core.instance.instance import Instance
+from core.instance.mod import Mod
 from core.instance.tool import Tool
 from core.mod_manager.exceptions import InstanceNotFoundError
 from core.mod_manager.instance_info import InstanceInfo
@@ -16,12 +17,17 @@ from core.mod_manager.mod_manager import ModManager
 from core.utilities.exceptions import NotEnoughSpaceError, SameSourceDestinationError
 from core.utilities.filesystem import get_free_disk_space
 from core.utilities.logger import Logger
+from core.utilities.progress_update import ProgressUpdate
 from core.utilities.scale import scale_value
-from ui.widgets.loading_dialog import LoadingDialog
+from core.utilities.tracer import Tracer
 
-from .file_blacklist import FileBlacklist
+from .file_blacklist import FileBlacklist, FileBlacklistMatcher
+from .file_verifier import FileVerifier
 from .migration_report import MigrationReport
 
+if TYPE_CHECKING:
+    from ui.widgets.loading_dialog import LoadingDialog
+
 
 class Migrator(QObject):
     """
@@ -30,6 +36,7 @@ class Migrator(QObject):
 
     log: logging.Logger = logging.getLogger("Migrator")
 
+    @Tracer.traced("migrate")
     def migrate[S: InstanceInfo, D: InstanceInfo](
         self,
         src_instance: Instance,
@@ -42,7 +49,8 @@ class Migrator(QObject):
         modname_limit: int,
         activate_new_instance: bool,
         included_tools: list[Tool],
-        ldialog: Optional[LoadingDialog] = None,
+        verify_files: bool = False,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> MigrationReport:
         """
         Migrates an instance from one mod manager to another.
@@ -58,6 +66,9 @@ class Migrator(QObject):
             modname_limit (int): A character limit for mod names.
             activate_new_instance (bool): Whether to activate the new instance.
             included_tools (list[Tool]): A list of tools to migrate.
+            verify_files (bool, optional):
+                Whether to verify the migrated mod files against their source files.
+                Defaults to False.
             ldialog (Optional[LoadingDialog], optional):
                 Optional loading dialog. Defaults to None.
 
@@ -100,48 +111,51 @@ class Migrator(QObject):
         self.log.info(f"Separate ini files: {src_instance.separate_ini_files}")
         self.log.info(f"Separate save games: {src_instance.separate_save_games}")
         self.log.info(f"Activate new instance: {activate_new_instance}")
+        self.log.info(f"Verify migrated files: {verify_files}")
 
-        blacklist: list[str] = FileBlacklist.get_files()
-        self.log.info(f"File blacklist: {', '.join(blacklist)}")
+        with Tracer.span("migrate.plan"):
+            blacklist: FileBlacklistMatcher = FileBlacklist.get_matcher()
+            self.log.info(f"File blacklist: {', '.join(FileBlacklist.get_files())}")
 
-        src_drive: str = src_mod_manager.get_mods_path(src_info).drive
-        dst_drive: str = dst_mod_manager.get_mods_path(dst_info).drive
+            src_drive: str = src_mod_manager.get_mods_path(src_info).drive
+            dst_drive: str = dst_mod_manager.get_mods_path(dst_info).drive
 
-        if src_drive != dst_drive or not use_hardlinks:
-            available_space: int = get_free_disk_space(dst_drive)
-            self.log.debug(
-                f"Available space on '{dst_drive}': {scale_value(available_space)}"
-            )
-            if available_space < src_instance.size:
-                raise NotEnoughSpaceError(
-                    dst_drive,
-                    scale_value(src_instance.size),
-                    scale_value(available_space),
+            if src_drive != dst_drive or not use_hardlinks:
+                available_space: int = get_free_disk_space(dst_drive)
+                self.log.debug(
+                    f"Available space on '{dst_drive}': {scale_value(available_space)}"
                 )
+                if available_space < src_instance.size:
+                    raise NotEnoughSpaceError(
+                        dst_drive,
+                        scale_value(src_instance.size),
+                        scale_value(available_space),
+                    )
 
-        dst_mod_manager.prepare_migration(dst_info)
+            dst_mod_manager.prepare_migration(dst_info)
 
-        if ldialog is not None:
-            ldialog.updateProgress(
-                text1=self.tr("Migrating instance {0}...").format(
-                    src_info.display_name
-                ),
-            )
+            if ldialog is not None:
+                ldialog.updateProgress(
+                    text1=self.tr("Migrating instance {0}...").format(
+                        src_info.display_name
+                    ),
+                )
 
-        # Try to load existing instance
-        dst_instance: Instance
-        try:
-            dst_instance = dst_mod_manager.load_instance(
-                dst_info, modname_limit, blacklist, ldialog=ldialog
-            )
-            self.log.warning("Migrating into existing instance...")
-        except InstanceNotFoundError:
-            dst_instance = dst_mod_manager.create_instance(
-                dst_info, src_instance.game_folder, ldialog
-            )
+            # Try to load existing instance
+            dst_instance: Instance
+            try:
+                dst_instance = dst_mod_manager.load_instance(
+                    dst_info, modname_limit, blacklist, ldialog=ldialog
+                )
+                self.log.warning("Migrating into existing instance...")
+            except InstanceNotFoundError:
+                dst_instance = dst_mod_manager.create_instance(
+                    dst_info, src_instance.game_folder, ldialog
+                )
 
-        self.log.info(f"Destination order matters: {dst_instance.order_matters}")
+            self.log.info(f"Destination order matters: {dst_instance.order_matters}")
 
+        installed_mods: list[Mod] = []
         for m, mod in enumerate(src_instance.loadorder):
             if ldialog is not None:
                 ldialog.updateProgress(
@@ -153,90 +167,236 @@ class Migrator(QObject):
                     text2=mod.display_name,
                 )
 
-            try:
-                if not dst_instance.is_mod_installed(mod) or replace:
-                    dst_mod_manager.install_mod(
-                        mod,
+            with Tracer.span("migrate.transfer", mod=mod.display_name):
+                try:
+                    if not dst_instance.is_mod_installed(mod) or replace:
+                        dst_mod_manager.install_mod(
+                            mod,
+                            dst_instance,
+                            dst_info,
+                            src_mod_manager.get_actual_files(mod),
+                            use_hardlinks,
+                            replace,
+                            blacklist,
+                            ldialog,
+                        )
+                        installed_mods.append(mod)
+                    else:
+                        self.log.info(
+                            f"Skipped already installed mod: {mod.display_name!r}"
+                        )
+                except Exception as ex:
+                    self.log.error(
+                        f"Failed to migrate mod {mod.display_name!r}: {ex}", exc_info=ex
+                    )
+                    report.failed_mods[mod] = ex
+
+        with Tracer.span("migrate.tools", tools=len(included_tools)):
+            for t, tool in enumerate(included_tools):
+                if ldialog is not None:
+                    ldialog.updateProgress(
+                        text1=self.tr("Migrating tools...")
+                        + f" ({t}/{len(included_tools)})",
+                        value1=t,
+                        max1=len(included_tools),
+                        show2=True,
+                        text2=tool.display_name,
+                    )
+
+                try:
+                    dst_mod_manager.add_tool(
+                        tool,
                         dst_instance,
                         dst_info,
-                        src_mod_manager.get_actual_files(mod),
                         use_hardlinks,
                         replace,
                         blacklist,
                         ldialog,
                     )
-                else:
-                    self.log.info(
-                        f"Skipped already installed mod: {mod.display_name!r}"
+                except Exception as ex:
+                    self.log.error(
+                        f"Failed to migrate tool {tool.display_name!r}: {ex}",
+                        exc_info=ex,
                     )
-            except Exception as ex:
-                self.log.error(
-                    f"Failed to migrate mod {mod.display_name!r}: {ex}", exc_info=ex
-                )
-                report.failed_mods[mod] = ex
-
-        for t, tool in enumerate(included_tools):
-            if ldialog is not None:
-                ldialog.updateProgress(
-                    text1=self.tr("Migrating tools...")
-                    + f" ({t}/{len(included_tools)})",
-                    value1=t,
-                    max1=len(included_tools),
-                    show2=True,
-                    text2=tool.display_name,
-                )
+                    report.failed_tools[tool] = ex
 
+        with Tracer.span("migrate.ini_files"):
             try:
-                dst_mod_manager.add_tool(
-                    tool,
-                    dst_instance,
+                ini_files: list[Path] = src_mod_manager.get_ini_files(
+                    src_instance, src_info
+                )
+                dst_mod_manager.migrate_ini_files(
+                    ini_files,
                     dst_info,
+                    src_instance.separate_ini_files,
                     use_hardlinks,
                     replace,
-                    blacklist,
                     ldialog,
                 )
             except Exception as ex:
                 self.log.error(
-                    f"Failed to migrate tool {tool.display_name!r}: {ex}", exc_info=ex
+                    f"Failed to migrate ini files from source to destination: {ex}",
+                    exc_info=ex,
                 )
-                report.failed_tools[tool] = ex
+                report.other_errors[self.tr("Failed to migrate INI files.")] = ex
 
-        try:
-            ini_files: list[Path] = src_mod_manager.get_ini_files(
-                src_instance, src_info
-            )
-            dst_mod_manager.migrate_ini_files(
-                ini_files,
+        with Tracer.span("migrate.additional_files"):
+            try:
+                additional_files: list[Path] = src_mod_manager.get_additional_files(
+                    src_info
+                )
+                dst_mod_manager.migrate_additional_files(
+                    additional_files, dst_info, use_hardlinks, replace, ldialog
+                )
+            except Exception as ex:
+                self.log.error(
+                    f"Failed to migrate additional files from source to destination: {ex}",
+                    exc_info=ex,
+                )
+                report.other_errors[self.tr("Failed to migrate additional files.")] = ex
+
+        with Tracer.span("migrate.finalize"):
+            dst_mod_manager.finalize_migration(
+                dst_instance,
                 dst_info,
-                src_instance.separate_ini_files,
-                use_hardlinks,
-                replace,
-                ldialog,
+                src_instance.order_matters,
+                activate_new_instance,
             )
-        except Exception as ex:
-            self.log.error(
-                f"Failed to migrate ini files from source to destination: {ex}",
-                exc_info=ex,
-            )
-            report.other_errors[self.tr("Failed to migrate INI files.")] = ex
 
-        try:
-            additional_files: list[Path] = src_mod_manager.get_additional_files(
-                src_info
-            )
-            dst_mod_manager.migrate_additional_files(
-                additional_files, dst_info, use_hardlinks, replace, ldialog
+        if verify_files:
+            self.verify(
+                src_instance,
+                dst_instance,
+                src_mod_manager,
+                installed_mods,
+                report,
+                ldialog,
             )
-        except Exception as ex:
-            self.log.error(
-                f"Failed to migrate additional files from source to destination: {ex}",
-                exc_info=ex,
+
+        self.log.info("Migration completed.")
+        return report
+
+    def verify[S: InstanceInfo](
+        self,
+        src_instance: Instance,
+        dst_instance: Instance,
+        src_mod_manager: ModManager[S],
+        mods: Optional[list[Mod]] = None,
+        report: Optional[MigrationReport] = None,
+        ldialog: Optional["LoadingDialog"] = None,
+    ) -> MigrationReport:
+        """
+        Verifies the mod files of a migrated instance against the files of its
+        source instance. Can be used standalone on an already migrated instance.
+
+        Args:
+            src_instance (Instance): Source mod instance.
+            dst_instance (Instance): Migrated mod instance.
+            src_mod_manager (ModManager[S]): Source mod manager.
+            mods (Optional[list[Mod]], optional):
+                Mods of the source instance to verify. Defaults to all mods.
+            report (Optional[MigrationReport], optional):
+                Report to add the failed files to. Defaults to a new report.
+            ldialog (Optional[LoadingDialog], optional):
+                Optional loading dialog. Defaults to None.
+
+        Returns:
+            MigrationReport: A report containing the files that failed the verification.
+        """
+
+        if report is None:
+            report = MigrationReport()
+
+        self.log.info(f"Verifying migrated instance {dst_instance.display_name!r}...")
+
+        if ldialog is not None:
+            ldialog.updateProgress(
+                text1=self.tr("Verifying migrated files..."), show2=False, show3=False
             )
-            report.other_errors[self.tr("Failed to migrate additional files.")] = ex
 
-        dst_mod_manager.finalize_migration(
-            dst_instance, dst_info, src_instance.order_matters, activate_new_instance
+        files: dict[Path, Path] = Migrator.get_migrated_files(
+            src_instance,
+            dst_instance,
+            src_mod_manager,
+            FileBlacklist.get_matcher(),
+            [
+                mod
+                for mod in (mods if mods is not None else src_instance.mods)
+                if mod not in report.failed_mods
+            ],
         )
-        self.log.info("Migration completed.")
+
+        def update_progress(update: ProgressUpdate) -> None:
+            if ldialog is not None:
+                ldialog.updateProgress(
+                    text1=self.tr("Verifying migrated files...")
+                    + f" ({update.current}/{update.maximum})",
+                    value1=update.current,
+                    max1=update.maximum,
+                )
+
+        with Tracer.span("migrate.verify", files=len(files)):
+            report.failed_files.update(FileVerifier().verify(files, update_progress))
+
         return report
+
+    @staticmethod
+    def get_migrated_files[S: InstanceInfo](
+        src_instance: Instance,
+        dst_instance: Instance,
+        src_mod_manager: ModManager[S],
+        blacklist: Container[str],
+        mods: Optional[list[Mod]] = None,
+    ) -> dict[Path, Path]:
+        """
+        Maps the files of the specified source mods to their expected paths in the
+        migrated instance. Mods that are not installed in the migrated instance are
+        ignored.
+
+        Args:
+            src_instance (Instance): Source mod instance.
+            dst_instance (Instance): Migrated mod instance.
+            src_mod_manager (ModManager[S]): Source mod manager.
+            blacklist (Container[str]): A list of files that were not migrated.
+            mods (Optional[list[Mod]], optional):
+                Mods of the source instance. Defaults to all mods.
+
+        Returns:
+            dict[Path, Path]: Map of source file paths to migrated file paths.
+        """
+
+        files: dict[Path, Path] = {}
+
+        for mod in mods if mods is not None else src_instance.mods:
+            if not dst_instance.is_mod_installed(mod):
+                Migrator.log.debug(
+                    f"Skipped verification of mod {mod.display_name!r} "
+                    "since it is not installed in the migrated instance."
+                )
+                continue
+
+            dst_folder: Path = dst_instance.get_installed_mod(mod).path
+            file_redirects: dict[Path, Path] = src_mod_manager.get_actual_files(mod)
+            file_conflicts: set[str] = {
+                file.lower() for file in mod.file_conflicts.keys()
+            }
+
+            for file in mod.files:
+                if file.name.lower() in blacklist:
+                    continue
+
+                src_path: Path = mod.path / file
+                dst_file: Path = file_redirects.get(file, file)
+                dst_path: Path = dst_folder / dst_file
+
+                # Files that are overwritten by other mods may have been hidden
+                # by the destination mod manager
+                if str(dst_file).lower() in file_conflicts and not dst_path.is_file():
+                    hidden_path: Path = dst_path.with_name(dst_path.name + ".mohidden")
+                    if hidden_path.is_file():
+                        dst_path = hidden_path
+
+                if src_path != dst_path:
+                    files[src_path] = dst_path
+
+        return files
@@ -0,0 +1,233 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+import zlib
+from pathlib import Path, PurePosixPath
+from typing import Optional
+
+from core.archive.archive import Archive
+from core.archive.archive_index import ArchiveEntry, ArchiveIndex
+from core.instance.mod import Mod
+
+
+class ArchiveInstaller:
+    """
+    Class for deciding whether the files of a mod should be extracted from its
+    downloaded archive instead of being copied from the source instance.
+
+    Copying has to transfer every loose file between the drives while extracting
+    only reads the compressed archive sequentially and creates the files on the
+    destination drive. The faster way is chosen by a simple cost model.
+    """
+
+    log: logging.Logger = logging.getLogger("ArchiveInstaller")
+
+    COPY_THROUGHPUT: float = 100 * 1024 * 1024  # 100 MB/s
+    """Estimated throughput in bytes per second for copying between drives."""
+
+    COPY_FILE_COST: float = 0.005
+    """Estimated overhead in seconds for copying a single file between drives."""
+
+    EXTRACTION_THROUGHPUT: float = 200 * 1024 * 1024  # 200 MB/s
+    """Estimated throughput in bytes per second of the extracted data."""
+
+    EXTRACTION_FILE_COST: float = 0.001
+    """Estimated overhead in seconds for extracting a single file."""
+
+    CHECKSUM_THROUGHPUT: float = 400 * 1024 * 1024  # 400 MB/s
+    """
+    Estimated throughput in bytes per second for reading files to calculate their
+    checksums.
+    """
+
+    CHUNK_SIZE: int = 1024 * 1024  # 1 MB
+    """Size of the chunks in which files are read to calculate their checksums."""
+
+    @staticmethod
+    def get_copy_cost(count: int, size: int) -> float:
+        """
+        Estimates the duration of copying files between drives.
+
+        Args:
+            count (int): The number of files.
+            size (int): The total size of the files in bytes.
+
+        Returns:
+            float: The estimated duration in seconds.
+        """
+
+        return (
+            count * ArchiveInstaller.COPY_FILE_COST
+            + size / ArchiveInstaller.COPY_THROUGHPUT
+        )
+
+    @staticmethod
+    def get_extraction_cost(count: int, size: int, archive_size: int) -> float:
+        """
+        Estimates the duration of extracting files from an archive on another drive,
+        including reading the source files and the extracted files once each to
+        compare their checksums with the archive.
+
+        Args:
+            count (int): The number of files.
+            size (int): The total size of the files in bytes.
+            archive_size (int): The size of the archive in bytes.
+
+        Returns:
+            float: The estimated duration in seconds.
+        """
+
+        return (
+            archive_size / ArchiveInstaller.COPY_THROUGHPUT
+            + count * ArchiveInstaller.EXTRACTION_FILE_COST
+            + size / ArchiveInstaller.EXTRACTION_THROUGHPUT
+            + 2 * size / ArchiveInstaller.CHECKSUM_THROUGHPUT
+        )
+
+    @staticmethod
+    def get_crc(file: Path) -> int:
+        """
+        Calculates the CRC32 checksum of a file.
+
+        Args:
+            file (Path): The file.
+
+        Returns:
+            int: The checksum.
+        """
+
+        crc: int = 0
+        with file.open("rb") as stream:
+            while chunk := stream.read(ArchiveInstaller.CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+
+        return crc
+
+    @staticmethod
+    def match_files(
+        index: ArchiveIndex, files: dict[Path, int]
+    ) -> Optional[dict[Path, ArchiveEntry]]:
+        """
+        Maps files to the entries of an archive with the same path (ignoring case)
+        and size. Entries without a CRC32 checksum don't match since their contents
+        can't be verified (see `ArchiveInstaller.verify_files()`).
+
+        Args:
+            index (ArchiveIndex): The index of the archive.
+            files (dict[Path, int]): Map of files and their sizes in bytes.
+
+        Returns:
+            Optional[dict[Path, ArchiveEntry]]:
+                Map of files and their entries or None if any file doesn't match.
+        """
+
+        entries: dict[str, ArchiveEntry] = {
+            str(PurePosixPath(entry.filename.replace("\\", "/"))).lower(): entry
+            for entry in index.entries
+        }
+
+        matches: dict[Path, ArchiveEntry] = {}
+        for file, size in files.items():
+            entry: Optional[ArchiveEntry] = entries.get(file.as_posix().lower())
+            if entry is None or entry.size != size or entry.crc is None:
+                return None
+
+            matches[file] = entry
+
+        return matches
+
+    @staticmethod
+    def verify_files(matches: dict[Path, ArchiveEntry], source_folder: Path) -> bool:
+        """
+        Checks that files have the same CRC32 checksums as their archive entries.
+        Files that were modified after their installation don't match their entries,
+        even if their size is unchanged.
+
+        Args:
+            matches (dict[Path, ArchiveEntry]): Map of files and their entries.
+            source_folder (Path): The folder the files are relative to.
+
+        Returns:
+            bool: Whether all files match their entries.
+        """
+
+        for file, entry in matches.items():
+            if ArchiveInstaller.get_crc(source_folder / file) != entry.crc:
+                ArchiveInstaller.log.debug(
+                    f"File {str(file)!r} differs from the archive's original."
+                )
+                return False
+
+        return True
+
+    @staticmethod
+    def plan(
+        mod: Mod, files: dict[Path, int]
+    ) -> Optional[tuple[Archive, dict[Path, ArchiveEntry]]]:
+        """
+        Checks whether the specified files of a mod should be extracted from its
+        downloaded archive.
+
+        Args:
+            mod (Mod): The mod.
+            files (dict[Path, int]): Map of files to install and their sizes in bytes.
+
+        Returns:
+            Optional[tuple[Archive, dict[Path, ArchiveEntry]]]:
+                The archive and the entries of the files or None if the files should
+                be copied.
+        """
+
+        if mod.archive_path is None or not files:
+            return None
+
+        try:
+            archive: Archive = Archive.load_archive(mod.archive_path)
+            matches: Optional[dict[Path, ArchiveEntry]] = ArchiveInstaller.match_files(
+                archive.index, files
+            )
+            archive_size: int = mod.archive_path.stat().st_size
+        except Exception as ex:
+            ArchiveInstaller.log.debug(
+                f"Failed to read archive {str(mod.archive_path)!r}: {ex}"
+            )
+            return None
+
+        if matches is None:
+            ArchiveInstaller.log.debug(
+                f"Archive {mod.archive_path.name!r} doesn't match the files of "
+                f"{mod.display_name!r}."
+            )
+            return None
+
+        copy_cost: float = ArchiveInstaller.get_copy_cost(
+            len(files), sum(files.values())
+        )
+        extraction_cost: float = ArchiveInstaller.get_extraction_cost(
+            len(files), sum(files.values()), archive_size
+        )
+        ArchiveInstaller.log.debug(
+            f"Estimated costs for {mod.display_name!r}: copy={copy_cost:.3f}s "
+            f"extraction={extraction_cost:.3f}s"
+        )
+
+        if extraction_cost >= copy_cost:
+            return None
+
+        # The source files are only read if the extraction is actually faster
+        try:
+            if not ArchiveInstaller.verify_files(matches, mod.path):
+                ArchiveInstaller.log.debug(
+                    f"Files of {mod.display_name!r} were modified after their "
+                    "installation."
+                )
+                return None
+        except OSError as ex:
+            ArchiveInstaller.log.debug(
+                f"Failed to verify files of {mod.display_name!r}: {ex}"
+            )
+            return None
+
+        return archive, matches
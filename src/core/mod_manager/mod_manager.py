@@ -7,20 +7,28 @@ import os
 import shutil
 from abc import abstractmethod
 from pathlib import Path
-from typing import Optional, override
+from typing import TYPE_CHECKING, Container, Optional, override
 
 from PySide6.QtCore import QObject
 
+from core.archive.archive import Archive
+from core.archive.archive_index import ArchiveEntry
 from core.game.game import Game
 from core.instance.instance import Instance
 from core.instance.mod import Mod
 from core.instance.tool import Tool
 from core.utilities.logger import Logger
+from core.utilities.progress_update import ProgressUpdate
 from core.utilities.scale import scale_value
-from ui.widgets.loading_dialog import LoadingDialog
+from core.utilities.tracer import Tracer
+from core.utilities.transfer_log import Transfer, TransferLog
 
+from .archive_installer import ArchiveInstaller
 from .instance_info import InstanceInfo
 
+if TYPE_CHECKING:
+    from ui.widgets.loading_dialog import LoadingDialog
+
 
 class ModManager[I: InstanceInfo](QObject):
     """
@@ -80,9 +88,9 @@ class ModManager[I: InstanceInfo](QObject):
         self,
         instance_data: I,
         modname_limit: int,
-        file_blacklist: list[str] = [],
+        file_blacklist: Container[str] = [],
         game_folder: Optional[Path] = None,
-        ldialog: Optional[LoadingDialog] = None,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> Instance:
         """
         Loads and returns the mod instance with the given name.
@@ -90,7 +98,7 @@ class ModManager[I: InstanceInfo](QObject):
         Args:
             instance_data (I): The data of the mod instance.
             modname_limit (int): A character limit for mod names.
-            file_blacklist (list[str], optional): A list of files to ignore.
+            file_blacklist (Container[str], optional): A list of files to ignore.
             game_folder (Optional[Path], optional): The game folder of the instance.
             ldialog (Optional[LoadingDialog], optional):
                 Optional loading dialog. Defaults to None.
@@ -111,8 +119,8 @@ class ModManager[I: InstanceInfo](QObject):
         instance_data: I,
         modname_limit: int,
         game_folder: Path,
-        file_blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        file_blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> list[Mod]:
         """
         Loads and returns a list of mods for the given instance name.
@@ -121,7 +129,7 @@ class ModManager[I: InstanceInfo](QObject):
             instance_data (I): The data of the mod instance.
             modname_limit (int): A character limit for mod names.
             game_folder (Path): The game folder of the instance.
-            file_blacklist (list[str], optional): A list of files to ignore.
+            file_blacklist (Container[str], optional): A list of files to ignore.
             ldialog (Optional[LoadingDialog], optional):
                 Optional loading dialog. Defaults to None.
 
@@ -135,8 +143,8 @@ class ModManager[I: InstanceInfo](QObject):
         instance_data: I,
         mods: list[Mod],
         game_folder: Path,
-        file_blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        file_blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> list[Tool]:
         """
         Loads and returns a list of tools for the given instance.
@@ -145,7 +153,7 @@ class ModManager[I: InstanceInfo](QObject):
             instance_data (I): The data of the mod instance.
             mods (list[Mod]): The list of already loaded mods.
             game_folder (Path): The game folder of the instance.
-            file_blacklist (list[str], optional): A list of files to ignore.
+            file_blacklist (Container[str], optional): A list of files to ignore.
             ldialog (Optional[LoadingDialog], optional):
                 Optional loading dialog. Defaults to None.
 
@@ -174,15 +182,16 @@ class ModManager[I: InstanceInfo](QObject):
 
     @staticmethod
     @Logger.timeit(logger_name="ModManager")
+    @Tracer.traced("load.index")
     def _index_modlist(
-        mods: list[Mod], file_blacklist: list[str]
+        mods: list[Mod], file_blacklist: Container[str]
     ) -> dict[str, list[Mod]]:
         """
         Indexes all mod files and maps each file to a list of mods that contain it.
 
         Args:
             mods (list[Mod]): The list of mods.
-            file_blacklist (list[str], optional): A list of file paths to ignore.
+            file_blacklist (Container[str], optional): A list of file paths to ignore.
 
         Returns:
             dict[str, list[Mod]]: The indexed list of mods.
@@ -241,7 +250,7 @@ class ModManager[I: InstanceInfo](QObject):
         self,
         instance_data: I,
         game_folder: Path,
-        ldialog: Optional[LoadingDialog] = None,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> Instance:
         """
         Creates an instance in this mod manager.
@@ -265,8 +274,8 @@ class ModManager[I: InstanceInfo](QObject):
         file_redirects: dict[Path, Path],
         use_hardlinks: bool,
         replace: bool,
-        blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         """
         Installs a mod to the current instance.
@@ -278,7 +287,7 @@ class ModManager[I: InstanceInfo](QObject):
             file_redirects (dict[Path, Path]): A dict of file redirects.
             use_hardlinks (bool): Whether to use hardlinks if possible.
             replace (bool): Whether to replace existing files.
-            blacklist (list[str], optional): A list of files to not migrate.
+            blacklist (Container[str], optional): A list of files to not migrate.
             ldialog (Optional[LoadingDialog], optional):
                 Optional loading dialog. Defaults to None.
         """
@@ -291,8 +300,8 @@ class ModManager[I: InstanceInfo](QObject):
         instance_data: I,
         use_hardlinks: bool,
         replace: bool,
-        blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         """
         Adds a tool to the mod manager.
@@ -303,7 +312,7 @@ class ModManager[I: InstanceInfo](QObject):
             instance_data (I): The data of the instance above.
             use_hardlinks (bool): Whether to use hardlinks if possible.
             replace (bool): Whether to replace existing files.
-            blacklist (list[str], optional): A list of files to not migrate.
+            blacklist (Container[str], optional): A list of files to not migrate.
             ldialog (Optional[LoadingDialog], optional):
                 Optional loading dialog. Defaults to None.
         """
@@ -315,11 +324,13 @@ class ModManager[I: InstanceInfo](QObject):
         file_redirects: dict[Path, Path],
         use_hardlinks: bool,
         replace: bool,
-        blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         """
-        Migrates the files of a mod to the destination path.
+        Migrates the files of a mod to the destination path. If the destination is on
+        another drive, the files may be extracted from the downloaded archive of the
+        mod instead (see `ArchiveInstaller`).
 
         Args:
             mod (Mod): The mod to migrate.
@@ -327,47 +338,253 @@ class ModManager[I: InstanceInfo](QObject):
             use_hardlinks (bool): Whether to use hardlinks if possible.
             file_redirects (dict[Path, Path]): A dict of file redirects.
             replace (bool): Whether to replace existing files.
-            blacklist (list[str], optional): A list of files to not migrate.
+            blacklist (Container[str], optional): A list of files to not migrate.
             ldialog (Optional[LoadingDialog], optional):
                 Optional loading dialog. Defaults to None.
         """
 
-        for f, file in enumerate(mod.files):
-            if file.name.lower() in blacklist:
-                self.log.info(
-                    f"Skipped file due to configured blacklist: {file.name!r}"
+        with TransferLog.transfer(mod.display_name, self.log) as transfer:
+            files: dict[Path, Path] = {}
+            for file in mod.files:
+                if file.name.lower() in blacklist:
+                    transfer.blacklisted(file)
+                    continue
+
+                src_path: Path = mod.path / file
+                dst_path: Path = mod_folder / file_redirects.get(file, file)
+
+                if src_path == dst_path:
+                    self.log.warning(
+                        f"Skipped file due to same path: {str(src_path)!r}"
+                    )
+                    continue
+
+                files[file] = dst_path
+
+            with Tracer.span("transfer.prepare_folders") as span:
+                folders: set[Path] = {dst_path.parent for dst_path in files.values()}
+                existing_files: set[str] = ModManager._prepare_destination_folders(
+                    folders
+                )
+                span.add("folders", len(folders))
+                span.add("existing_files", len(existing_files))
+
+            file_sizes: dict[Path, int] = mod.file_sizes
+
+            extracted_files: set[Path] = set()
+            if mod.path.drive.lower() != mod_folder.drive.lower():
+                extracted_files = self._extract_mod_files(
+                    mod,
+                    mod_folder,
+                    files,
+                    file_sizes,
+                    existing_files,
+                    transfer,
+                    ldialog,
                 )
-                continue
 
-            src_path: Path = mod.path / file
-            dst_path: Path = mod_folder / file_redirects.get(file, file)
+            with Tracer.span("transfer.files", mod=mod.display_name) as span:
+                for f, (file, dst_path) in enumerate(files.items()):
+                    if file in extracted_files:
+                        continue
+
+                    src_path: Path = mod.path / file
+                    file_size: Optional[int] = file_sizes.get(file)
+
+                    if ldialog:
+                        ldialog.updateProgress(
+                            text2=f"{mod.display_name} ({f}/{len(files)})",
+                            value2=f,
+                            max2=len(files),
+                            show3=True,
+                            text3=(
+                                f"{file.name} ({scale_value(file_size)})"
+                                if file_size is not None
+                                else file.name
+                            ),
+                        )
+
+                    normalized_dst_path: str = os.path.normcase(dst_path)
+                    if normalized_dst_path in existing_files:
+                        if not replace:
+                            transfer.skipped(dst_path, "existing file")
+                            span.add("skipped")
+                            continue
+
+                        dst_path.unlink()
+                        transfer.replaced(dst_path)
+                        span.add("replaced")
+
+                    linked: bool = ModManager._transfer_file(
+                        src_path, dst_path, file_size or 0, use_hardlinks, transfer
+                    )
+                    span.add("linked" if linked else "copied")
+                    span.add("files")
+                    span.add("bytes", file_size or 0)
+                    existing_files.add(normalized_dst_path)
+
+    def _extract_mod_files(
+        self,
+        mod: Mod,
+        mod_folder: Path,
+        files: dict[Path, Path],
+        file_sizes: dict[Path, int],
+        existing_files: set[str],
+        transfer: Transfer,
+        ldialog: Optional["LoadingDialog"] = None,
+    ) -> set[Path]:
+        """
+        Extracts the files of a mod from its downloaded archive if that is estimated
+        to be faster than copying them. Redirected files and files that already
+        exist at their destination are left for the regular transfer.
+
+        Args:
+            mod (Mod): The mod to migrate.
+            mod_folder (Path): The destination path.
+            files (dict[Path, Path]): Map of files and their destination paths.
+            file_sizes (dict[Path, int]): Map of files and their sizes in bytes.
+            existing_files (set[str]):
+                Normalized paths of existing files, extracted files are added.
+            transfer (Transfer): The transfer to record the files in.
+            ldialog (Optional[LoadingDialog], optional):
+                Optional loading dialog. Defaults to None.
 
-            if ldialog:
+        Returns:
+            set[Path]: The successfully extracted files.
+        """
+
+        candidates: dict[Path, int] = {
+            file: file_sizes.get(file, 0)
+            for file, dst_path in files.items()
+            if dst_path == mod_folder / file
+            and os.path.normcase(dst_path) not in existing_files
+        }
+        plan: Optional[tuple[Archive, dict[Path, ArchiveEntry]]] = (
+            ArchiveInstaller.plan(mod, candidates)
+        )
+        if plan is None:
+            return set()
+
+        archive, entries = plan
+        self.log.info(
+            f"Extracting {len(entries)} file(s) of {mod.display_name!r} from "
+            f"{archive.path.name!r}..."
+        )
+
+        def update(progress_update: ProgressUpdate) -> None:
+            if ldialog is not None:
                 ldialog.updateProgress(
-                    text2=f"{mod.display_name} ({f}/{len(mod.files)})",
-                    value2=f,
-                    max2=len(mod.files),
-                    show3=True,
-                    text3=f"{file.name} ({scale_value(src_path.stat().st_size)})",
+                    text2=f"{mod.display_name} ({archive.path.name})",
+                    value2=progress_update.current,
+                    max2=progress_update.maximum,
+                    show3=False,
                 )
 
-            if src_path == dst_path:
-                self.log.warning(f"Skipped file due to same path: {str(src_path)!r}")
-                continue
+        with Tracer.span("transfer.extract", mod=mod.display_name) as span:
+            try:
+                archive.extract_files(
+                    [entry.filename for entry in entries.values()],
+                    mod_folder,
+                    progress_callback=update,
+                )
+            except Exception as ex:
+                self.log.warning(
+                    f"Failed to extract {archive.path.name!r}, copying files "
+                    f"instead: {ex}"
+                )
 
-            dst_path.parent.mkdir(parents=True, exist_ok=True)
+            # Only files that were extracted completely and correctly are skipped by
+            # the copy
+            extracted_files: set[Path] = set()
+            for file, entry in entries.items():
+                dst_path: Path = mod_folder / file
+                try:
+                    if (
+                        dst_path.stat().st_size != entry.size
+                        or ArchiveInstaller.get_crc(dst_path) != entry.crc
+                    ):
+                        continue
+                except OSError:
+                    continue
+
+                transfer.extracted(archive.path, dst_path, entry.size)
+                existing_files.add(os.path.normcase(dst_path))
+                extracted_files.add(file)
+
+            span.add("files", len(extracted_files))
+            span.add("bytes", sum(entries[file].size for file in extracted_files))
+
+        return extracted_files
 
-            if dst_path.is_file() and replace:
-                dst_path.unlink()
-                self.log.warning(f"Deleted existing file: {str(dst_path)!r}")
-            elif not replace:
-                self.log.info(f"Skipped existing file: {str(dst_path)!r}")
-                continue
+    @staticmethod
+    def _transfer_file(
+        src_path: Path,
+        dst_path: Path,
+        size: int,
+        use_hardlinks: bool,
+        transfer: Transfer,
+    ) -> bool:
+        """
+        Hardlinks or copies a file and records it in the specified transfer.
+
+        Args:
+            src_path (Path): The source file.
+            dst_path (Path): The destination path.
+            size (int): The size of the file in bytes.
+            use_hardlinks (bool):
+                Whether to use a hardlink if both paths are on the same drive.
+            transfer (Transfer): The transfer to record the file in.
 
-            if src_path.drive.lower() == dst_path.drive.lower() and use_hardlinks:
-                os.link(src_path, dst_path)
-            else:
-                shutil.copyfile(src_path, dst_path)
+        Returns:
+            bool: Whether the file was hardlinked.
+        """
+
+        if src_path.drive.lower() == dst_path.drive.lower() and use_hardlinks:
+            os.link(src_path, dst_path)
+            transfer.linked(src_path, dst_path, size)
+            return True
+
+        shutil.copyfile(src_path, dst_path)
+        transfer.copied(src_path, dst_path, size)
+        return False
+
+    @staticmethod
+    def _prepare_destination_folders(folders: set[Path]) -> set[str]:
+        """
+        Creates all missing folders of the specified set in one pass and lists the
+        files that already exist in them. Each folder is listed only once instead of
+        checking every destination file separately.
+
+        Args:
+            folders (set[Path]): The destination folders.
+
+        Returns:
+            set[str]: Normalized paths (see `os.path.normcase()`) of existing files.
+        """
+
+        existing_files: set[str] = set()
+        missing_folders: list[Path] = []
+
+        for folder in folders:
+            try:
+                with os.scandir(folder) as entries:
+                    existing_files.update(
+                        os.path.normcase(entry.path)
+                        for entry in entries
+                        if entry.is_file()
+                    )
+            except FileNotFoundError:
+                missing_folders.append(folder)
+
+        # Parent folders are implicitly created with their subfolders
+        parent_folders: set[Path] = {
+            parent for folder in missing_folders for parent in folder.parents
+        }
+        for folder in missing_folders:
+            if folder not in parent_folders:
+                os.makedirs(folder, exist_ok=True)
+
+        return existing_files
 
     def get_ini_files(self, instance: Instance, instance_data: I) -> list[Path]:
         """
@@ -423,7 +640,7 @@ class ModManager[I: InstanceInfo](QObject):
         separate_ini_files: bool,
         use_hardlinks: bool,
         replace: bool,
-        ldialog: Optional[LoadingDialog] = None,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         """
         Migrates the specified INI files to the destination path.
@@ -440,40 +657,41 @@ class ModManager[I: InstanceInfo](QObject):
 
         dest_folder: Path = self.get_ini_dir(instance_data, separate_ini_files)
 
-        for f, file in enumerate(files):
-            dst_path: Path = dest_folder / file.name
-
-            self.log.info(
-                f"Migrating ini file {file.name!r} from "
-                f"{str(file.parent)!r} to {str(dest_folder)!r}..."
-            )
-            if ldialog:
-                ldialog.updateProgress(
-                    text2=f"{file.name} ({f}/{len(files)})",
-                    value2=f,
-                    max2=len(files),
-                    show3=True,
-                    text3=f"{file.name} ({scale_value(file.stat().st_size)})",
+        with TransferLog.transfer("INI files", self.log) as transfer:
+            for f, file in enumerate(files):
+                dst_path: Path = dest_folder / file.name
+
+                if not TransferLog.is_summary_enabled():
+                    self.log.info(
+                        f"Migrating ini file {file.name!r} from "
+                        f"{str(file.parent)!r} to {str(dest_folder)!r}..."
+                    )
+                if ldialog:
+                    ldialog.updateProgress(
+                        text2=f"{file.name} ({f}/{len(files)})",
+                        value2=f,
+                        max2=len(files),
+                        show3=True,
+                        text3=f"{file.name} ({scale_value(file.stat().st_size)})",
+                    )
+
+                if not file.is_file():
+                    self.log.warning(f"Skipped not existing file: {str(file)!r}")
+                    continue
+
+                dest_folder.mkdir(parents=True, exist_ok=True)
+
+                if dst_path.is_file() and replace:
+                    dst_path.unlink()
+                    transfer.replaced(dst_path)
+                elif dst_path.is_file():
+                    transfer.skipped(dst_path, "existing file")
+                    continue
+
+                ModManager._transfer_file(
+                    file, dst_path, file.stat().st_size, use_hardlinks, transfer
                 )
 
-            if not file.is_file():
-                self.log.warning(f"Skipped not existing file: {str(file)!r}")
-                continue
-
-            dest_folder.mkdir(parents=True, exist_ok=True)
-
-            if dst_path.is_file() and replace:
-                dst_path.unlink()
-                self.log.warning(f"Deleted existing file: {str(dst_path)!r}")
-            elif not replace:
-                self.log.info(f"Skipped existing file: {str(dst_path)!r}")
-                continue
-
-            if file.drive.lower() == dst_path.drive.lower() and use_hardlinks:
-                os.link(file, dst_path)
-            else:
-                shutil.copyfile(file, dst_path)
-
     def get_additional_files(self, instance_data: I) -> list[Path]:
         """
         Returns a list of additional files to migrate.
@@ -500,7 +718,7 @@ class ModManager[I: InstanceInfo](QObject):
         instance_data: I,
         use_hardlinks: bool,
         replace: bool,
-        ldialog: Optional[LoadingDialog] = None,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         """
         Migrates the specified additional files to the specified destination path.
@@ -516,36 +734,37 @@ class ModManager[I: InstanceInfo](QObject):
 
         dest_folder: Path = self.get_additional_files_folder(instance_data)
 
-        for f, file in enumerate(files):
-            dst_path: Path = dest_folder / file.name
-
-            self.log.info(
-                f"Migrating additional file {file.name!r} from "
-                f"{str(file.parent)!r} to {str(dest_folder)!r}..."
-            )
-            if ldialog:
-                ldialog.updateProgress(
-                    text2=f"{file.name} ({f}/{len(files)})",
-                    value2=f,
-                    max2=len(files),
-                    show3=True,
-                    text3=f"{file.name} ({scale_value(file.stat().st_size)})",
+        with TransferLog.transfer("Additional files", self.log) as transfer:
+            for f, file in enumerate(files):
+                dst_path: Path = dest_folder / file.name
+
+                if not TransferLog.is_summary_enabled():
+                    self.log.info(
+                        f"Migrating additional file {file.name!r} from "
+                        f"{str(file.parent)!r} to {str(dest_folder)!r}..."
+                    )
+                if ldialog:
+                    ldialog.updateProgress(
+                        text2=f"{file.name} ({f}/{len(files)})",
+                        value2=f,
+                        max2=len(files),
+                        show3=True,
+                        text3=f"{file.name} ({scale_value(file.stat().st_size)})",
+                    )
+
+                dest_folder.mkdir(parents=True, exist_ok=True)
+
+                if dst_path.is_file() and replace:
+                    dst_path.unlink()
+                    transfer.replaced(dst_path)
+                elif dst_path.is_file():
+                    transfer.skipped(dst_path, "existing file")
+                    continue
+
+                ModManager._transfer_file(
+                    file, dst_path, file.stat().st_size, use_hardlinks, transfer
                 )
 
-            dest_folder.mkdir(parents=True, exist_ok=True)
-
-            if dst_path.is_file() and replace:
-                dst_path.unlink()
-                self.log.warning(f"Deleted existing file: {str(dst_path)!r}")
-            elif not replace:
-                self.log.info(f"Skipped existing file: {str(dst_path)!r}")
-                continue
-
-            if file.drive.lower() == dst_path.drive.lower() and use_hardlinks:
-                os.link(file, dst_path)
-            else:
-                shutil.copyfile(file, dst_path)
-
     @abstractmethod
     def get_additional_files_folder(self, instance_data: I) -> Path:
         """
@@ -6,7 +6,7 @@ import os
 import re
 from copy import copy
 from pathlib import Path
-from typing import Any, Optional, override
+from typing import TYPE_CHECKING, Any, Container, Optional, override
 
 from core.archive.archive import Archive
 from core.game.exceptions import GameNotFoundError
@@ -26,12 +26,15 @@ from core.utilities.filesystem import clean_fs_string
 from core.utilities.ini_file import INIFile
 from core.utilities.progress_update import ProgressUpdate
 from core.utilities.scale import scale_value
+from core.utilities.tracer import Tracer
 from core.utilities.unique import unique
-from ui.widgets.loading_dialog import LoadingDialog
 
 from ..mod_manager import ModManager
 from .mo2_instance_info import MO2InstanceInfo
 
+if TYPE_CHECKING:
+    from ui.widgets.loading_dialog import LoadingDialog
+
 
 class ModOrganizer(ModManager[MO2InstanceInfo]):
     """
@@ -40,6 +43,8 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
 
     # TODO: Make this dynamic instead of a fixed url
     DOWNLOAD_URL: str = "https://github.com/ModOrganizer2/modorganizer/releases/download/v2.5.2/Mod.Organizer-2.5.2.7z"
+    DOWNLOAD_SEGMENTS: int = 4
+    """Number of parallel connections for downloading ModOrganizer."""
 
     BYTE_ARRAY_PATTERN: re.Pattern[str] = re.compile(r"^@ByteArray\((.*)\)$")
     INI_ARG_PATTERN: re.Pattern[str] = re.compile(r'(?:[^ "]+|"[^"]+")+')
@@ -95,13 +100,14 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
         return instances
 
     @override
+    @Tracer.traced("load")
     def load_instance(
         self,
         instance_data: MO2InstanceInfo,
         modname_limit: int,
-        file_blacklist: list[str] = [],
+        file_blacklist: Container[str] = [],
         game_folder: Optional[Path] = None,
-        ldialog: Optional[LoadingDialog] = None,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> Instance:
         instance_name: str = instance_data.display_name
         profile_name: str = instance_data.profile
@@ -171,13 +177,14 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
         return instance
 
     @override
+    @Tracer.traced("load.mods")
     def _load_mods(
         self,
         instance_data: MO2InstanceInfo,
         modname_limit: int,
         game_folder: Path,
-        file_blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        file_blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> list[Mod]:
         instance_name: str = instance_data.display_name
         profile_name: str = instance_data.profile
@@ -194,6 +201,7 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
         mods_dir: Path = ModOrganizer.get_mods_folder(mo2_ini_path)
         prof_dir: Path = ModOrganizer.get_profiles_folder(mo2_ini_path)
         modlist_txt_path: Path = prof_dir / instance_data.profile / "modlist.txt"
+        downloads_dir: Path = ModOrganizer.get_downloads_folder(mo2_ini_path)
 
         if not (mods_dir.is_dir() and prof_dir.is_dir() and modlist_txt_path.is_file()):
             raise InstanceNotFoundError(f"{instance_name} > {profile_name}")
@@ -242,6 +250,10 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
 
                 self.log.debug(f"Detected mod using Root Builder plugin: {modname}")
 
+            archive_path: Optional[Path] = None
+            if metadata.file_name and (downloads_dir / metadata.file_name).is_file():
+                archive_path = downloads_dir / metadata.file_name
+
             mod = Mod(
                 display_name=modname.removesuffix("_separator"),
                 path=mod_path,
@@ -254,8 +266,12 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
                     if modname.endswith("_separator")
                     else Mod.Type.Regular
                 ),
+                archive_path=archive_path,
             )
-            mod.files  # build cache for mod files
+            with Tracer.span("load.scan", mod=modname) as span:
+                mod.files  # build cache for mod files
+                span.add("files", len(mod.files))
+                span.add("bytes", mod.size)
             mods.append(mod)
 
         # Load overwrite folder as mod
@@ -272,7 +288,10 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
                 enabled=True,
                 mod_type=Mod.Type.Overwrite,
             )
-            overwrite_mod.files  # build cache for mod files
+            with Tracer.span("load.scan", mod="Overwrite") as span:
+                overwrite_mod.files  # build cache for mod files
+                span.add("files", len(overwrite_mod.files))
+                span.add("bytes", overwrite_mod.size)
             mods.append(overwrite_mod)
 
         if ldialog is not None:
@@ -291,6 +310,7 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
 
         return mods
 
+    @Tracer.traced("load.meta_parse")
     def __parse_meta_ini(self, meta_ini_path: Path, default_game: Game) -> Metadata:
         ini_file = INIFile(meta_ini_path)
         meta_ini_data: dict[str, Any] = ini_file.load_file()
@@ -370,11 +390,12 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
         with open(modlist_txt_path, "w", encoding="utf8") as modlist_file:
             modlist_file.writelines(lines)
 
+    @Tracer.traced("load.conflicts")
     def __process_conflicts(
         self,
         mods: list[Mod],
-        file_blacklist: list[str],
-        ldialog: Optional[LoadingDialog] = None,
+        file_blacklist: Container[str],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         file_index: dict[str, list[Mod]] = ModOrganizer._index_modlist(
             mods, file_blacklist
@@ -414,13 +435,14 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
                 mod.file_conflicts[real_file] = overwriting_mod
 
     @override
+    @Tracer.traced("load.tools")
     def _load_tools(
         self,
         instance_data: MO2InstanceInfo,
         mods: list[Mod],
         game_folder: Path,
-        file_blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        file_blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> list[Tool]:
         instance_name: str = instance_data.display_name
         profile_name: str = instance_data.profile
@@ -534,7 +556,7 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
         self,
         instance_data: MO2InstanceInfo,
         game_folder: Path,
-        ldialog: Optional[LoadingDialog] = None,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> Instance:
         self.log.info(f"Creating instance {instance_data.display_name!r}...")
 
@@ -601,7 +623,7 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
         )
 
     def __download_and_install_mo2(
-        self, dest: Path, ldialog: Optional[LoadingDialog] = None
+        self, dest: Path, ldialog: Optional["LoadingDialog"] = None
     ) -> None:
         self.log.info(f"Downloading and installing ModOrganizer to {str(dest)!r}...")
 
@@ -619,7 +641,7 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
         self.log.info("ModOrganizer downloaded and installed successfully.")
 
     def __download_mo2(
-        self, dest: Path, ldialog: Optional[LoadingDialog] = None
+        self, dest: Path, ldialog: Optional["LoadingDialog"] = None
     ) -> Path:
         self.log.info("Downloading ModOrganizer...")
 
@@ -638,13 +660,14 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
             url=ModOrganizer.DOWNLOAD_URL,
             dest_folder=dest,
             progress_callback=update,
+            segments=ModOrganizer.DOWNLOAD_SEGMENTS,
         )
 
     def __install_mo2(
         self,
         downloaded_archive: Path,
         dest: Path,
-        ldialog: Optional[LoadingDialog] = None,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         self.log.info("Installing ModOrganizer...")
 
@@ -653,8 +676,18 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
                 text2=self.tr("Extracting archive..."), value2=0, max2=0
             )
 
+        def update(progress_update: ProgressUpdate) -> None:
+            if ldialog is not None:
+                ldialog.updateProgress(
+                    text2=self.tr("Extracting archive...")
+                    + f" ({scale_value(progress_update.current)} / "
+                    f"{scale_value(progress_update.maximum)})",
+                    value2=progress_update.current,
+                    max2=progress_update.maximum,
+                )
+
         archive: Archive = Archive.load_archive(downloaded_archive)
-        archive.extract_all(dest, full_paths=True)
+        archive.extract_all(dest, full_paths=True, progress_callback=update)
 
     @override
     def install_mod(
@@ -665,8 +698,8 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
         file_redirects: dict[Path, Path],
         use_hardlinks: bool,
         replace: bool,
-        blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         self.log.info(f"Installing mod {mod.display_name!r}...")
 
@@ -699,27 +732,28 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
                 )
             mod_folder.mkdir(parents=True, exist_ok=True)
 
-            # Create and write metadata to meta.ini
-            # if the mod doesn't already have one
-            if regular_deployment and Path("meta.ini") not in mod.files:
-                meta_ini_file = INIFile(meta_ini_path)
-                meta_ini_file.data = {
-                    "General": {
-                        "game": game.short_name,
-                        "modid": mod.metadata.mod_id,
-                        "version": mod.metadata.version,
-                        "installationFile": mod.metadata.file_name,
-                    },
-                    "installedFiles": {
-                        "1\\modid": mod.metadata.mod_id,
-                        "size": "1",
-                        "1\\fileid": mod.metadata.file_id,
-                    },
-                }
-                meta_ini_file.save_file()
-            elif regular_deployment and Path("meta.ini") in mod.files:
-                meta_ini_path.write_bytes((mod.path / "meta.ini").read_bytes())
-                self.log.info("Copied original meta.ini from mod.")
+            with Tracer.span("migrate.metadata", mod=mod.display_name):
+                # Create and write metadata to meta.ini
+                # if the mod doesn't already have one
+                if regular_deployment and Path("meta.ini") not in mod.files:
+                    meta_ini_file = INIFile(meta_ini_path)
+                    meta_ini_file.data = {
+                        "General": {
+                            "game": game.short_name,
+                            "modid": mod.metadata.mod_id,
+                            "version": mod.metadata.version,
+                            "installationFile": mod.metadata.file_name,
+                        },
+                        "installedFiles": {
+                            "1\\modid": mod.metadata.mod_id,
+                            "size": "1",
+                            "1\\fileid": mod.metadata.file_id,
+                        },
+                    }
+                    meta_ini_file.save_file()
+                elif regular_deployment and Path("meta.ini") in mod.files:
+                    meta_ini_path.write_bytes((mod.path / "meta.ini").read_bytes())
+                    self.log.info("Copied original meta.ini from mod.")
 
         # Process overwrite folder
         elif mod.mod_type == Mod.Type.Overwrite:
@@ -764,8 +798,8 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
         instance_data: MO2InstanceInfo,
         use_hardlinks: bool,
         replace: bool,
-        blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         if tool in instance.tools:
             return
@@ -968,6 +1002,34 @@ class ModOrganizer(ModManager[MO2InstanceInfo]):
 
         return overwrite_dir
 
+    @staticmethod
+    def get_downloads_folder(mo2_ini_path: Path) -> Path:
+        """
+        Gets the path to the downloads folder of the specified MO2 instance.
+
+        Args:
+            mo2_ini_path (Path): Path to the ModOrganizer.ini file of the instance.
+
+        Returns:
+            Path: Path to the downloads folder.
+        """
+
+        ini_file = INIFile(mo2_ini_path)
+        ini_data: dict[str, Any] = ini_file.load_file()
+
+        settings: dict[str, Any] = ini_data["Settings"]
+        base_dir = Path(settings.get("base_directory", mo2_ini_path.parent))
+
+        downloads_dir: Path
+        if "download_directory" in settings:
+            downloads_dir = resolve(
+                Path(settings["download_directory"]), base_dir=str(base_dir)
+            )
+        else:
+            downloads_dir = base_dir / "downloads"
+
+        return downloads_dir
+
     @staticmethod
     def get_profile_names(mo2_ini_path: Path) -> list[str]:
         """
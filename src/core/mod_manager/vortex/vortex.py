@@ -7,11 +7,9 @@ import random
 import shutil
 import string
 import time
-from copy import copy
+from copy import copy, deepcopy
 from pathlib import Path
-from typing import Any, Optional, override
-
-import plyvel
+from typing import TYPE_CHECKING, Any, Container, Optional, override
 
 from core.game.exceptions import GameNotFoundError
 from core.game.game import Game
@@ -21,8 +19,9 @@ from core.instance.mod import Mod
 from core.instance.tool import Tool
 from core.utilities.env_resolver import resolve
 from core.utilities.filesystem import clean_fs_string
+from core.utilities.lazy_import import lazy_import
 from core.utilities.leveldb import LevelDB
-from ui.widgets.loading_dialog import LoadingDialog
+from core.utilities.tracer import Tracer
 
 from ..exceptions import InstanceNotFoundError
 from ..mod_manager import ModManager
@@ -33,6 +32,13 @@ from .exceptions import (
 )
 from .profile_info import ProfileInfo
 
+if TYPE_CHECKING:
+    import plyvel
+
+    from ui.widgets.loading_dialog import LoadingDialog
+else:
+    plyvel = lazy_import("plyvel")
+
 
 class Vortex(ModManager[ProfileInfo]):
     """
@@ -111,13 +117,14 @@ class Vortex(ModManager[ProfileInfo]):
         return profiles
 
     @override
+    @Tracer.traced("load")
     def load_instance(
         self,
         instance_data: ProfileInfo,
         modname_limit: int,
-        file_blacklist: list[str] = [],
+        file_blacklist: Container[str] = [],
         game_folder: Optional[Path] = None,
-        ldialog: Optional[LoadingDialog] = None,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> Instance:
         instance_name: str = instance_data.display_name
         game: Game = instance_data.game
@@ -159,13 +166,14 @@ class Vortex(ModManager[ProfileInfo]):
         return instance
 
     @override
+    @Tracer.traced("load.mods")
     def _load_mods(
         self,
         instance_data: ProfileInfo,
         modname_limit: int,
         game_folder: Path,
-        file_blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        file_blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> list[Mod]:
         instance_name: str = instance_data.display_name
         profile_id: str = instance_data.id
@@ -190,13 +198,17 @@ class Vortex(ModManager[ProfileInfo]):
         #         modnames.append(modname)
         modnames: list[str] = [m for m in mod_state_data]
 
-        mods_data: dict = self.__level_db.load(f"persistent###mods###{game_id}###")
+        # Only load the mods of the profile instead of all mods of the game
+        mods_data: dict = self.__level_db.load_prefixes(
+            [f"persistent###mods###{game_id}###{modname}###" for modname in modnames]
+        )
 
         if not mods_data:
             return []
 
         installed_mods: dict[str, dict] = mods_data["persistent"]["mods"][game_id]
         staging_folder: Path = self.__get_staging_folder(game)
+        downloads_folder: Path = self.__get_downloads_folder(game)
 
         mods: list[Mod] = []
         conflict_rules: dict[Mod, list[dict]] = {}
@@ -293,6 +305,11 @@ class Vortex(ModManager[ProfileInfo]):
                 ),
                 installed=True,
                 enabled=mod_state_data.get(modname, {}).get("enabled", False),
+                archive_path=(
+                    downloads_folder / file_name
+                    if (downloads_folder / file_name).is_file()
+                    else None
+                ),
             )
             mods.append(mod)
             rules: list[dict] = moddata.get("rules", [])
@@ -313,6 +330,7 @@ class Vortex(ModManager[ProfileInfo]):
 
         return mods
 
+    @Tracer.traced("load.conflicts")
     def __process_conflict_rules(
         self, mods: list[Mod], conflict_rules: dict[Mod, list[dict]]
     ) -> None:
@@ -363,10 +381,11 @@ class Vortex(ModManager[ProfileInfo]):
 
         self.log.info("Processing conflict rules successful.")
 
+    @Tracer.traced("load.conflicts")
     def __process_file_overrides(
         self,
         file_overrides: dict[Mod, list[str]],
-        file_blacklist: list[str],
+        file_blacklist: Container[str],
         mod_overrides: dict[Mod, list[Mod]],
         game: Game,
         game_folder: Path,
@@ -406,13 +425,14 @@ class Vortex(ModManager[ProfileInfo]):
         self.log.info("Processing file overrides successful.")
 
     @override
+    @Tracer.traced("load.tools")
     def _load_tools(
         self,
         instance_data: ProfileInfo,
         mods: list[Mod],
         game_folder: Path,
-        file_blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        file_blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> list[Tool]:
         self.log.debug("Loading tools from Vortex...")
         if ldialog is not None:
@@ -478,7 +498,7 @@ class Vortex(ModManager[ProfileInfo]):
         self,
         instance_data: ProfileInfo,
         game_folder: Path,
-        ldialog: Optional[LoadingDialog] = None,
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> Instance:
         self.log.info(
             f"Creating profile {instance_data.display_name!r} "
@@ -502,10 +522,11 @@ class Vortex(ModManager[ProfileInfo]):
         }
 
         profiles_data: dict = self.__level_db.load("persistent###profiles###")
+        original_profiles_data: dict = deepcopy(profiles_data)
         profiles_data.setdefault("persistent", {}).setdefault("profiles", {})[
             profile_id
         ] = profile_data
-        self.__level_db.dump(profiles_data)
+        self.__level_db.dump(profiles_data, original=original_profiles_data)
 
         # Create profile folder
         app_path: Path = resolve(Path("%APPDATA%") / "Vortex")
@@ -530,8 +551,8 @@ class Vortex(ModManager[ProfileInfo]):
         file_redirects: dict[Path, Path],
         use_hardlinks: bool,
         replace: bool,
-        blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         self.log.info(f"Installing mod {mod.display_name!r}...")
 
@@ -550,6 +571,7 @@ class Vortex(ModManager[ProfileInfo]):
             .setdefault("mods", {})
             .setdefault(game_id, {})
         )
+        original_mods_data: dict[str, Any] = deepcopy(mods_data)
 
         file_name: str = self.__get_unique_file_name(mod).rsplit(".", 1)[0]
         mod_folder: Path = staging_folder / file_name
@@ -592,55 +614,65 @@ class Vortex(ModManager[ProfileInfo]):
         else:
             self.log.info(f"Mod {mod.display_name!r} already installed.")
 
-        rules: list[dict[str, Any]] = mods_data[file_name].get("rules", [])
-        # Check for rules
-        for overwriting_mod in mod.mod_conflicts:
-            overwriting_mod_filename: str = self.__get_unique_file_name(
-                overwriting_mod
-            ).rsplit(".", 1)[0]
-
-            # Skip mod if both mods already exist in database
-            # since rule is very likely to exist, too
-            # if overwriting_mod_filename in installed_mods:
-            if instance.is_mod_installed(mod) and instance.is_mod_installed(
-                overwriting_mod
-            ):
-                continue
+        with Tracer.span("migrate.metadata", mod=mod.display_name):
+            rules: list[dict[str, Any]] = mods_data[file_name].get("rules", [])
+            # Check for rules
+            for overwriting_mod in mod.mod_conflicts:
+                overwriting_mod_filename: str = self.__get_unique_file_name(
+                    overwriting_mod
+                ).rsplit(".", 1)[0]
+
+                # Skip mod if both mods already exist in database
+                # since rule is very likely to exist, too
+                # if overwriting_mod_filename in installed_mods:
+                if instance.is_mod_installed(mod) and instance.is_mod_installed(
+                    overwriting_mod
+                ):
+                    continue
 
-            # Merge rules
-            rule: dict[str, Any] = {
-                "reference": {
-                    "id": overwriting_mod_filename,
-                    "idHint": overwriting_mod_filename,
-                    "versionMatch": "*",
-                },
-                "type": "before",
-            }
-            rules.append(rule)
-            self.log.debug(
-                f"Added conflict rule for mod {mod.display_name!r} "
-                f"overwritten by {overwriting_mod.display_name!r}."
-            )
+                # Merge rules
+                rule: dict[str, Any] = {
+                    "reference": {
+                        "id": overwriting_mod_filename,
+                        "idHint": overwriting_mod_filename,
+                        "versionMatch": "*",
+                    },
+                    "type": "before",
+                }
+                rules.append(rule)
+                self.log.debug(
+                    f"Added conflict rule for mod {mod.display_name!r} "
+                    f"overwritten by {overwriting_mod.display_name!r}."
+                )
 
-        if rules:
-            mods_data[file_name]["rules"] = rules
+            if rules:
+                mods_data[file_name]["rules"] = rules
 
-        self.__level_db.dump(mods_data, prefix=f"persistent###mods###{game_id}###")
+            self.__level_db.dump(
+                mods_data,
+                prefix=f"persistent###mods###{game_id}###",
+                original=original_mods_data,
+            )
 
-        # Add mod to profile
-        profiles_data: dict[str, Any] = (
-            self.__level_db.load("persistent###profiles###")
-            .setdefault("persistent", {})
-            .setdefault("profiles", {})
-        )
-        profile_mods: dict[str, Any] = profiles_data.setdefault(
-            instance_data.id, {}
-        ).setdefault("modState", {})
-        profile_mods[file_name] = {
-            "enabled": mod.enabled,
-            "enabledTime": Vortex.format_unix_timestamp(time.time()),
-        }
-        self.__level_db.dump(profiles_data, prefix="persistent###profiles###")
+            # Add mod to profile
+            profiles_data: dict[str, Any] = (
+                self.__level_db.load("persistent###profiles###")
+                .setdefault("persistent", {})
+                .setdefault("profiles", {})
+            )
+            original_profiles_data: dict[str, Any] = deepcopy(profiles_data)
+            profile_mods: dict[str, Any] = profiles_data.setdefault(
+                instance_data.id, {}
+            ).setdefault("modState", {})
+            profile_mods[file_name] = {
+                "enabled": mod.enabled,
+                "enabledTime": Vortex.format_unix_timestamp(time.time()),
+            }
+            self.__level_db.dump(
+                profiles_data,
+                prefix="persistent###profiles###",
+                original=original_profiles_data,
+            )
 
         if not instance.is_mod_installed(mod):
             new_mod: Mod = Mod.copy(mod)
@@ -671,6 +703,29 @@ class Vortex(ModManager[ProfileInfo]):
 
         return staging_folder
 
+    def __get_downloads_folder(self, game: Game) -> Path:
+        appdata_path: Path = resolve(Path("%APPDATA%") / "Vortex")
+        game_id: str = game.id.lower()
+
+        try:
+            downloads_folder_value: Optional[str] = self.__level_db.get_key(
+                "settings###downloads###path"
+            )
+        except plyvel.IOError as ex:
+            raise VortexIsRunningError from ex
+
+        downloads_folder: Path
+        if downloads_folder_value is None:
+            downloads_folder = appdata_path / "downloads"
+        else:
+            downloads_folder = resolve(
+                Path(downloads_folder_value),
+                sep=("{", "}"),
+                userdata=str(appdata_path),
+            )
+
+        return downloads_folder / game_id
+
     @override
     def add_tool(
         self,
@@ -679,8 +734,8 @@ class Vortex(ModManager[ProfileInfo]):
         instance_data: ProfileInfo,
         use_hardlinks: bool,
         replace: bool,
-        blacklist: list[str] = [],
-        ldialog: Optional[LoadingDialog] = None,
+        blacklist: Container[str] = [],
+        ldialog: Optional["LoadingDialog"] = None,
     ) -> None:
         self.log.info(f"Adding tool {tool.display_name!r}...")
 
@@ -790,11 +845,12 @@ class Vortex(ModManager[ProfileInfo]):
             mod_data: dict[str, Any] = self.__level_db.load(prefix)["persistent"][
                 "mods"
             ][game.id.lower()][full_mod_name]
+            original_mod_data: dict[str, Any] = deepcopy(mod_data)
             mod_data["fileOverrides"] = [
                 str(game_folder / game.mods_folder / file)
                 for file in mod.file_conflicts
             ]
-            self.__level_db.dump(mod_data, prefix + "###")
+            self.__level_db.dump(mod_data, prefix + "###", original=original_mod_data)
 
     @override
     def finalize_migration(
@@ -807,11 +863,12 @@ class Vortex(ModManager[ProfileInfo]):
         profile_data: dict[str, Any] = self.__level_db.load(
             f"persistent###profiles###{migrated_instance_data.id}"
         )
+        original_profile_data: dict[str, Any] = deepcopy(profile_data)
         profile_data.setdefault("features", {})["local_game_settings"] = (
             migrated_instance.separate_ini_files
         )
         profile_data["features"]["local_saves"] = migrated_instance.separate_save_games
-        self.__level_db.dump(profile_data)
+        self.__level_db.dump(profile_data, original=original_profile_data)
 
         # Set file overrides
         self.__set_file_overrides(
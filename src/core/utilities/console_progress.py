@@ -0,0 +1,149 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import sys
+import time
+from typing import Any, Optional, TextIO
+
+from .progress_aggregator import ProgressAggregator
+
+
+class ConsoleProgress:
+    """
+    Headless replacement for the `LoadingDialog` that writes the progress updates as
+    single lines to a text stream (stdout by default).
+
+    The updates are coalesced with a `ProgressAggregator` and written at most once
+    per interval to keep the output readable and cheap, even when the progress is
+    updated for every single file.
+    """
+
+    INTERVAL: float = 1.0
+    """Minimum interval (in seconds) between two written lines."""
+
+    __stream: TextIO
+    __interval: float
+    __progress: ProgressAggregator
+    __last_write: Optional[float]
+    __last_line: Optional[str]
+
+    def __init__(
+        self, stream: Optional[TextIO] = None, interval: float = INTERVAL
+    ) -> None:
+        """
+        Args:
+            stream (Optional[TextIO], optional):
+                Stream to write the progress to. Defaults to `sys.stdout`.
+            interval (float, optional):
+                Minimum interval (in seconds) between two written lines.
+                Defaults to `INTERVAL`.
+        """
+
+        self.__stream = stream or sys.stdout
+        self.__interval = interval
+        self.__progress = ProgressAggregator()
+        self.__last_write = None
+        self.__last_line = None
+
+    def updateProgress(
+        self,
+        text1: Optional[str] = None,
+        value1: Optional[int] = None,
+        max1: Optional[int] = None,
+        show2: Optional[bool] = None,
+        text2: Optional[str] = None,
+        value2: Optional[int] = None,
+        max2: Optional[int] = None,
+        show3: Optional[bool] = None,
+        text3: Optional[str] = None,
+        value3: Optional[int] = None,
+        max3: Optional[int] = None,
+    ) -> None:
+        """
+        Updates the progress. Has the same signature as
+        `LoadingDialog.updateProgress()`.
+
+        Args:
+            text1 (Optional[str], optional): Main status text. Defaults to None.
+            value1 (Optional[int], optional): Main progress. Defaults to None.
+            max1 (Optional[int], optional): Main maximum. Defaults to None.
+            show2 (Optional[bool], optional):
+                Whether to show the second row. Defaults to None.
+            text2 (Optional[str], optional): Text of second row. Defaults to None.
+            value2 (Optional[int], optional): Progress of second row. Defaults to None.
+            max2 (Optional[int], optional): Maximum of second row. Defaults to None.
+            show3 (Optional[bool], optional):
+                Whether to show the third row. Defaults to None.
+            text3 (Optional[str], optional): Text of third row. Defaults to None.
+            value3 (Optional[int], optional): Progress of third row. Defaults to None.
+            max3 (Optional[int], optional): Maximum of third row. Defaults to None.
+        """
+
+        self.__progress.update(
+            text=text1,
+            value=value1,
+            max=max1,
+            show2=show2,
+            text2=text2,
+            value2=value2,
+            max2=max2,
+            show3=show3,
+            text3=text3,
+            value3=value3,
+            max3=max3,
+        )
+
+        now: float = time.monotonic()
+        if self.__last_write is None or now - self.__last_write >= self.__interval:
+            self.__last_write = now
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the latest progress if it changed since the last written line.
+        """
+
+        progress: Optional[dict[str, Any]] = self.__progress.poll()
+        if progress is None:
+            return
+
+        line: str = ConsoleProgress.format_progress(progress)
+        if line and line != self.__last_line:
+            self.__stream.write(line + "\n")
+            self.__stream.flush()
+            self.__last_line = line
+
+    @staticmethod
+    def format_progress(progress: dict[str, Any]) -> str:
+        """
+        Formats a progress snapshot as a single line.
+
+        Args:
+            progress (dict[str, Any]): Snapshot of the progress fields.
+
+        Returns:
+            str: Formatted line, for eg. `[ 50%] Migrating mods... (1/2) | Mod 1`.
+        """
+
+        parts: list[str] = []
+
+        if progress.get("text"):
+            parts.append(progress["text"])
+
+        for row in ("2", "3"):
+            if progress.get("show" + row) and progress.get("text" + row):
+                text: str = progress["text" + row]
+                maximum: int = progress.get("max" + row, 0)
+                if maximum > 0:
+                    text += f" ({progress.get('value' + row, 0)}/{maximum})"
+                parts.append(text)
+
+        line: str = " | ".join(parts)
+
+        maximum = progress.get("max", 0)
+        if line and maximum > 0:
+            percent: int = int(100 * min(progress.get("value", 0), maximum) / maximum)
+            line = f"[{percent:3d}%] {line}"
+
+        return line
@@ -0,0 +1,278 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+class DownloadCache:
+    """
+    Class for a content-addressed cache of downloaded files.
+
+    Files are stored under their checksum (see `HASH_ALGORITHM`) and an index maps
+    download urls to the checksums. Cached files are validated against their
+    checksum before they are used and the least recently used files are evicted when
+    the cache exceeds its maximum size. Cached files that are missing from the index
+    are evicted by their modification time.
+    """
+
+    log: logging.Logger = logging.getLogger("DownloadCache")
+
+    HASH_ALGORITHM: str = "sha256"
+    """Algorithm of the checksums of the cached files."""
+
+    MAX_SIZE: int = 1024 * 1024 * 1024  # 1 GB
+    """Default maximum size of the cache in bytes."""
+
+    INDEX_FILE_NAME: str = "index.json"
+    CHUNK_SIZE: int = 1024 * 1024  # 1 MB
+
+    path: Path
+    """Folder of the cache."""
+
+    max_size: int
+    """Maximum size of the cache in bytes."""
+
+    __lock: threading.Lock
+
+    def __init__(self, path: Path, max_size: int = MAX_SIZE) -> None:
+        """
+        Args:
+            path (Path): Folder of the cache.
+            max_size (int, optional):
+                Maximum size of the cache in bytes. Defaults to `MAX_SIZE`.
+        """
+
+        self.path = path
+        self.max_size = max_size
+        self.__lock = threading.Lock()
+
+    def get(
+        self, url: str, checksum: Optional[str] = None
+    ) -> Optional[tuple[Path, str]]:
+        """
+        Returns the cached file of a download url. Invalid cached files are deleted.
+
+        Args:
+            url (str): The download url.
+            checksum (Optional[str], optional):
+                The expected checksum of the file. Defaults to None.
+
+        Returns:
+            Optional[tuple[Path, str]]:
+                The path to the cached file and its original file name or None if it
+                isn't cached.
+        """
+
+        with self.__lock:
+            index: dict[str, dict[str, Any]] = self.__load_index()
+            entry: Optional[dict[str, Any]] = index.get(url)
+
+            if entry is None:
+                return None
+
+            file_checksum: str = entry["checksum"]
+            cached_file: Path = self.path / file_checksum
+            if checksum is not None and checksum.lower() != file_checksum:
+                self.log.warning(
+                    f"Cached file of {url!r} has an unexpected checksum. Ignoring it..."
+                )
+                return None
+
+            if (
+                not cached_file.is_file()
+                or cached_file.stat().st_size != entry["size"]
+                or DownloadCache.get_checksum(cached_file) != file_checksum
+            ):
+                self.log.warning(f"Cached file of {url!r} is invalid. Deleting it...")
+                index.pop(url)
+                self.__delete_unused_files(index, [file_checksum])
+                self.__save_index(index)
+                return None
+
+            entry["last_used"] = time.time()
+            self.__save_index(index)
+
+        self.log.info(f"Using cached file for {url!r}.")
+
+        return cached_file, entry["file_name"]
+
+    def put(self, url: str, file: Path) -> Path:
+        """
+        Adds a downloaded file to the cache and evicts the least recently used files
+        if the cache exceeds its maximum size. The file is hardlinked into the cache
+        if possible.
+
+        Args:
+            url (str): The download url of the file.
+            file (Path): The downloaded file.
+
+        Returns:
+            Path: The path to the cached file.
+        """
+
+        checksum: str = DownloadCache.get_checksum(file)
+        cached_file: Path = self.path / checksum
+
+        with self.__lock:
+            if not cached_file.is_file():
+                self.path.mkdir(parents=True, exist_ok=True)
+                DownloadCache.link_or_copy(file, cached_file)
+
+            index: dict[str, dict[str, Any]] = self.__load_index()
+            index[url] = {
+                "checksum": checksum,
+                "file_name": file.name,
+                "size": cached_file.stat().st_size,
+                "last_used": time.time(),
+            }
+            self.__evict(index, keep=checksum)
+            self.__save_index(index)
+
+        self.log.info(f"Added {file.name!r} from {url!r} to the cache.")
+
+        return cached_file
+
+    def clear(self) -> None:
+        """
+        Deletes all cached files.
+        """
+
+        with self.__lock:
+            if self.path.is_dir():
+                shutil.rmtree(self.path)
+
+        self.log.info("Cleared download cache.")
+
+    @staticmethod
+    def get_checksum(file: Path) -> str:
+        """
+        Calculates the checksum of a file.
+
+        Args:
+            file (Path): The file.
+
+        Returns:
+            str: The checksum as lowercase hex string.
+        """
+
+        hasher = hashlib.new(DownloadCache.HASH_ALGORITHM)
+        with file.open("rb") as stream:
+            while data := stream.read(DownloadCache.CHUNK_SIZE):
+                hasher.update(data)
+
+        return hasher.hexdigest()
+
+    @staticmethod
+    def link_or_copy(src: Path, dst: Path) -> None:
+        """
+        Hardlinks a file or copies it if a hardlink cannot be created, for eg. across
+        drives.
+
+        Args:
+            src (Path): The source file.
+            dst (Path): The destination path.
+        """
+
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    def __evict(self, index: dict[str, dict[str, Any]], keep: str) -> None:
+        sizes: dict[str, int] = {
+            entry["checksum"]: entry["size"] for entry in index.values()
+        }
+
+        # Files that are missing from the index, for eg. because it got lost, still
+        # count towards the size of the cache
+        orphans: dict[str, float] = {}
+        for file in self.path.iterdir():
+            if (
+                file.name not in sizes
+                and DownloadCache.__is_checksum(file.name)
+                and file.is_file()
+            ):
+                stat: os.stat_result = file.stat()
+                sizes[file.name] = stat.st_size
+                orphans[file.name] = stat.st_mtime
+
+        total_size: int = sum(sizes.values())
+        candidates: list[tuple[float, Optional[str], str]] = [
+            (entry["last_used"], url, entry["checksum"]) for url, entry in index.items()
+        ]
+        candidates += [(mtime, None, checksum) for checksum, mtime in orphans.items()]
+
+        for _, url, checksum in sorted(candidates, key=lambda c: c[0]):
+            if total_size <= self.max_size:
+                break
+
+            if checksum == keep:
+                continue
+
+            if url is None:
+                (self.path / checksum).unlink(missing_ok=True)
+                total_size -= sizes[checksum]
+                self.log.info(f"Evicted cached file {checksum!r} missing from index.")
+                continue
+
+            index.pop(url)
+            if self.__delete_unused_files(index, [checksum]):
+                total_size -= sizes[checksum]
+                self.log.info(f"Evicted cached file of {url!r}.")
+
+    def __delete_unused_files(
+        self, index: dict[str, dict[str, Any]], checksums: list[str]
+    ) -> bool:
+        used_checksums: set[str] = {entry["checksum"] for entry in index.values()}
+        deleted: bool = False
+
+        for checksum in checksums:
+            if checksum not in used_checksums:
+                (self.path / checksum).unlink(missing_ok=True)
+                deleted = True
+
+        return deleted
+
+    def __load_index(self) -> dict[str, dict[str, Any]]:
+        index_path: Path = self.path / DownloadCache.INDEX_FILE_NAME
+        if not index_path.is_file():
+            return {}
+
+        try:
+            return json.loads(index_path.read_text(encoding="utf8"))
+        except Exception as ex:
+            self.log.warning(f"Failed to load cache index: {ex}")
+            return {}
+
+    def __save_index(self, index: dict[str, dict[str, Any]]) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        # Replace the index at once, so that it's never truncated, for eg. by a crash
+        # or by another process using the same cache
+        fd, temp_path = tempfile.mkstemp(
+            suffix=".tmp", prefix=DownloadCache.INDEX_FILE_NAME, dir=self.path
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf8") as file:
+                json.dump(index, file, indent=4)
+
+            os.replace(temp_path, self.path / DownloadCache.INDEX_FILE_NAME)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def __is_checksum(name: str) -> bool:
+        length: int = hashlib.new(DownloadCache.HASH_ALGORITHM).digest_size * 2
+
+        return len(name) == length and all(c in "0123456789abcdef" for c in name)
@@ -2,27 +2,44 @@
 Copyright (c) Cutleast
 """
 
+import glob
+import hashlib
 import logging
+import math
 import os
 import platform
+import threading
 from cgi import parse_header
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import requests as req
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QApplication
 
+from core.utilities.download_cache import DownloadCache
+from core.utilities.exceptions import ChecksumMismatchError
+from core.utilities.lazy_import import lazy_import
 from core.utilities.progress_update import (
     ProgressCallback,
     ProgressUpdate,
     safe_run_callback,
 )
 
+if TYPE_CHECKING:
+    import requests as req
+else:
+    req = lazy_import("requests")
+
 
 class Downloader(QObject):
     """
     Class for downloading files from the internet.
+
+    Files are downloaded to `.part` files next to the destination file, which are
+    kept when a download is stopped or fails, so that it can be resumed with range
+    requests. If the server supports range requests, large files can be downloaded
+    in parallel segments.
     """
 
     log: logging.Logger = logging.getLogger("Downloader")
@@ -34,12 +51,32 @@ class Downloader(QObject):
     CHUNK_SIZE: int = 1024 * 1024  # 1 MB
     TIMEOUT: int = 5  # 5 seconds
 
+    MAX_RETRIES: int = 3
+    """Number of times an interrupted segment is resumed before the download fails."""
+
+    MIN_SEGMENT_SIZE: int = 4 * 1024 * 1024  # 4 MB
+    """Minimum size of a segment when a download is split into parallel segments."""
+
+    HASH_ALGORITHM: str = "sha256"
+    """Algorithm of the checksums passed to `download()`."""
+
+    PROGRESS_INTERVAL: float = 0.1
+    """Interval in seconds in which the progress callback is called."""
+
+    cache: Optional[DownloadCache] = None
+    """Cache that is used by `single_download()`, if any."""
+
     user_agent: str
 
+    __current_size: int
+    __progress_lock: threading.Lock
+
     def __init__(self) -> None:
         super().__init__()
 
         self.__stop_signal.connect(self.__stop_download)
+        self.__current_size = 0
+        self.__progress_lock = threading.Lock()
 
         app_name: str = QApplication.applicationName()
         app_version: str = QApplication.applicationVersion()
@@ -58,9 +95,12 @@ class Downloader(QObject):
         dest_folder: Path,
         file_name: Optional[str] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        segments: int = 1,
+        checksum: Optional[str] = None,
     ) -> Path:
         """
         Downloads a file from the internet and saves it at a specified location.
+        Resumes a previous download of the same file if it was interrupted.
 
         Args:
             download_url (str): Direct download URL to file.
@@ -69,6 +109,17 @@ class Downloader(QObject):
                 Name of downloaded file, only required if the server doesn't return it.
             progress_callback (Optional[ProgressCallback], optional):
                 Optional function or method to call with a ProgressUpdate. Defaults to None.
+            segments (int, optional):
+                Maximum number of segments that are downloaded in parallel if the
+                server supports range requests. Defaults to 1.
+            checksum (Optional[str], optional):
+                Expected checksum (see `HASH_ALGORITHM`) of the file, which is
+                calculated while downloading. Defaults to None.
+
+        Raises:
+            ValueError: when no file name is given and the server doesn't return one.
+            ChecksumMismatchError: when the checksum of the file does not match.
+            requests.RequestException: when the download failed repeatedly.
 
         Returns:
             Path: Path to downloaded file.
@@ -78,11 +129,19 @@ class Downloader(QObject):
         headers: dict[str, str] = {"User-Agent": self.user_agent}
 
         with req.Session() as session:
-            stream = session.get(
-                download_url, stream=True, headers=headers, timeout=self.TIMEOUT
-            )
+            adapter = req.adapters.HTTPAdapter(pool_maxsize=max(segments, 1))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(headers)
+
+            stream = session.get(download_url, stream=True, timeout=self.TIMEOUT)
+            stream.raise_for_status()
 
             total_size: int = int(stream.headers.get("Content-Length", "0"))
+            supports_ranges: bool = (
+                stream.headers.get("Accept-Ranges", "").lower() == "bytes"
+                and total_size > 0
+            )
 
             _content = stream.headers.get("Content-Disposition")
             if _content and file_name is None:
@@ -90,6 +149,7 @@ class Downloader(QObject):
 
             if file_name is None:
                 self.log.debug(f"Stream Headers: {stream.headers}")
+                stream.close()
                 raise ValueError("No filename given!")
 
             dl_path = dest_folder / file_name
@@ -106,6 +166,7 @@ class Downloader(QObject):
             if dl_path.is_file():
                 if dl_path.stat().st_size == total_size and total_size > 0:
                     self.log.info("File already downloaded.")
+                    stream.close()
                     return dl_path
                 else:
                     os.remove(dl_path)
@@ -113,30 +174,257 @@ class Downloader(QObject):
                         f"Removed already existing file from {str(dl_path)!r}!"
                     )
 
+            dest_folder.mkdir(parents=True, exist_ok=True)
+            ranges: list[tuple[int, Optional[int]]] = Downloader._split_range(
+                total_size, segments if supports_ranges else 1
+            )
+            part_paths: list[Path] = Downloader._prepare_part_files(
+                dl_path, ranges, supports_ranges
+            )
+            if len(ranges) > 1:
+                self.log.debug(f"Downloading in {len(ranges)} segment(s)...")
+
+            # Calculate the checksum while downloading if there is only one segment
+            hasher: Optional["hashlib._Hash"] = None
+            if checksum is not None and len(ranges) == 1:
+                hasher = hashlib.new(Downloader.HASH_ALGORITHM)
+                if part_paths[0].is_file():
+                    Downloader.__hash_file(part_paths[0], hasher)
+
             self.__running = True
-            current_size: int = 0
-            with dl_path.open("wb") as output_file:
-                for data in stream.iter_content(self.CHUNK_SIZE):
-                    if self.__running:
-                        output_file.write(data)
-                        current_size += len(data)
-                    else:
-                        break
+            self.__current_size = sum(
+                part_path.stat().st_size
+                for part_path in part_paths
+                if part_path.is_file()
+            )
+            if self.__current_size > 0:
+                self.log.info(f"Resuming download at {self.__current_size} byte(s)...")
+
+            # The initial response can only be reused for an unsplit download from
+            # the beginning
+            if len(ranges) > 1 or self.__current_size > 0:
+                stream.close()
+                initial_response = None
+            else:
+                initial_response = stream
+
+            with ThreadPoolExecutor(
+                max_workers=len(ranges), thread_name_prefix="Downloader"
+            ) as executor:
+                futures: list[Future[None]] = [
+                    executor.submit(
+                        self.__download_segment,
+                        session,
+                        stream.url,
+                        part_path,
+                        segment_range,
+                        initial_response if s == 0 else None,
+                        hasher,
+                    )
+                    for s, (part_path, segment_range) in enumerate(
+                        zip(part_paths, ranges)
+                    )
+                ]
 
+                pending: set[Future[None]] = set(futures)
+                while pending:
                     safe_run_callback(
                         progress_callback,
-                        ProgressUpdate(current=current_size, maximum=total_size),
+                        ProgressUpdate(current=self.__current_size, maximum=total_size),
                     )
+                    pending = wait(pending, timeout=self.PROGRESS_INTERVAL).not_done
 
-        if self.__running and current_size == total_size:
-            self.log.info("Download complete!")
+                for future in futures:
+                    future.result()
 
-        else:
-            self.log.warning("Download incomplete!")
-            os.remove(dl_path)
+            safe_run_callback(
+                progress_callback,
+                ProgressUpdate(current=self.__current_size, maximum=total_size),
+            )
+
+        if not self.__running or (total_size > 0 and self.__current_size != total_size):
+            self.log.warning(
+                "Download incomplete! The downloaded data is kept for resuming."
+            )
+            return dl_path
+
+        if len(part_paths) > 1 and checksum is not None:
+            hasher = hashlib.new(Downloader.HASH_ALGORITHM)
+        Downloader.__merge_part_files(part_paths, dl_path, hasher)
+
+        if checksum is not None and hasher is not None:
+            if hasher.hexdigest().lower() != checksum.lower():
+                os.remove(dl_path)
+                raise ChecksumMismatchError(file_name, checksum, hasher.hexdigest())
+
+            self.log.debug(f"Verified checksum of {file_name!r}.")
+
+        self.log.info("Download complete!")
 
         return dl_path
 
+    @staticmethod
+    def _split_range(total_size: int, segments: int) -> list[tuple[int, Optional[int]]]:
+        """
+        Splits a file into segments of at least `MIN_SEGMENT_SIZE`.
+
+        Args:
+            total_size (int): The size of the file or 0 if it is unknown.
+            segments (int): The maximum number of segments.
+
+        Returns:
+            list[tuple[int, Optional[int]]]:
+                Start and (inclusive) end positions of the segments. The end is None
+                if the file cannot be downloaded with range requests.
+        """
+
+        if total_size == 0 or segments <= 1:
+            return [(0, total_size - 1 if total_size > 0 else None)]
+
+        count: int = max(1, min(segments, total_size // Downloader.MIN_SEGMENT_SIZE))
+        segment_size: int = math.ceil(total_size / count)
+
+        return [
+            (start, min(start + segment_size, total_size) - 1)
+            for start in range(0, total_size, segment_size)
+        ]
+
+    @staticmethod
+    def _prepare_part_files(
+        dl_path: Path, ranges: list[tuple[int, Optional[int]]], resumable: bool
+    ) -> list[Path]:
+        """
+        Returns the paths of the part files for the specified segments and deletes
+        part files that cannot be resumed.
+
+        Args:
+            dl_path (Path): The path of the downloaded file.
+            ranges (list[tuple[int, Optional[int]]]): The segments.
+            resumable (bool): Whether existing part files can be resumed.
+
+        Returns:
+            list[Path]: The paths of the part files.
+        """
+
+        part_paths: list[Path]
+        if len(ranges) == 1:
+            part_paths = [dl_path.with_name(dl_path.name + ".part")]
+        else:
+            part_paths = [
+                dl_path.with_name(f"{dl_path.name}.{s + 1}-{len(ranges)}.part")
+                for s in range(len(ranges))
+            ]
+
+        for part_path, (start, end) in zip(part_paths, ranges):
+            if part_path.is_file() and (
+                not resumable
+                or end is None
+                or part_path.stat().st_size > end - start + 1
+            ):
+                os.remove(part_path)
+
+        # Delete part files of previous downloads with a different segmentation
+        pattern: str = glob.escape(dl_path.name) + ".*part"
+        for part_path in dl_path.parent.glob(pattern):
+            if part_path not in part_paths:
+                os.remove(part_path)
+
+        return part_paths
+
+    def __download_segment(
+        self,
+        session: "req.Session",
+        url: str,
+        part_path: Path,
+        segment_range: tuple[int, Optional[int]],
+        response: Optional["req.Response"],
+        hasher: Optional["hashlib._Hash"],
+    ) -> None:
+        start, end = segment_range
+        offset: int = part_path.stat().st_size if part_path.is_file() else 0
+        retries: int = 0
+
+        while self.__running and (end is None or start + offset <= end):
+            received: int = offset
+            try:
+                if response is None:
+                    response = session.get(
+                        url,
+                        stream=True,
+                        headers=(
+                            {"Range": f"bytes={start + offset}-{end}"}
+                            if end is not None
+                            else {}
+                        ),
+                        timeout=self.TIMEOUT,
+                    )
+                    response.raise_for_status()
+
+                    if end is not None and response.status_code != 206:
+                        response.close()
+                        raise ValueError(
+                            f"Server ignored range request for {str(part_path)!r}!"
+                        )
+
+                with response, part_path.open("ab") as part_file:
+                    for data in response.iter_content(self.CHUNK_SIZE):
+                        if not self.__running:
+                            break
+
+                        part_file.write(data)
+                        offset += len(data)
+                        if hasher is not None:
+                            hasher.update(data)
+
+                        with self.__progress_lock:
+                            self.__current_size += len(data)
+
+                response = None
+
+                if end is None:
+                    break
+
+                if offset == received and self.__running:
+                    raise req.ConnectionError(f"No data received at {start + offset}!")
+
+            except req.RequestException as ex:
+                response = None
+                retries += 1
+
+                if end is None or retries > self.MAX_RETRIES:
+                    raise
+
+                self.log.warning(
+                    f"Download of {part_path.name!r} interrupted at {offset} byte(s). "
+                    f"Resuming ({retries}/{self.MAX_RETRIES})... ({ex})"
+                )
+
+    @staticmethod
+    def __hash_file(path: Path, hasher: "hashlib._Hash") -> None:
+        with path.open("rb") as file:
+            while data := file.read(Downloader.CHUNK_SIZE):
+                hasher.update(data)
+
+    @staticmethod
+    def __merge_part_files(
+        part_paths: list[Path], dl_path: Path, hasher: Optional["hashlib._Hash"]
+    ) -> None:
+        if len(part_paths) > 1:
+            if hasher is not None:
+                Downloader.__hash_file(part_paths[0], hasher)
+
+            with part_paths[0].open("ab") as output_file:
+                for part_path in part_paths[1:]:
+                    with part_path.open("rb") as part_file:
+                        while data := part_file.read(Downloader.CHUNK_SIZE):
+                            output_file.write(data)
+                            if hasher is not None:
+                                hasher.update(data)
+
+                    os.remove(part_path)
+
+        part_paths[0].replace(dl_path)
+
     def __stop_download(self) -> None:
         self.__running = False
 
@@ -153,10 +441,17 @@ class Downloader(QObject):
         dest_folder: Path,
         file_name: Optional[str] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        segments: int = 1,
+        checksum: Optional[str] = None,
+        use_cache: bool = True,
     ) -> Path:
         """
         Downloads a single file from a given URL to a destination folder.
 
+        If a download cache is set (see `Downloader.cache`), a cached file of the URL
+        is hardlinked or copied to the destination folder instead and new downloads
+        are added to the cache.
+
         Args:
             url (str): URL of the file to download.
             dest_folder (Path): Folder where the downloaded file should be saved.
@@ -164,9 +459,47 @@ class Downloader(QObject):
                 Optional filename to use instead of the one in the URL. Defaults to None.
             progress_callback (Optional[ProgressCallback], optional):
                 Optional function or method to call with a ProgressUpdate. Defaults to None.
+            segments (int, optional):
+                Maximum number of segments that are downloaded in parallel.
+                Defaults to 1.
+            checksum (Optional[str], optional):
+                Expected checksum of the file. Defaults to None.
+            use_cache (bool, optional):
+                Whether to use the download cache, if set. Defaults to True.
 
         Returns:
             Path: Path to the downloaded file.
         """
 
-        return Downloader().download(url, dest_folder, file_name, progress_callback)
+        cache: Optional[DownloadCache] = Downloader.cache if use_cache else None
+
+        if cache is not None:
+            cached: Optional[tuple[Path, str]] = cache.get(url, checksum)
+
+            if cached is not None:
+                cached_file, cached_file_name = cached
+                dl_path: Path = dest_folder / (file_name or cached_file_name)
+                dest_folder.mkdir(parents=True, exist_ok=True)
+                dl_path.unlink(missing_ok=True)
+                DownloadCache.link_or_copy(cached_file, dl_path)
+
+                size: int = dl_path.stat().st_size
+                safe_run_callback(
+                    progress_callback, ProgressUpdate(current=size, maximum=size)
+                )
+
+                return dl_path
+
+        dl_path = Downloader().download(
+            url, dest_folder, file_name, progress_callback, segments, checksum
+        )
+
+        if cache is not None and dl_path.is_file():
+            try:
+                cache.put(url, dl_path)
+            except Exception as ex:
+                Downloader.log.warning(
+                    f"Failed to add {dl_path.name!r} to the cache: {ex}", exc_info=ex
+                )
+
+        return dl_path
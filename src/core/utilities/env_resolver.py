@@ -2,12 +2,171 @@
 Copyright (c) Cutleast
 """
 
+import os
 import re
-from os import getenv
+import threading
 from pathlib import Path
 from typing import Optional, overload
 
 
+class EnvResolver:
+    """
+    Class for resolving (environment) variables in paths and strings.
+
+    The patterns are compiled once per pair of variable indicators, the environment
+    is read once into a snapshot and the results are memoized per input and
+    additional variables. Use `EnvResolver.refresh()` after changing the
+    environment.
+    """
+
+    MAX_CACHED: int = 1024
+    """Maximum number of memoized results, the cache is cleared when exceeded."""
+
+    __patterns: dict[tuple[str, str], tuple[re.Pattern[str], re.Pattern[str]]]
+    __environ: Optional[dict[str, str]]
+    __results: dict[tuple[str | Path, tuple[str, str], frozenset], str | Path]
+    __lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.__patterns = {}
+        self.__environ = None
+        self.__results = {}
+        self.__lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """
+        Discards the environment snapshot and all memoized results.
+        """
+
+        with self.__lock:
+            self.__environ = None
+            self.__results.clear()
+
+    def resolve_path(
+        self, obj: Path, sep: tuple[str, str] = ("%", "%"), **vars: str
+    ) -> Path:
+        """
+        Resolves all (environment) variables in a path.
+
+        Args:
+            obj (Path): Path with (environment) variables
+            sep (tuple[str, str], optional): Variable indicators, for eg. `("{", "}")`
+            vars (str): Additional variables to resolve
+
+        Returns:
+            Path: Resolved real path
+        """
+
+        key = (obj, sep, frozenset(vars.items()))
+        result: Optional[str | Path] = self.__results.get(key)
+        if isinstance(result, Path):
+            return result
+
+        pattern: re.Pattern[str] = self.__get_patterns(sep)[0]
+        norm_vars: dict[str, str] = EnvResolver.__normalize_vars(vars)
+
+        parts: list[str] = []
+        for part in obj.parts:
+            match: Optional[re.Match[str]] = pattern.match(part)
+            var_value: Optional[str] = None
+            if match is not None:
+                var_value = self.__get_value(match.group(1), norm_vars)
+
+            parts.append(var_value if var_value is not None else part)
+
+        path: Path = Path().joinpath(*parts)
+        self.__store(key, path)
+
+        return path
+
+    def resolve_str(
+        self, obj: str, sep: tuple[str, str] = ("%", "%"), **vars: str
+    ) -> str:
+        """
+        Resolves all (environment) variables in a string.
+
+        Args:
+            obj (str): String with (environment) variables
+            sep (tuple[str, str], optional): Variable indicators, for eg. `("{", "}")`
+            vars (str): Additional variables to resolve
+
+        Returns:
+            str: Resolved string
+        """
+
+        key = (obj, sep, frozenset(vars.items()))
+        result: Optional[str | Path] = self.__results.get(key)
+        if isinstance(result, str):
+            return result
+
+        pattern: re.Pattern[str] = self.__get_patterns(sep)[1]
+        norm_vars: dict[str, str] = EnvResolver.__normalize_vars(vars)
+
+        def replace(match: re.Match[str]) -> str:
+            var_value: Optional[str] = self.__get_value(match.group(1), norm_vars)
+            return var_value if var_value is not None else match.group(0)
+
+        string: str = pattern.sub(replace, obj)
+        self.__store(key, string)
+
+        return string
+
+    def __get_patterns(
+        self, sep: tuple[str, str]
+    ) -> tuple[re.Pattern[str], re.Pattern[str]]:
+        """
+        Returns:
+            tuple[re.Pattern[str], re.Pattern[str]]:
+                The patterns for a whole path part and for a part of a string.
+        """
+
+        patterns: Optional[tuple[re.Pattern[str], re.Pattern[str]]] = (
+            self.__patterns.get(sep)
+        )
+
+        if patterns is None:
+            var: str = f"{re.escape(sep[0])}([a-zA-Z0-9_]*){re.escape(sep[1])}"
+            patterns = (re.compile(f"^{var}$"), re.compile(var))
+            self.__patterns[sep] = patterns
+
+        return patterns
+
+    def __get_value(self, var_name: str, norm_vars: dict[str, str]) -> Optional[str]:
+        var_value: Optional[str] = norm_vars.get(var_name.lower())
+
+        if var_value is None:
+            environ: Optional[dict[str, str]] = self.__environ
+            if environ is None:
+                # Environment variables are case-insensitive on Windows
+                environ = {key.lower(): value for key, value in os.environ.items()}
+                environ.update(os.environ)
+                self.__environ = environ
+
+            var_value = environ.get(var_name, environ.get(var_name.lower()))
+
+        return var_value
+
+    def __store(
+        self,
+        key: tuple[str | Path, tuple[str, str], frozenset],
+        result: str | Path,
+    ) -> None:
+        with self.__lock:
+            if len(self.__results) >= EnvResolver.MAX_CACHED:
+                self.__results.clear()
+
+            self.__results[key] = result
+
+    @staticmethod
+    def __normalize_vars(vars: dict[str, str]) -> dict[str, str]:
+        # Lower keys of additional vars (environment vars are already case-insensitive)
+        return {key.lower(): value for key, value in vars.items()}
+
+
+RESOLVER = EnvResolver()
+"""The resolver that is used by the functions of this module."""
+
+
 def resolve_path(obj: Path, sep: tuple[str, str] = ("%", "%"), **vars: str) -> Path:
     """
     Resolves all (environment) variables in a path.
@@ -21,25 +180,7 @@ def resolve_path(obj: Path, sep: tuple[str, str] = ("%", "%"), **vars: str) -> P
         Path: Resolved real path
     """
 
-    # Lower keys of additional vars (environment vars are already case-insensitive)
-    norm_vars: dict[str, str] = {key.lower(): value for key, value in vars.items()}
-
-    pattern: re.Pattern[str] = re.compile(f"^{sep[0]}([a-zA-Z0-9_]*){sep[1]}$")
-    parts: list[str] = []
-    for part in obj.parts:
-        match: Optional[re.Match[str]] = pattern.match(part)
-
-        if match is not None:
-            var_name: str = match.groups()[0]
-            var_value: Optional[str] = norm_vars.get(var_name.lower(), getenv(var_name))
-            if var_value is not None:
-                parts.append(var_value)
-            else:
-                parts.append(part)
-        else:
-            parts.append(part)
-
-    return Path().joinpath(*parts)
+    return RESOLVER.resolve_path(obj, sep, **vars)
 
 
 def resolve_str(obj: str, sep: tuple[str, str] = ("%", "%"), **vars: str) -> str:
@@ -55,18 +196,7 @@ def resolve_str(obj: str, sep: tuple[str, str] = ("%", "%"), **vars: str) -> str
         str: Resolved string
     """
 
-    # Lower keys of additional vars (environment vars are already case-insensitive)
-    norm_vars: dict[str, str] = {key.lower(): value for key, value in vars.items()}
-
-    pattern: re.Pattern[str] = re.compile(f"{sep[0]}([a-zA-Z0-9_]*){sep[1]}")
-    matches: list[re.Match[str]] = list(pattern.finditer(obj))
-    for match in matches:
-        var_name: str = match.groups()[0]
-        var_value: Optional[str] = norm_vars.get(var_name.lower(), getenv(var_name))
-        if var_value is not None:
-            obj = obj.replace(f"%{var_name}%", var_value, 1)
-
-    return obj
+    return RESOLVER.resolve_str(obj, sep, **vars)
 
 
 @overload
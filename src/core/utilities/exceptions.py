@@ -77,3 +77,20 @@ class SameSourceDestinationError(ExceptionBase):
         return QApplication.translate(
             "exceptions", "Source and destination must not be the same!"
         )
+
+
+class ChecksumMismatchError(ExceptionBase):
+    """
+    Exception when the checksum of a downloaded file does not match the expected one.
+    """
+
+    def __init__(self, file_name: str, expected: str, actual: str) -> None:
+        super().__init__(file_name, expected, actual)
+
+    @override
+    def getLocalizedMessage(self) -> str:
+        return QApplication.translate(
+            "exceptions",
+            "Checksum of downloaded file '{0}' does not match!\n"
+            "Expected: {1}\nActual: {2}",
+        )
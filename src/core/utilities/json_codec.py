@@ -0,0 +1,106 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import importlib
+import importlib.util
+import json
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import Any, override
+
+
+class JsonCodec(ABC):
+    """
+    Base class for encoding and decoding single JSON values, for eg. the values of a
+    database.
+
+    Unlike the comment-tolerant parser used for config files, codecs expect plain
+    JSON.
+    """
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """
+        Decodes a JSON value.
+
+        Args:
+            data (str | bytes): The encoded value.
+
+        Raises:
+            ValueError: When the data is not valid JSON.
+
+        Returns:
+            Any: The decoded value.
+        """
+
+    @abstractmethod
+    def dumps(self, value: Any) -> str:
+        """
+        Encodes a value as compact JSON.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            str: The encoded value.
+        """
+
+
+class StdJsonCodec(JsonCodec):
+    """
+    Codec using the C accelerated `json` module of the standard library.
+    """
+
+    @override
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    @override
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"))
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec using the optional `orjson` package.
+    """
+
+    __orjson: ModuleType
+
+    def __init__(self) -> None:
+        """
+        Raises:
+            ModuleNotFoundError: When `orjson` is not installed.
+        """
+
+        self.__orjson = importlib.import_module("orjson")
+
+    @override
+    def loads(self, data: str | bytes) -> Any:
+        return self.__orjson.loads(data)
+
+    @override
+    def dumps(self, value: Any) -> str:
+        return self.__orjson.dumps(value).decode()
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Returns:
+            bool: Whether `orjson` is installed.
+        """
+
+        return importlib.util.find_spec("orjson") is not None
+
+
+def get_default_codec() -> JsonCodec:
+    """
+    Returns:
+        JsonCodec: `OrjsonCodec` if `orjson` is installed, `StdJsonCodec` otherwise.
+    """
+
+    if OrjsonCodec.is_available():
+        return OrjsonCodec()
+
+    return StdJsonCodec()
@@ -0,0 +1,43 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import importlib.util
+import sys
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Optional
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Imports a module lazily. The module is registered in `sys.modules` right away but
+    only executed when one of its attributes is accessed for the first time.
+
+    This is meant for expensive optional backends (for eg. `requests` or `plyvel`)
+    that are not required for every run of the application.
+
+    Args:
+        name (str): Full name of the module, for eg. `plyvel`.
+
+    Raises:
+        ModuleNotFoundError: when the module does not exist.
+
+    Returns:
+        ModuleType: The (not yet executed) module.
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec: Optional[ModuleSpec] = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
@@ -5,11 +5,18 @@ Copyright (c) Cutleast
 import logging
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Generator, Optional
 
-import jstyleson as json
-import plyvel as ldb
-import pyuac
+from .json_codec import JsonCodec, get_default_codec
+from .lazy_import import lazy_import
+from .tracer import Span, Tracer
+
+if TYPE_CHECKING:
+    import plyvel as ldb
+    import pyuac
+else:
+    ldb = lazy_import("plyvel")
+    pyuac = lazy_import("pyuac")
 
 
 class LevelDB:
@@ -19,6 +26,11 @@ class LevelDB:
 
     log: logging.Logger = logging.getLogger("LevelDB")
 
+    codec: JsonCodec = get_default_codec()
+    """
+    Codec for the values of the database, which are plain JSON without comments.
+    """
+
     path: Path
     use_symlink: bool
     symlink_path: Optional[Path] = None
@@ -89,6 +101,7 @@ class LevelDB:
 
             self.log.debug("Symlink deleted.")
 
+    @Tracer.traced("leveldb.load")
     def load(self, prefix: Optional[str | bytes] = None) -> dict[str, Any]:
         """
         Loads all keys with a given prefix from the database.
@@ -109,19 +122,17 @@ class LevelDB:
 
         flat_data: dict[str, str] = {}
 
-        with ldb.DB(str(db_path)) as database:
-            if isinstance(prefix, str):
-                prefix = prefix.encode()
+        with Tracer.span("leveldb.read", prefix=str(prefix)) as span:
+            with ldb.DB(str(db_path)) as database:
+                LevelDB.__read_prefix(database, prefix, flat_data, span)
 
-            decoded_key: str
-            decoded_value: str
-            for key, value in database.iterator(prefix=prefix):
-                decoded_key, decoded_value = key.decode(), value.decode()
-                flat_data[decoded_key] = decoded_value
+            span.add("keys", len(flat_data))
 
+        Tracer.count("leveldb.keys_read", len(flat_data))
         self.log.debug(f"Parsing {len(flat_data)} key(s)...")
 
-        parsed = self.parse_flat_dict(flat_data)
+        with Tracer.span("leveldb.parse", keys=len(flat_data)):
+            parsed = self.parse_flat_dict(flat_data)
 
         self.log.debug("Parsing complete.")
 
@@ -129,32 +140,166 @@ class LevelDB:
 
         return parsed
 
-    def dump(self, data: dict, prefix: Optional[str | bytes] = None) -> None:
+    @Tracer.traced("leveldb.load_prefixes")
+    def load_prefixes(self, prefixes: list[str]) -> dict[str, Any]:
+        """
+        Loads all keys with one of the given prefixes from the database, for eg. the
+        keys of specific mods, with a single database handle.
+
+        **Creates a symlink to the database which has to be deleted by
+        calling del_symlink_path() after you're done!**
+
+        Args:
+            prefixes (list[str]): The prefixes to filter by.
+
+        Returns:
+            dict[str, Any]: Nested database structure containing the data.
+        """
+
+        db_path = self.get_symlink_path()
+
+        self.log.info(
+            f"Loading {len(prefixes)} prefix(es) from database {str(db_path)!r}..."
+        )
+
+        flat_data: dict[str, str] = {}
+
+        with Tracer.span("leveldb.read", prefixes=len(prefixes)) as span:
+            with ldb.DB(str(db_path)) as database:
+                for prefix in prefixes:
+                    LevelDB.__read_prefix(database, prefix, flat_data, span)
+
+            span.add("keys", len(flat_data))
+
+        Tracer.count("leveldb.keys_read", len(flat_data))
+
+        with Tracer.span("leveldb.parse", keys=len(flat_data)):
+            parsed = self.parse_flat_dict(flat_data)
+
+        self.log.info("Loaded keys from database.")
+
+        return parsed
+
+    def iter_prefix(
+        self, prefix: Optional[str | bytes] = None
+    ) -> Generator[tuple[tuple[str, ...], Any], None, None]:
+        """
+        Iterates over all keys with a given prefix without loading them into memory
+        at once. The database is closed when the iteration is finished or the
+        generator is closed.
+
+        **Creates a symlink to the database which has to be deleted by
+        calling del_symlink_path() after you're done!**
+
+        Args:
+            prefix (str | bytes, optional): The prefix to filter by. Defaults to None.
+
+        Yields:
+            tuple[tuple[str, ...], Any]:
+                The parts of each key (split at `###`) and its deserialized value.
+        """
+
+        db_path = self.get_symlink_path()
+
+        if isinstance(prefix, str):
+            prefix = prefix.encode()
+
+        keys: int = 0
+        with ldb.DB(str(db_path)) as database:
+            for key, value in database.iterator(prefix=prefix):
+                decoded_key: str = key.decode()
+                try:
+                    decoded_value: Any = LevelDB.codec.loads(value)
+                except ValueError:
+                    LevelDB.log.warning(f"Failed to process key: {decoded_key:20}...")
+                    continue
+
+                keys += 1
+                yield tuple(decoded_key.strip().split("###")), decoded_value
+
+        Tracer.count("leveldb.keys_read", keys)
+
+    @staticmethod
+    def __read_prefix(
+        database: "ldb.DB",
+        prefix: Optional[str | bytes],
+        flat_data: dict[str, str],
+        span: Span,
+    ) -> None:
+        if isinstance(prefix, str):
+            prefix = prefix.encode()
+
+        for key, value in database.iterator(prefix=prefix):
+            flat_data[key.decode()] = value.decode()
+            span.add("bytes", len(key) + len(value))
+
+    @Tracer.traced("leveldb.dump")
+    def dump(
+        self,
+        data: dict,
+        prefix: Optional[str | bytes] = None,
+        original: Optional[dict] = None,
+    ) -> None:
         """
         Dumps the given data to the database.
 
+        If the originally loaded data is specified, only the keys that were added or
+        changed are written and the keys that were removed are deleted.
+
         Args:
             data (dict): The data to dump.
             prefix (str | bytes, optional):
                 The prefix for the flattened keys. Defaults to the database's root.
+            original (Optional[dict], optional):
+                The data as it was loaded from the database with the same prefix.
+                Defaults to None.
         """
 
         db_path = self.get_symlink_path()
 
-        flat_dict: dict[str, str] = LevelDB.flatten_nested_dict(data)
+        with Tracer.span("leveldb.serialize"):
+            flat_dict: dict[str, str] = LevelDB.flatten_nested_dict(data)
+            deleted_keys: list[str] = []
+
+            if original is not None:
+                original_flat_dict: dict[str, str] = LevelDB.flatten_nested_dict(
+                    original
+                )
+                deleted_keys = [
+                    key for key in original_flat_dict if key not in flat_dict
+                ]
+                flat_dict = {
+                    key: value
+                    for key, value in flat_dict.items()
+                    if original_flat_dict.get(key) != value
+                }
 
         if isinstance(prefix, str):
             prefix = prefix.encode()
 
         self.log.info(f"Saving keys to {str(db_path)!r}...")
 
-        with ldb.DB(str(db_path)) as database:
-            with database.write_batch() as batch:
-                for key, value in flat_dict.items():
-                    batch.put(((prefix or b"") + key.encode()), value.encode())
+        with Tracer.span("leveldb.write", prefix=(prefix or b"").decode()) as span:
+            with ldb.DB(str(db_path)) as database:
+                with database.write_batch() as batch:
+                    for key, value in flat_dict.items():
+                        encoded_key: bytes = (prefix or b"") + key.encode()
+                        encoded_value: bytes = value.encode()
+                        batch.put(encoded_key, encoded_value)
+                        span.add("bytes", len(encoded_key) + len(encoded_value))
+
+                    for key in deleted_keys:
+                        batch.delete((prefix or b"") + key.encode())
+
+            span.add("keys", len(flat_dict))
+            span.add("deleted_keys", len(deleted_keys))
+
+        Tracer.count("leveldb.keys_written", len(flat_dict))
+        Tracer.count("leveldb.keys_deleted", len(deleted_keys))
 
         self.log.info("Saved keys to database.")
 
+    @Tracer.traced("leveldb.set_key")
     def set_key(self, key: str, value: str) -> None:
         """
         Sets the value of a single key.
@@ -169,12 +314,13 @@ class LevelDB:
         self.log.info(f"Saving key to {str(db_path)!r}...")
 
         with ldb.DB(str(db_path)) as database:
-            database.put(key.encode(), json.dumps(value).encode())
+            database.put(key.encode(), LevelDB.codec.dumps(value).encode())
 
         self.log.info("Saved key to database.")
 
         self.del_symlink_path()
 
+    @Tracer.traced("leveldb.get_key")
     def get_key(self, key: str) -> Any:
         """
         Gets the value of a single key.
@@ -195,7 +341,7 @@ class LevelDB:
 
         data: Optional[Any] = None
         if value is not None:
-            data = json.loads(value.decode())
+            data = LevelDB.codec.loads(value)
 
         self.log.info("Loaded key from database.")
 
@@ -226,7 +372,7 @@ class LevelDB:
                 if isinstance(value, dict):
                     flatten_dict_helper(value, prefix + key + "###")
                 else:
-                    flat_dict[prefix + key] = json.dumps(value, separators=(",", ":"))
+                    flat_dict[prefix + key] = LevelDB.codec.dumps(value)
 
         flatten_dict_helper(nested_dict)
 
@@ -260,7 +406,7 @@ class LevelDB:
                     if key not in current:
                         current[key] = {}
                     current: dict[str, dict] = current[key]
-                value = json.loads(value)
+                value = LevelDB.codec.loads(value)
                 current[keys[-1]] = value
             except ValueError:
                 LevelDB.log.warning(f"Failed to process key: {keys:20}...")
@@ -2,11 +2,15 @@
 Copyright (c) Cutleast
 """
 
+import atexit
 import logging
 import os
+import queue
 import re
 import sys
+import threading
 import time
+from collections import deque
 from datetime import datetime
 from functools import wraps
 from io import TextIOWrapper
@@ -21,11 +25,26 @@ class Logger(logging.Logger):
     """
     Class for application logging. Copies all logging messages from
     `sys.stdout` and `sys.stderr` to a file and executes a callback with the new message.
+
+    Log records and written strings are only put into a queue by the calling thread.
+    A background thread formats them and writes them in batches to the file, to
+    stdout and to a bounded buffer for `get_content()`.
     """
 
-    __lines: list[str]
+    BUFFER_SIZE: int = 10_000
+    """Maximum number of messages that are kept in memory for `get_content()`."""
+
+    BATCH_SIZE: int = 1000
+    """Maximum number of messages that are written at once."""
+
+    __lines: deque[str]
+    __lines_lock: threading.Lock
     __root_logger: logging.Logger
-    __log_handler: logging.StreamHandler
+    __log_handler: "Logger.QueueHandler"
+    __formatter: logging.Formatter
+
+    __queue: queue.SimpleQueue[logging.LogRecord | str | threading.Event | None]
+    __writer_thread: threading.Thread
 
     __stdout: Optional[TextIO] = None
     __stderr: Optional[TextIO] = None
@@ -53,6 +72,33 @@ class Logger(logging.Logger):
         CRITICAL = "CRITICAL"
         """Critical log level"""
 
+    class QueueHandler(logging.Handler):
+        """
+        Logging handler that puts the records into the queue of the logger without
+        formatting them.
+        """
+
+        __queue: queue.SimpleQueue[logging.LogRecord | str | threading.Event | None]
+
+        def __init__(
+            self,
+            record_queue: queue.SimpleQueue[
+                logging.LogRecord | str | threading.Event | None
+            ],
+        ) -> None:
+            super().__init__()
+
+            self.__queue = record_queue
+
+        @override
+        def emit(self, record: logging.LogRecord) -> None:
+            if record.args:
+                # Merge the arguments now as they might be changed later
+                record.msg = record.getMessage()
+                record.args = None
+
+            self.__queue.put(record)
+
     def __init__(
         self, log_file: Path, fmt: str | None = None, date_fmt: str | None = None
     ) -> None:
@@ -64,13 +110,20 @@ class Logger(logging.Logger):
         self.__log_file_path = log_file
         self.__log_file = log_file.open("a", encoding="utf8")
 
+        self.__lines = deque(maxlen=Logger.BUFFER_SIZE)
+        self.__lines_lock = threading.Lock()
+        self.__queue = queue.SimpleQueue()
+        self.__writer_thread = threading.Thread(
+            target=self.__write_queue, name="LogWriter", daemon=True
+        )
+        self.__writer_thread.start()
+        atexit.register(self.close)
+
         self.__root_logger = logging.getLogger()
-        formatter = logging.Formatter(fmt, date_fmt)
-        self.__log_handler = logging.StreamHandler(self)
-        self.__log_handler.setFormatter(formatter)
+        self.__formatter = logging.Formatter(fmt, date_fmt)
+        self.__log_handler = Logger.QueueHandler(self.__queue)
         self.__root_logger.addHandler(self.__log_handler)
         self.addHandler(self.__log_handler)
-        self.__lines = []
 
         self.open()
 
@@ -136,46 +189,123 @@ class Logger(logging.Logger):
             os.remove(log_files.pop(0))
 
     def close(self) -> None:
+        """
+        Writes all pending messages, stops the background thread and closes the log
+        file.
+        """
+
+        if self.__log_file.closed:
+            return
+
         sys.stdout = self.__stdout
         sys.stderr = self.__stderr
+        self.__root_logger.removeHandler(self.__log_handler)
+        self.removeHandler(self.__log_handler)
+
+        self.__queue.put(None)
+        self.__writer_thread.join()
         self.__log_file.close()
 
     def write(self, string: str) -> None:
         """
-        Writes a string to stdout and calls callback with string as argument
+        Queues a string to be written to the log file and to stdout and to be passed
+        to the callback.
 
         Args:
             string (str): Message.
         """
 
-        try:
-            self.__lines.append(string)
-            self.__log_file.write(string)
-            if self.__stdout is not None:
-                self.__stdout.write(string)
-        except Exception as ex:
-            if self.__stdout is not None:
-                self.__stdout.write(f"Logging error occured: {str(ex)}")
-
-        if self.__callback is not None:
-            self.__callback(string)
+        self.__queue.put(string)
 
     def flush(self) -> None:
         """
-        Flushes file.
+        Waits until all queued messages are written and flushes the file.
         """
 
-        self.__log_file.flush()
+        if (
+            threading.current_thread() is self.__writer_thread
+            or not self.__writer_thread.is_alive()
+        ):
+            return
+
+        written = threading.Event()
+        self.__queue.put(written)
+        written.wait()
+
+    def __write_queue(self) -> None:
+        """
+        Writes the queued messages in batches until `None` is queued.
+        """
+
+        running: bool = True
+        while running:
+            batch: list[logging.LogRecord | str | threading.Event | None] = [
+                self.__queue.get()
+            ]
+            while len(batch) < Logger.BATCH_SIZE:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            messages: list[str] = []
+            events: list[threading.Event] = []
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                elif isinstance(item, logging.LogRecord):
+                    messages.append(self.__format(item))
+                elif item:
+                    messages.append(item)
+
+            self.__write_messages(messages)
+
+            for event in events:
+                event.set()
+
+    def __format(self, record: logging.LogRecord) -> str:
+        try:
+            return self.__formatter.format(record) + "\n"
+        except Exception as ex:
+            return f"Logging error occured: {str(ex)}\n"
+
+    def __write_messages(self, messages: list[str]) -> None:
+        if messages:
+            text: str = "".join(messages)
+
+            try:
+                with self.__lines_lock:
+                    self.__lines.extend(messages)
+                self.__log_file.write(text)
+                self.__log_file.flush()
+                if self.__stdout is not None:
+                    self.__stdout.write(text)
+            except Exception as ex:
+                if self.__stdout is not None:
+                    self.__stdout.write(f"Logging error occured: {str(ex)}")
+
+            if self.__callback is not None:
+                for message in messages:
+                    try:
+                        self.__callback(message)
+                    except Exception:
+                        pass
 
     def get_content(self) -> str:
         """
-        Returns content of current log as string.
+        Returns the content of the current log as string. Only the last
+        `BUFFER_SIZE` messages are kept in memory.
 
         Returns:
             str: Content of current log.
         """
 
-        return "".join(self.__lines)
+        self.flush()
+
+        with self.__lines_lock:
+            return "".join(self.__lines)
 
     def get_file_path(self) -> Path:
         """
@@ -0,0 +1,169 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class PathProber(QObject):
+    """
+    Class for checking in background threads whether files exist, so that slow or
+    disconnected network drives do not block the GUI.
+
+    All probers share a bounded thread pool. Each prober submits its paths from its
+    own queue and only has up to `MAX_WORKERS` of them in the pool at a time, so one
+    prober can't flood the pool for the others. Results are collected and emitted
+    by a timer in the GUI thread, which stops when the prober is deleted.
+
+    The results are cached per path for the whole session. Paths that are not
+    checked within `TIMEOUT` after they were submitted are reported as missing.
+    Paths that are still waiting for a free thread, for eg. because other checks
+    hang on a disconnected network drive, are cancelled then. Paths that are
+    already being checked are reported again when their actual result arrives.
+    """
+
+    log: logging.Logger = logging.getLogger("PathProber")
+
+    TIMEOUT: float = 3.0
+    """Time in seconds after which pending paths are reported as missing."""
+
+    MAX_WORKERS: int = 8
+    """Maximum number of paths that are checked at the same time."""
+
+    POLL_INTERVAL: int = 50
+    """Interval in milliseconds in which results are collected."""
+
+    path_probed = Signal(object, bool)
+    """
+    This signal gets emitted when a path was checked or timed out with the path and
+    whether it is an existing file.
+    """
+
+    __cache: dict[Path, bool] = {}
+    __cache_lock: threading.Lock = threading.Lock()
+    __executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=MAX_WORKERS, thread_name_prefix="PathProber"
+    )
+
+    __queue: deque[Path]
+    __pending: dict[Path, Future[bool]]
+    __start_times: dict[Path, float]
+    __timed_out: set[Path]
+    __timer: QTimer
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+
+        self.__queue = deque()
+        self.__pending = {}
+        self.__start_times = {}
+        self.__timed_out = set()
+
+        self.__timer = QTimer(self)
+        self.__timer.setInterval(PathProber.POLL_INTERVAL)
+        self.__timer.timeout.connect(self.__poll)
+
+    @staticmethod
+    def get_cached(path: Path) -> Optional[bool]:
+        """
+        Args:
+            path (Path): The path.
+
+        Returns:
+            Optional[bool]:
+                Whether the path is an existing file or None if it was not checked
+                yet.
+        """
+
+        with PathProber.__cache_lock:
+            return PathProber.__cache.get(path)
+
+    def probe(self, paths: Iterable[Path]) -> None:
+        """
+        Starts checking the specified paths. Paths that are already cached, queued
+        or pending are skipped.
+
+        Args:
+            paths (Iterable[Path]): The paths to check.
+        """
+
+        queued_paths: set[Path] = set(self.__queue)
+        new_paths: list[Path] = [
+            path
+            for path in dict.fromkeys(paths)
+            if path not in self.__pending
+            and path not in queued_paths
+            and PathProber.get_cached(path) is None
+        ]
+
+        if not new_paths:
+            return
+
+        self.log.debug(f"Checking {len(new_paths)} path(s) in the background...")
+        self.__queue.extend(new_paths)
+        self.__submit()
+        self.__timer.start()
+
+    def __submit(self) -> None:
+        # Timed out checks that are still running don't count towards the limit,
+        # timed out checks that didn't start yet were cancelled
+        while self.__queue and (
+            len(self.__pending) - len(self.__timed_out) < PathProber.MAX_WORKERS
+        ):
+            path: Path = self.__queue.popleft()
+            self.__pending[path] = PathProber.__executor.submit(
+                PathProber.__probe_path, path
+            )
+            self.__start_times[path] = time.monotonic()
+
+    def __poll(self) -> None:
+        now: float = time.monotonic()
+
+        for path, future in list(self.__pending.items()):
+            if future.done():
+                del self.__pending[path]
+                self.__start_times.pop(path, None)
+                self.__timed_out.discard(path)
+                self.path_probed.emit(path, future.result())
+
+            elif (
+                path not in self.__timed_out
+                and now - self.__start_times[path] >= PathProber.TIMEOUT
+            ):
+                self.log.warning(
+                    f"Checking {str(path)!r} timed out after {PathProber.TIMEOUT}s."
+                )
+
+                if future.cancel():
+                    del self.__pending[path]
+                    del self.__start_times[path]
+                else:
+                    self.__timed_out.add(path)
+
+                self.path_probed.emit(path, False)
+
+        self.__submit()
+
+        if not self.__pending and not self.__queue:
+            self.__timer.stop()
+
+    @staticmethod
+    def __probe_path(path: Path) -> bool:
+        try:
+            exists: bool = path.is_file()
+        except OSError as ex:
+            PathProber.log.warning(f"Failed to check {str(path)!r}: {ex}")
+            exists = False
+
+        with PathProber.__cache_lock:
+            PathProber.__cache[path] = exists
+
+        return exists
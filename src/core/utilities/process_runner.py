@@ -19,22 +19,20 @@ def run_process(command: list[str]) -> None:
         RuntimeError: when the process returns a non-zero exit code.
     """
 
-    output: str = ""
-
     with subprocess.Popen(
         command,
-        shell=True,
-        stdin=subprocess.PIPE,
+        stdin=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
         encoding="utf8",
         errors="ignore",
     ) as process:
-        if process.stderr is not None:
-            output = process.stderr.read()
+        # Read both pipes at once as a full pipe would block the process
+        stdout, stderr = process.communicate()
 
     if process.returncode:
         log.debug(f"Command: {command}")
-        log.error(output)
+        log.debug(stdout)
+        log.error(stderr)
         raise RuntimeError(f"Process returned non-zero exit code: {process.returncode}")
@@ -0,0 +1,69 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import Any, Optional
+
+
+class ProgressAggregator:
+    """
+    Channel for coalescing frequent progress updates of a worker thread.
+
+    The worker thread only stores the latest value of each field and increments a
+    counter, which is cheap enough to be done for every single file. A reader (for
+    eg. a GUI timer) polls a snapshot of all fields at a fixed rate and receives it
+    only if there were updates since its last poll. Intermediate updates are dropped,
+    which is fine since only the latest state is visible.
+
+    This class does not use locks. Copying the state is atomic due to the GIL and a
+    torn snapshot between two fields is corrected by the next poll.
+    """
+
+    __state: dict[str, Any]
+    __version: int
+    __polled_version: int
+
+    def __init__(self) -> None:
+        self.__state = {}
+        self.__version = 0
+        self.__polled_version = 0
+
+    def update(self, **fields: Any) -> None:
+        """
+        Updates the specified fields. Fields with a value of `None` are ignored and
+        keep their previous value.
+
+        Args:
+            **fields (Any): The fields to update.
+        """
+
+        for key, value in fields.items():
+            if value is not None:
+                self.__state[key] = value
+
+        self.__version += 1
+
+    def poll(self) -> Optional[dict[str, Any]]:
+        """
+        Returns a snapshot of the latest values of all fields if there were updates
+        since the last poll.
+
+        Returns:
+            Optional[dict[str, Any]]: Snapshot of all fields or None.
+        """
+
+        version: int = self.__version
+        if version == self.__polled_version:
+            return None
+
+        self.__polled_version = version
+
+        return self.__state.copy()
+
+    @property
+    def update_count(self) -> int:
+        """
+        Total number of updates that were written to this channel.
+        """
+
+        return self.__version
@@ -0,0 +1,87 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import Iterable, Optional
+
+
+class SearchIndex[T]:
+    """
+    Index for repeatedly filtering a fixed collection of items by a search text,
+    with the same semantics as `core.utilities.filter.matches_filter()`.
+
+    The searchable texts of all items are normalized once when the index is created.
+    If a search text extends the previous one, only the items that matched the
+    previous search are checked again.
+    """
+
+    SEPARATOR: str = "\n"
+    """
+    Separator for joining the texts of an item, so that a search text cannot match
+    across the boundary of two texts.
+    """
+
+    __items: list[T]
+    __texts: list[str]
+    __lower_texts: list[str]
+
+    __last_filter: Optional[tuple[str, bool]]
+    __last_matches: list[int]
+
+    def __init__(self, items: Iterable[tuple[T, list[str]]]) -> None:
+        """
+        Args:
+            items (Iterable[tuple[T, list[str]]]):
+                Items and their searchable texts. An item matches a search text if
+                any of its texts matches.
+        """
+
+        self.__items = []
+        self.__texts = []
+        for item, texts in items:
+            self.__items.append(item)
+            self.__texts.append(
+                SearchIndex.SEPARATOR.join(text.strip() for text in texts)
+            )
+        self.__lower_texts = [text.lower() for text in self.__texts]
+
+        self.__last_filter = None
+        self.__last_matches = list(range(len(self.__items)))
+
+    def search(self, text: Optional[str], case_sensitive: bool = False) -> list[T]:
+        """
+        Searches the index.
+
+        Args:
+            text (Optional[str]): Search text.
+            case_sensitive (bool, optional): Case sensitivity. Defaults to False.
+
+        Returns:
+            list[T]: Matching items in their original order.
+        """
+
+        filter: str = (text or "").strip()
+        if not case_sensitive:
+            filter = filter.lower()
+
+        candidates: list[int]
+        if (
+            self.__last_filter is not None
+            and self.__last_filter[1] == case_sensitive
+            and self.__last_filter[0] in filter
+        ):
+            # Every item that matches the new filter also matched the previous one
+            candidates = self.__last_matches
+        else:
+            candidates = list(range(len(self.__items)))
+
+        texts: list[str] = self.__texts if case_sensitive else self.__lower_texts
+        matches: list[int] = [i for i in candidates if filter in texts[i]]
+
+        self.__last_filter = (filter, case_sensitive)
+        self.__last_matches = matches
+
+        return [self.__items[i] for i in matches]
+
+    def __len__(self) -> int:
+        return len(self.__items)
@@ -0,0 +1,215 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Generator, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class StartupScheduler(QObject):
+    """
+    Class for measuring the startup phases of the application and for running
+    non-critical startup tasks after the main window is shown.
+
+    Deferred tasks run one after another in the main thread once the event loop is
+    running, so that the window can be painted in between. Background tasks run in
+    daemon threads and pass their results to an optional callback that is called in
+    the main thread. A timing breakdown is logged when all tasks are done.
+    """
+
+    log: logging.Logger = logging.getLogger("StartupScheduler")
+
+    background_task_finished = Signal(str, object, float)
+    """
+    This signal gets emitted from a background thread when a background task is done
+    with its name, its return value (or the raised exception) and its duration in
+    seconds.
+    """
+
+    __start_time: float
+    __ready_time: Optional[float]
+    __timings: list[tuple[str, str, float]]
+    __deferred_tasks: list[tuple[str, Callable[[], Any]]]
+    __background_tasks: list[tuple[str, Callable[[], Any]]]
+    __callbacks: dict[str, Callable[[Any], Any]]
+    __pending_tasks: int
+
+    def __init__(self, start_time: Optional[float] = None) -> None:
+        """
+        Args:
+            start_time (Optional[float], optional):
+                Start time of the application as returned by `time.perf_counter()`.
+                Defaults to now.
+        """
+
+        super().__init__()
+
+        self.__start_time = (
+            start_time if start_time is not None else time.perf_counter()
+        )
+        self.__ready_time = None
+        self.__timings = []
+        self.__deferred_tasks = []
+        self.__background_tasks = []
+        self.__callbacks = {}
+        self.__pending_tasks = 0
+
+        self.background_task_finished.connect(self.__on_background_task_finished)
+
+    @contextmanager
+    def measure(self, name: str) -> Generator[None, None, None]:
+        """
+        Context manager for measuring a synchronous startup phase.
+
+        Args:
+            name (str): Name of the phase.
+        """
+
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__timings.append(("startup", name, time.perf_counter() - start))
+
+    def defer(self, name: str, task: Callable[[], Any]) -> None:
+        """
+        Schedules a task to run in the main thread after the scheduler was started.
+
+        Args:
+            name (str): Name of the task.
+            task (Callable[[], Any]): The task.
+        """
+
+        self.__deferred_tasks.append((name, task))
+        self.__pending_tasks += 1
+
+    def run_in_background[T](
+        self,
+        name: str,
+        task: Callable[[], T],
+        callback: Optional[Callable[[T], Any]] = None,
+    ) -> None:
+        """
+        Schedules a task to run in a background thread after the scheduler was
+        started. The task must not create or access any widgets.
+
+        Args:
+            name (str): Name of the task.
+            task (Callable[[], T]): The task.
+            callback (Optional[Callable[[T], Any]], optional):
+                Function that is called with the return value of the task in the
+                main thread. Defaults to None.
+        """
+
+        self.__background_tasks.append((name, task))
+        if callback is not None:
+            self.__callbacks[name] = callback
+        self.__pending_tasks += 1
+
+    def start(self) -> None:
+        """
+        Marks the application as ready and starts all scheduled tasks.
+        Should be called after the main window is shown.
+        """
+
+        self.__ready_time = time.perf_counter() - self.__start_time
+        self.log.info(f"Main window shown after {self.__ready_time * 1000:.1f} ms.")
+
+        for name, task in self.__background_tasks:
+            threading.Thread(
+                target=self.__run_background_task,
+                args=(name, task),
+                name=f"StartupScheduler-{name}",
+                daemon=True,
+            ).start()
+        self.__background_tasks.clear()
+
+        QTimer.singleShot(0, self.__run_next_deferred_task)
+
+        if not self.__pending_tasks:
+            self.log_timings()
+
+    def __run_next_deferred_task(self) -> None:
+        if not self.__deferred_tasks:
+            return
+
+        name, task = self.__deferred_tasks.pop(0)
+        start: float = time.perf_counter()
+        try:
+            task()
+        except Exception as ex:
+            self.log.warning(f"Startup task {name!r} failed: {ex}", exc_info=ex)
+        self.__timings.append(("deferred", name, time.perf_counter() - start))
+
+        # Give the event loop a chance to process other events before the next task
+        QTimer.singleShot(0, self.__run_next_deferred_task)
+        self.__task_done()
+
+    def __run_background_task(self, name: str, task: Callable[[], Any]) -> None:
+        start: float = time.perf_counter()
+        result: Any
+        try:
+            result = task()
+        except Exception as ex:
+            result = ex
+
+        self.background_task_finished.emit(name, result, time.perf_counter() - start)
+
+    def __on_background_task_finished(
+        self, name: str, result: Any, duration: float
+    ) -> None:
+        self.__timings.append(("background", name, duration))
+
+        if isinstance(result, Exception):
+            self.log.warning(f"Startup task {name!r} failed: {result}", exc_info=result)
+        elif name in self.__callbacks:
+            try:
+                self.__callbacks.pop(name)(result)
+            except Exception as ex:
+                self.log.warning(
+                    f"Callback of startup task {name!r} failed: {ex}", exc_info=ex
+                )
+
+        self.__task_done()
+
+    def __task_done(self) -> None:
+        self.__pending_tasks -= 1
+
+        if not self.__pending_tasks:
+            self.log_timings()
+
+    def get_timings(self) -> list[tuple[str, str, float]]:
+        """
+        Returns:
+            list[tuple[str, str, float]]:
+                List of the kind (`startup`, `deferred` or `background`), name and
+                duration in seconds of all measured phases and finished tasks.
+        """
+
+        return self.__timings.copy()
+
+    @property
+    def ready_time(self) -> Optional[float]:
+        """
+        Time in seconds from the application start until the main window was shown
+        or None if the scheduler has not been started yet.
+        """
+
+        return self.__ready_time
+
+    def log_timings(self) -> None:
+        """
+        Logs the timing breakdown of the startup.
+        """
+
+        self.log.info("Startup timing breakdown:")
+        for kind, name, duration in self.__timings:
+            self.log.info(f"  {kind:<10} {name:<20} {duration * 1000:>9.1f} ms")
+
+        total: float = time.perf_counter() - self.__start_time
+        self.log.info(f"All startup tasks finished after {total * 1000:.1f} ms.")
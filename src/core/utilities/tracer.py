@@ -0,0 +1,277 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Optional
+
+
+class Span:
+    """
+    Context manager for a named and timed section of code.
+    Additional values like processed files or bytes can be added while the span is
+    active and are included in the trace.
+    """
+
+    name: str
+    """Name of the span, for eg. `migrate.transfer`."""
+
+    args: dict[str, Any]
+    """Additional values of the span."""
+
+    __start: int
+
+    def __init__(self, name: str, args: dict[str, Any]) -> None:
+        self.name = name
+        self.args = args
+
+    def add(self, key: str, value: int | float = 1) -> None:
+        """
+        Adds a value to a numeric value of this span.
+
+        Args:
+            key (str): Name of the value, for eg. `bytes`.
+            value (int | float, optional): Value to add. Defaults to 1.
+        """
+
+        self.args[key] = self.args.get(key, 0) + value
+
+    def __enter__(self) -> Span:
+        self.__start = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self.args["exception"] = exc_type.__name__
+
+        Tracer._add_span(self, self.__start, time.perf_counter_ns())
+
+
+class _NoSpan(Span):
+    """
+    Span that does nothing, used when tracing is disabled.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("", {})
+
+    def add(self, key: str, value: int | float = 1) -> None:
+        pass
+
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+
+class Tracer:
+    """
+    Class for lightweight instrumentation of hot paths with named spans and counters.
+
+    Tracing is disabled by default and can be switched on and off at runtime. When it
+    is disabled, spans and counters are no-ops. The recorded trace can be exported
+    as JSON in the Trace Event Format, which can be opened with tools like
+    `chrome://tracing` or Perfetto, and contains a summary with the total times,
+    values and counters per name.
+    """
+
+    log: logging.Logger = logging.getLogger("Tracer")
+
+    __enabled: bool = False
+    __events: list[dict[str, Any]] = []
+    __counters: dict[str, int | float] = {}
+    __counters_lock: threading.Lock = threading.Lock()
+    __origin: int = time.perf_counter_ns()
+    __no_span: Span = _NoSpan()
+
+    @classmethod
+    def set_enabled(cls, enabled: bool) -> None:
+        """
+        Enables or disables tracing.
+
+        Args:
+            enabled (bool): Whether tracing is enabled.
+        """
+
+        if enabled != cls.__enabled:
+            cls.log.info(f"Tracing {'enabled' if enabled else 'disabled'}.")
+
+        cls.__enabled = enabled
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """
+        Returns:
+            bool: Whether tracing is enabled.
+        """
+
+        return cls.__enabled
+
+    @classmethod
+    def span(cls, name: str, **args: Any) -> Span:
+        """
+        Creates a span that measures the time of a `with` block. Spans can be nested.
+
+        Example:
+        ```
+        with Tracer.span("migrate.transfer", mod=mod.display_name) as span:
+            span.add("bytes", file_size)
+        ```
+
+        Args:
+            name (str): Name of the span.
+            **args (Any): Additional values of the span.
+
+        Returns:
+            Span: The span.
+        """
+
+        if not cls.__enabled:
+            return cls.__no_span
+
+        return Span(name, args)
+
+    @classmethod
+    def count(cls, name: str, value: int | float = 1) -> None:
+        """
+        Adds a value to a global counter.
+
+        Args:
+            name (str): Name of the counter, for eg. `leveldb.keys_read`.
+            value (int | float, optional): Value to add. Defaults to 1.
+        """
+
+        if cls.__enabled:
+            with cls.__counters_lock:
+                cls.__counters[name] = cls.__counters.get(name, 0) + value
+
+    @classmethod
+    def traced[**P, R](
+        cls, name: Optional[str] = None
+    ) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """
+        Decorator that wraps all calls of a function in a span.
+
+        Args:
+            name (Optional[str], optional):
+                Name of the span. Defaults to the qualified name of the function.
+
+        Returns:
+            Callable[[Callable[P, R]], Callable[P, R]]: Decorator
+        """
+
+        def decorator(func: Callable[P, R]) -> Callable[P, R]:
+            span_name: str = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                if not cls.__enabled:
+                    return func(*args, **kwargs)
+
+                with Span(span_name, {}):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @classmethod
+    def _add_span(cls, span: Span, start: int, end: int) -> None:
+        cls.__events.append(
+            {
+                "name": span.name,
+                "ph": "X",
+                "ts": (start - cls.__origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": span.args,
+            }
+        )
+
+    @classmethod
+    def get_summary(cls) -> dict[str, dict[str, int | float]]:
+        """
+        Summarizes the recorded spans by their names.
+
+        Returns:
+            dict[str, dict[str, int | float]]:
+                Map of span names to their number of calls, total time in
+                milliseconds and the sums of their numeric values.
+        """
+
+        summary: dict[str, dict[str, int | float]] = {}
+        for event in list(cls.__events):
+            entry: dict[str, int | float] = summary.setdefault(
+                event["name"], {"calls": 0, "total_ms": 0.0}
+            )
+            entry["calls"] += 1
+            entry["total_ms"] += event["dur"] / 1000
+
+            for key, value in event["args"].items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    entry[key] = entry.get(key, 0) + value
+
+        return summary
+
+    @classmethod
+    def export(cls, path: Path) -> None:
+        """
+        Exports the recorded trace as JSON file.
+
+        Args:
+            path (Path): Path to the JSON file.
+        """
+
+        trace: dict[str, Any] = {
+            "traceEvents": list(cls.__events),
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "counters": dict(cls.__counters),
+                "summary": cls.get_summary(),
+            },
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf8") as file:
+            json.dump(trace, file, default=str)
+
+        cls.log.info(f"Exported {len(trace['traceEvents'])} span(s) to '{path}'.")
+
+    @classmethod
+    def has_data(cls) -> bool:
+        """
+        Returns:
+            bool: Whether any spans or counters were recorded.
+        """
+
+        return bool(cls.__events or cls.__counters)
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Deletes all recorded spans and counters.
+        """
+
+        cls.__events = []
+        cls.__counters = {}
@@ -0,0 +1,290 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, TextIO
+
+from .scale import scale_value
+
+
+@dataclass
+class TransferStats:
+    """
+    Class for the counters of a single transfer, for eg. the files of a mod.
+    """
+
+    name: str
+    """Name of the transfer, for eg. the display name of a mod."""
+
+    linked: int = 0
+    """Number of hardlinked files."""
+
+    copied: int = 0
+    """Number of copied files."""
+
+    extracted: int = 0
+    """Number of files extracted from the archive of the transfer."""
+
+    skipped: int = 0
+    """Number of skipped files."""
+
+    replaced: int = 0
+    """Number of replaced existing files."""
+
+    blacklisted: int = 0
+    """Number of files skipped due to the file blacklist."""
+
+    bytes: int = 0
+    """Total size of the linked, copied and extracted files in bytes."""
+
+    duration: float = 0.0
+    """Duration of the transfer in seconds."""
+
+    def format(self) -> str:
+        """
+        Returns:
+            str: A single line summary of the counters.
+        """
+
+        throughput: float = self.bytes / self.duration if self.duration > 0 else 0
+        extracted: str = f"extracted={self.extracted} " if self.extracted else ""
+
+        return (
+            f"Transferred {self.name!r}: linked={self.linked} copied={self.copied} "
+            f"{extracted}skipped={self.skipped} replaced={self.replaced} "
+            f"blacklisted={self.blacklisted} bytes={self.bytes} "
+            f"duration={self.duration:.3f}s "
+            f"throughput={scale_value(throughput)}/s"
+        )
+
+
+class Transfer:
+    """
+    Context manager for logging the files of a single transfer.
+
+    In summary mode, the files are only counted and one line is logged when the
+    transfer is finished. Otherwise each file is logged separately. If a detail file
+    is opened, each file is additionally written to it.
+    """
+
+    stats: TransferStats
+    """The counters of this transfer."""
+
+    __log: logging.Logger
+    __start: float
+
+    def __init__(self, name: str, log: logging.Logger) -> None:
+        self.stats = TransferStats(name)
+        self.__log = log
+
+    def linked(self, src_path: Path, dst_path: Path, size: int) -> None:
+        """
+        Records a hardlinked file.
+
+        Args:
+            src_path (Path): Path of the source file.
+            dst_path (Path): Path of the created link.
+            size (int): Size of the file in bytes.
+        """
+
+        self.stats.linked += 1
+        self.stats.bytes += size
+        self.__detail("linked", f"{str(src_path)!r} -> {str(dst_path)!r} ({size})")
+
+    def copied(self, src_path: Path, dst_path: Path, size: int) -> None:
+        """
+        Records a copied file.
+
+        Args:
+            src_path (Path): Path of the source file.
+            dst_path (Path): Path of the copy.
+            size (int): Size of the file in bytes.
+        """
+
+        self.stats.copied += 1
+        self.stats.bytes += size
+        self.__detail("copied", f"{str(src_path)!r} -> {str(dst_path)!r} ({size})")
+
+    def extracted(self, archive_path: Path, dst_path: Path, size: int) -> None:
+        """
+        Records a file that is extracted from an archive.
+
+        Args:
+            archive_path (Path): Path of the archive.
+            dst_path (Path): Path of the extracted file.
+            size (int): Size of the file in bytes.
+        """
+
+        self.stats.extracted += 1
+        self.stats.bytes += size
+        self.__detail(
+            "extracted", f"{str(archive_path)!r} -> {str(dst_path)!r} ({size})"
+        )
+
+    def skipped(self, path: Path, reason: str) -> None:
+        """
+        Records a skipped file.
+
+        Args:
+            path (Path): Path of the skipped file.
+            reason (str): Reason, for eg. `existing file`.
+        """
+
+        self.stats.skipped += 1
+        self.__detail("skipped", f"{str(path)!r} ({reason})")
+
+        if not TransferLog.is_summary_enabled():
+            self.__log.info(f"Skipped {reason}: {str(path)!r}")
+
+    def replaced(self, path: Path) -> None:
+        """
+        Records a deleted existing file that is replaced.
+
+        Args:
+            path (Path): Path of the deleted file.
+        """
+
+        self.stats.replaced += 1
+        self.__detail("replaced", repr(str(path)))
+
+        if not TransferLog.is_summary_enabled():
+            self.__log.warning(f"Deleted existing file: {str(path)!r}")
+
+    def blacklisted(self, path: Path) -> None:
+        """
+        Records a file that is skipped due to the file blacklist.
+
+        Args:
+            path (Path): Path of the file.
+        """
+
+        self.stats.blacklisted += 1
+        self.__detail("blacklisted", repr(str(path)))
+
+        if not TransferLog.is_summary_enabled():
+            self.__log.info(f"Skipped file due to configured blacklist: {path.name!r}")
+
+    def __detail(self, action: str, message: str) -> None:
+        TransferLog._write_detail(f"[{self.stats.name}] {action}: {message}")
+
+    def __enter__(self) -> Transfer:
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stats.duration = time.perf_counter() - self.__start
+
+        if TransferLog.is_summary_enabled():
+            self.__log.info(self.stats.format())
+
+        TransferLog._flush_details()
+
+
+class TransferLog:
+    """
+    Class for logging file transfers, like migrating the files of a mod, either per
+    file or summarized per transfer.
+
+    The detail file is a gzip-compressed text file with one line per file that is
+    opened when the first line is written.
+    """
+
+    log: logging.Logger = logging.getLogger("TransferLog")
+
+    __summary_enabled: bool = True
+    __detail_path: Optional[Path] = None
+    __detail_file: Optional[TextIO] = None
+    __detail_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, summary: bool, detail_path: Optional[Path] = None) -> None:
+        """
+        Configures the logging of file transfers. Closes the current detail file,
+        if any.
+
+        Args:
+            summary (bool): Whether to log only one summary line per transfer.
+            detail_path (Optional[Path], optional):
+                Path to a gzip-compressed file for the details of each file.
+                Defaults to None.
+        """
+
+        cls.close()
+
+        cls.__summary_enabled = summary
+        cls.__detail_path = detail_path
+
+    @classmethod
+    def is_summary_enabled(cls) -> bool:
+        """
+        Returns:
+            bool: Whether only one summary line is logged per transfer.
+        """
+
+        return cls.__summary_enabled
+
+    @classmethod
+    def transfer(cls, name: str, log: Optional[logging.Logger] = None) -> Transfer:
+        """
+        Creates a context manager for logging a transfer.
+
+        Example:
+        ```
+        with TransferLog.transfer(mod.display_name, self.log) as transfer:
+            transfer.copied(src_path, dst_path, file_size)
+        ```
+
+        Args:
+            name (str): Name of the transfer, for eg. the display name of a mod.
+            log (Optional[logging.Logger], optional):
+                Logger to log to. Defaults to the logger of this class.
+
+        Returns:
+            Transfer: The transfer.
+        """
+
+        return Transfer(name, log or cls.log)
+
+    @classmethod
+    def _write_detail(cls, line: str) -> None:
+        if cls.__detail_path is None:
+            return
+
+        with cls.__detail_lock:
+            if cls.__detail_file is None:
+                cls.__detail_path.parent.mkdir(parents=True, exist_ok=True)
+                cls.__detail_file = gzip.open(cls.__detail_path, "at", encoding="utf8")
+                cls.log.info(f"Writing transfer details to '{cls.__detail_path}'.")
+
+            cls.__detail_file.write(line + "\n")
+
+    @classmethod
+    def _flush_details(cls) -> None:
+        with cls.__detail_lock:
+            if cls.__detail_file is not None:
+                cls.__detail_file.flush()
+
+    @classmethod
+    def close(cls) -> None:
+        """
+        Closes the detail file, if it is open.
+        """
+
+        with cls.__detail_lock:
+            if cls.__detail_file is not None:
+                cls.__detail_file.close()
+                cls.__detail_file = None
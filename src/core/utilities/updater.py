@@ -3,15 +3,22 @@ Copyright (c) Cutleast
 """
 
 import logging
-from typing import Optional
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
 
 import jstyleson as json
-import requests
 import semantic_version as semver
 from PySide6.QtCore import QObject
 
+from core.utilities.lazy_import import lazy_import
 from ui.widgets.updater_dialog import UpdaterDialog
 
+if TYPE_CHECKING:
+    import requests
+else:
+    requests = lazy_import("requests")
+
 
 class Updater(QObject):
     """
@@ -26,35 +33,84 @@ class Updater(QObject):
     CHANGELOG_URL: str = f"https://raw.githubusercontent.com/{REPO_OWNER}/{REPO_NAME}/{REPO_BRANCH}/Changelog.md"
     UPDATE_URL: str = f"https://raw.githubusercontent.com/{REPO_OWNER}/{REPO_NAME}/{REPO_BRANCH}/update.json"
 
+    CACHE_INTERVAL: float = 24 * 60 * 60
+    """Time in seconds after which cached responses are requested again."""
+
     installed_version: semver.Version
     latest_version: Optional[semver.Version] = None
     download_url: str
+    changelog: str = ""
+
+    cache_path: Optional[Path]
+    """Path to the file where responses are cached or None to disable caching."""
+
+    force: bool
+    """Whether to ignore the cache interval and always send a request."""
+
+    def __init__(
+        self,
+        installed_version: str,
+        cache_path: Optional[Path] = None,
+        force: bool = False,
+    ) -> None:
+        """
+        Args:
+            installed_version (str): The installed version of the application.
+            cache_path (Optional[Path], optional):
+                Path to the file where responses are cached. Defaults to None.
+            force (bool, optional):
+                Whether to ignore the cache interval. Cached responses are still
+                validated with their ETag. Defaults to False.
+        """
 
-    def __init__(self, installed_version: str) -> None:
         super().__init__()
 
         self.installed_version = semver.Version(installed_version)
+        self.cache_path = cache_path
+        self.force = force
 
     def run(self) -> None:
         """
         Checks for updates and runs dialog.
         """
 
+        if self.check():
+            self.show_dialog()
+
+    def check(self) -> bool:
+        """
+        Checks for updates and requests the changelog if an update is available.
+        Does not create any widgets and can be run in a background thread.
+
+        Returns:
+            bool: Whether an update is available.
+        """
+
         self.log.info("Checking for update...")
 
         if self.update_available():
             self.log.info(
                 f"Update available: Installed: {self.installed_version} - Latest: {self.latest_version}"
             )
+            self.changelog = self.get_changelog()
 
-            UpdaterDialog(
-                self.installed_version,
-                self.latest_version,  # type: ignore
-                self.get_changelog(),
-                self.download_url,
-            )
-        else:
-            self.log.info("No update available.")
+            return True
+
+        self.log.info("No update available.")
+
+        return False
+
+    def show_dialog(self) -> None:
+        """
+        Shows the updater dialog for the update found by `check()`.
+        """
+
+        UpdaterDialog(
+            self.installed_version,
+            self.latest_version,  # type: ignore
+            self.changelog,
+            self.download_url,
+        )
 
     def update_available(self) -> bool:
         """
@@ -78,23 +134,14 @@ class Updater(QObject):
         """
 
         try:
-            response = requests.get(Updater.UPDATE_URL, timeout=1)
+            latest_version_json: Optional[str] = self.request(Updater.UPDATE_URL, 1)
 
-            if response.status_code == 200:
-                latest_version_json = response.content.decode(
-                    encoding="utf8", errors="ignore"
-                )
+            if latest_version_json is not None:
                 latest_version_data = json.loads(latest_version_json)
                 latest_version = latest_version_data["version"]
                 self.latest_version = semver.Version(latest_version)
                 self.download_url = latest_version_data["download_url"]
 
-            else:
-                self.log.error(
-                    f"Failed to request update. Status Code: {response.status_code}"
-                )
-                self.log.debug(f"Request URL: {Updater.UPDATE_URL}")
-
         except requests.exceptions.RequestException as ex:
             self.log.error(f"Failed to request update: {ex}")
             self.log.debug(f"Request URL: {Updater.UPDATE_URL}")
@@ -107,23 +154,97 @@ class Updater(QObject):
         """
 
         try:
-            response = requests.get(Updater.CHANGELOG_URL, timeout=3)
-
-            if response.status_code == 200:
-                changelog: str = response.content.decode(
-                    encoding="utf8", errors="ignore"
-                )
+            changelog: Optional[str] = self.request(Updater.CHANGELOG_URL, 3)
 
+            if changelog is not None:
                 return changelog
-            else:
-                self.log.error(
-                    f"Failed to request changelog. Status Code: {response.status_code}"
-                )
-                self.log.debug(f"Request URL: {Updater.CHANGELOG_URL}")
 
-                return f"Status Code: {response.status_code}"
+            return self.tr("Failed to request changelog.")
         except requests.exceptions.RequestException as ex:
             self.log.error(f"Failed to request changelog: {ex}")
             self.log.debug(f"Request URL: {Updater.CHANGELOG_URL}")
 
             return str(ex)
+
+    def request(self, url: str, timeout: float) -> Optional[str]:
+        """
+        Requests the content of an url. Responses are cached on disk and cached
+        responses that are younger than `CACHE_INTERVAL` are returned without
+        sending a request. Older responses are revalidated with their ETag.
+
+        Args:
+            url (str): The url to request.
+            timeout (float): Timeout of the request in seconds.
+
+        Raises:
+            requests.exceptions.RequestException:
+                when the request failed and there is no cached response.
+
+        Returns:
+            Optional[str]:
+                The content or None if the server responded with an error status.
+        """
+
+        cache: dict[str, dict[str, Any]] = self.__load_cache()
+        cached: Optional[dict[str, Any]] = cache.get(url)
+
+        if (
+            cached is not None
+            and not self.force
+            and time.time() - cached["timestamp"] < Updater.CACHE_INTERVAL
+        ):
+            self.log.debug(f"Using cached response for {url!r}.")
+            return cached["content"]
+
+        headers: dict[str, str] = {}
+        if cached is not None and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        try:
+            response = requests.get(url, headers=headers, timeout=timeout)
+        except requests.exceptions.RequestException as ex:
+            if cached is None:
+                raise
+
+            self.log.warning(f"Request failed, using cached response: {ex}")
+            return cached["content"]
+
+        content: str
+        if response.status_code == 304 and cached is not None:
+            self.log.debug(f"Cached response for {url!r} is still up-to-date.")
+            content = cached["content"]
+        elif response.status_code == 200:
+            content = response.content.decode(encoding="utf8", errors="ignore")
+        else:
+            self.log.error(f"Request failed. Status Code: {response.status_code}")
+            self.log.debug(f"Request URL: {url}")
+            return None
+
+        cache[url] = {
+            "etag": response.headers.get("ETag") or (cached or {}).get("etag"),
+            "timestamp": time.time(),
+            "content": content,
+        }
+        self.__save_cache(cache)
+
+        return content
+
+    def __load_cache(self) -> dict[str, dict[str, Any]]:
+        if self.cache_path is None or not self.cache_path.is_file():
+            return {}
+
+        try:
+            return json.loads(self.cache_path.read_text(encoding="utf8"))
+        except Exception as ex:
+            self.log.warning(f"Failed to load update cache: {ex}")
+            return {}
+
+    def __save_cache(self, cache: dict[str, dict[str, Any]]) -> None:
+        if self.cache_path is None:
+            return
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps(cache, indent=4), encoding="utf8")
+        except OSError as ex:
+            self.log.warning(f"Failed to save update cache: {ex}")
@@ -5,8 +5,8 @@ Copyright (c) Cutleast
 import sys
 from argparse import ArgumentParser, Namespace
 
-from app import App
 from app_context import AppContext
+from cli_app import CliApp
 
 
 def __init_argparser() -> ArgumentParser:
@@ -16,17 +16,35 @@ def __init_argparser() -> ArgumentParser:
 
     parser = ArgumentParser(
         prog=sys.executable,
-        description=f"{App.APP_NAME} v{App.APP_VERSION} (c) Cutleast "
+        description=f"{AppContext.APP_NAME} v{AppContext.APP_VERSION} (c) Cutleast "
         "- A tool for migrating your modlists.",
     )
+    CliApp.add_commands(parser)
 
     return parser
 
 
+def __run_headless(arg_namespace: Namespace) -> int:
+    """
+    Runs the specified command without GUI.
+    """
+
+    cli_app = CliApp(arg_namespace, AppContext.APP_NAME, AppContext.APP_VERSION)
+    cli_app.init()
+
+    return cli_app.exec()
+
+
 if __name__ == "__main__":
     parser: ArgumentParser = __init_argparser()
     arg_namespace: Namespace = parser.parse_args()
 
+    if arg_namespace.command is not None:
+        sys.exit(__run_headless(arg_namespace))
+
+    # The GUI is only imported if it's actually used
+    from app import App
+
     app = App(arg_namespace)
     AppContext.set_app(app)
     app.init()
@@ -54,17 +54,17 @@ class InstanceWidget(QTabWidget):
         self.__tools_tab.display_modinstance(instance)
 
     @property
-    def checked_mods(self) -> list[Mod]:
+    def checked_mods(self) -> set[Mod]:
         """
-        A list of currently checked mods.
+        A set of currently checked mods.
         """
 
         return self.__modlist_tab.checked_mods
 
     @property
-    def checked_tools(self) -> list[Tool]:
+    def checked_tools(self) -> set[Tool]:
         """
-        A list of currently checked tools.
+        A set of currently checked tools.
         """
 
         return self.__tools_tab.checked_tools
@@ -0,0 +1,519 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+import threading
+from enum import IntEnum
+from typing import Any, Optional, override
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QFont
+
+from core.instance.mod import Mod
+from core.utilities.scale import scale_value
+
+type ModelIndex = QModelIndex | QPersistentModelIndex
+
+
+class ModlistModel(QAbstractItemModel):
+    """
+    Item model for displaying a modlist as a tree of separators and their mods.
+
+    The columns are computed when they are requested by the view and the sizes of
+    the mods are calculated in a background thread. Mods are mapped to their rows
+    (and vice versa) in constant time.
+    """
+
+    log: logging.Logger = logging.getLogger("ModlistModel")
+
+    class Column(IntEnum):
+        """
+        Columns of the model.
+        """
+
+        Name = 0
+        Version = 1
+        Size = 2
+        Priority = 3
+
+    SIZE_BATCH_SIZE: int = 50
+    """Number of mods whose sizes are passed to the main thread at once."""
+
+    sizes_calculated = Signal(int, object)
+    """
+    This signal gets emitted from the background thread when the sizes of a batch
+    of mods were calculated with the generation of the modlist and a map of mods to
+    their sizes in bytes.
+    """
+
+    checked_changed = Signal(object, bool)
+    """
+    This signal gets emitted when mods were checked or unchecked with a list of the
+    changed mods and their new check state.
+    """
+
+    __header_labels: list[str]
+    __separator_font: QFont
+
+    __loadorder: list[Mod]
+    __toplevel_mods: list[Mod]
+    __child_mods: dict[Mod, list[Mod]]
+    __parents: dict[Mod, Optional[int]]
+    """Map of mods to the row of their separator or None for top-level mods."""
+    __rows: dict[Mod, int]
+    __priorities: dict[Mod, int]
+    __checked: dict[Mod, bool]
+    __checked_mods: set[Mod]
+    __sizes: dict[Mod, int]
+    __generation: int
+
+    def __init__(
+        self, header_labels: list[str], parent: Optional[QObject] = None
+    ) -> None:
+        """
+        Args:
+            header_labels (list[str]): Translated labels of the columns.
+            parent (Optional[QObject], optional): Parent object. Defaults to None.
+        """
+
+        super().__init__(parent)
+
+        self.__header_labels = header_labels
+        self.__separator_font = QFont()
+        self.__separator_font.setBold(True)
+        self.__separator_font.setItalic(True)
+
+        self.__loadorder = []
+        self.__toplevel_mods = []
+        self.__child_mods = {}
+        self.__parents = {}
+        self.__rows = {}
+        self.__priorities = {}
+        self.__checked = {}
+        self.__checked_mods = set()
+        self.__sizes = {}
+        self.__generation = 0
+
+        self.sizes_calculated.connect(self.__on_sizes_calculated)
+
+    def set_modlist(self, loadorder: list[Mod]) -> None:
+        """
+        Displays a modlist and starts calculating the sizes of its mods.
+
+        Args:
+            loadorder (list[Mod]): The mods in their loadorder.
+        """
+
+        self.beginResetModel()
+
+        self.__generation += 1
+        self.__loadorder = loadorder.copy()
+        self.__toplevel_mods = []
+        self.__child_mods = {}
+        self.__parents = {}
+        self.__rows = {}
+        self.__priorities = {}
+        self.__checked = {}
+        self.__checked_mods = set()
+        self.__sizes = {}
+
+        cur_separator: Optional[Mod] = None
+        for i, mod in enumerate(loadorder):
+            self.__priorities[mod] = i
+
+            match mod.mod_type:
+                case Mod.Type.Separator:
+                    cur_separator = mod
+                    self.__add_toplevel_mod(mod)
+                    self.__child_mods[mod] = []
+
+                case Mod.Type.Overwrite:
+                    self.__add_toplevel_mod(mod)
+
+                case Mod.Type.Regular:
+                    self.__checked[mod] = mod.enabled
+                    if mod.enabled:
+                        self.__checked_mods.add(mod)
+
+                    if cur_separator is not None:
+                        children: list[Mod] = self.__child_mods[cur_separator]
+                        self.__parents[mod] = self.__rows[cur_separator]
+                        self.__rows[mod] = len(children)
+                        children.append(mod)
+                    else:
+                        self.__add_toplevel_mod(mod)
+
+        self.endResetModel()
+
+        threading.Thread(
+            target=self.__calculate_sizes,
+            args=(self.__generation, self.__loadorder),
+            name="ModlistModel-sizes",
+            daemon=True,
+        ).start()
+
+    def __add_toplevel_mod(self, mod: Mod) -> None:
+        self.__parents[mod] = None
+        self.__rows[mod] = len(self.__toplevel_mods)
+        self.__toplevel_mods.append(mod)
+
+    def __calculate_sizes(self, generation: int, mods: list[Mod]) -> None:
+        sizes: dict[Mod, int] = {}
+        for mod in mods:
+            if generation != self.__generation:
+                return
+
+            if mod.mod_type == Mod.Type.Separator:
+                continue
+
+            try:
+                sizes[mod] = mod.size
+            except Exception as ex:
+                self.log.warning(f"Failed to get size of {mod.display_name!r}: {ex}")
+
+            if len(sizes) >= ModlistModel.SIZE_BATCH_SIZE:
+                self.sizes_calculated.emit(generation, sizes)
+                sizes = {}
+
+        if sizes:
+            self.sizes_calculated.emit(generation, sizes)
+
+    def __on_sizes_calculated(self, generation: int, sizes: dict[Mod, int]) -> None:
+        if generation != self.__generation:
+            return
+
+        self.__sizes.update(sizes)
+        self.__emit_data_changed(
+            list(sizes), ModlistModel.Column.Size, Qt.ItemDataRole.DisplayRole
+        )
+
+    @property
+    def mods(self) -> list[Mod]:
+        """
+        The displayed mods in their loadorder.
+        """
+
+        return self.__loadorder
+
+    @property
+    def toplevel_mods(self) -> list[Mod]:
+        """
+        The separators, the overwrite folder and the mods without separator in the
+        order of their rows.
+        """
+
+        return self.__toplevel_mods
+
+    def get_child_mods(self, separator: Mod) -> list[Mod]:
+        """
+        Args:
+            separator (Mod): The separator.
+
+        Returns:
+            list[Mod]: The mods below the separator in the order of their rows.
+        """
+
+        return self.__child_mods.get(separator, [])
+
+    def get_position(self, mod: Mod) -> int:
+        """
+        Args:
+            mod (Mod): The mod.
+
+        Raises:
+            KeyError: when the mod is not displayed.
+
+        Returns:
+            int: The position of the mod in the loadorder.
+        """
+
+        return self.__priorities[mod]
+
+    def get_separator(self, mod: Mod) -> Optional[Mod]:
+        """
+        Args:
+            mod (Mod): The mod.
+
+        Returns:
+            Optional[Mod]: The separator of the mod or None if it has none.
+        """
+
+        parent_row: Optional[int] = self.__parents.get(mod)
+
+        return self.__toplevel_mods[parent_row] if parent_row is not None else None
+
+    def get_mod(self, index: ModelIndex) -> Optional[Mod]:
+        """
+        Args:
+            index (ModelIndex): The model index.
+
+        Returns:
+            Optional[Mod]: The mod at the index or None if the index is invalid.
+        """
+
+        if not index.isValid():
+            return None
+
+        parent_id: int = index.internalId()
+        if parent_id == 0:
+            return self.__toplevel_mods[index.row()]
+
+        return self.__child_mods[self.__toplevel_mods[parent_id - 1]][index.row()]
+
+    def get_index(self, mod: Mod, column: int = Column.Name) -> QModelIndex:
+        """
+        Args:
+            mod (Mod): The mod.
+            column (int, optional): The column. Defaults to the name column.
+
+        Returns:
+            QModelIndex: The model index of the mod or an invalid index if the mod
+            is not displayed.
+        """
+
+        if mod not in self.__rows:
+            return QModelIndex()
+
+        parent_row: Optional[int] = self.__parents[mod]
+
+        return self.createIndex(
+            self.__rows[mod], column, 0 if parent_row is None else parent_row + 1
+        )
+
+    def is_checked(self, mod: Mod) -> bool:
+        """
+        Args:
+            mod (Mod): The mod.
+
+        Returns:
+            bool: Whether the mod is checked.
+        """
+
+        return self.__checked.get(mod, False)
+
+    def set_checked(self, mods: list[Mod], checked: bool) -> None:
+        """
+        Checks or unchecks mods. Separators and the overwrite folder are ignored.
+
+        Args:
+            mods (list[Mod]): The mods to check or uncheck.
+            checked (bool): Whether to check or uncheck the mods.
+        """
+
+        changed_mods: list[Mod] = []
+        for mod in mods:
+            if mod in self.__checked and self.__checked[mod] != checked:
+                self.__checked[mod] = checked
+                changed_mods.append(mod)
+
+                if checked:
+                    self.__checked_mods.add(mod)
+                else:
+                    self.__checked_mods.discard(mod)
+
+        if changed_mods:
+            self.__emit_data_changed(
+                changed_mods, ModlistModel.Column.Name, Qt.ItemDataRole.CheckStateRole
+            )
+            self.checked_changed.emit(changed_mods, checked)
+
+    def __emit_data_changed(
+        self, mods: list[Mod], column: int, role: Qt.ItemDataRole
+    ) -> None:
+        """
+        Emits `dataChanged` once for every separator (and once for the top-level)
+        with changed mods instead of once per mod.
+        """
+
+        # Map of parent rows to the first and last changed row below them
+        changed_rows: dict[Optional[int], tuple[int, int]] = {}
+        for mod in mods:
+            parent_row: Optional[int] = self.__parents[mod]
+            row: int = self.__rows[mod]
+            first, last = changed_rows.get(parent_row, (row, row))
+            changed_rows[parent_row] = (min(first, row), max(last, row))
+
+        for parent_row, (first, last) in changed_rows.items():
+            parent_id: int = 0 if parent_row is None else parent_row + 1
+            self.dataChanged.emit(
+                self.createIndex(first, column, parent_id),
+                self.createIndex(last, column, parent_id),
+                [role],
+            )
+
+    @property
+    def checked_mods(self) -> set[Mod]:
+        """
+        A set of currently checked mods.
+        """
+
+        return self.__checked_mods.copy()
+
+    @property
+    def checked_count(self) -> int:
+        """
+        The number of currently checked mods.
+        """
+
+        return len(self.__checked_mods)
+
+    @override
+    def index(
+        self, row: int, column: int, parent: ModelIndex = QModelIndex()
+    ) -> QModelIndex:
+        if row < 0 or not 0 <= column < len(ModlistModel.Column):
+            return QModelIndex()
+
+        if not parent.isValid():
+            if row >= len(self.__toplevel_mods):
+                return QModelIndex()
+
+            return self.createIndex(row, column, 0)
+
+        if parent.internalId() != 0 or row >= len(
+            self.__child_mods.get(self.__toplevel_mods[parent.row()], [])
+        ):
+            return QModelIndex()
+
+        return self.createIndex(row, column, parent.row() + 1)
+
+    @override
+    def parent(self, index: ModelIndex) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    @override
+    def rowCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self.__toplevel_mods)
+
+        if parent.column() != 0 or parent.internalId() != 0:
+            return 0
+
+        return len(self.__child_mods.get(self.__toplevel_mods[parent.row()], []))
+
+    @override
+    def columnCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        return len(ModlistModel.Column)
+
+    @override
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.__header_labels[section]
+
+        return None
+
+    @override
+    def flags(self, index: ModelIndex) -> Qt.ItemFlag:
+        mod: Optional[Mod] = self.get_mod(index)
+
+        if mod is None:
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        if mod.mod_type == Mod.Type.Regular:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+
+        return flags
+
+    @override
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        mod: Optional[Mod] = self.get_mod(index)
+
+        if mod is None:
+            return None
+
+        column: int = index.column()
+        match role:
+            case Qt.ItemDataRole.DisplayRole:
+                return self.__get_text(mod, column)
+
+            case Qt.ItemDataRole.ToolTipRole if column == ModlistModel.Column.Name:
+                return mod.display_name
+
+            case Qt.ItemDataRole.CheckStateRole if (
+                column == ModlistModel.Column.Name and mod in self.__checked
+            ):
+                return (
+                    Qt.CheckState.Checked
+                    if self.__checked[mod]
+                    else Qt.CheckState.Unchecked
+                )
+
+            case Qt.ItemDataRole.FontRole if mod.mod_type == Mod.Type.Separator:
+                return self.__separator_font if column == 0 else None
+
+            case Qt.ItemDataRole.TextAlignmentRole:
+                return ModlistModel.__get_alignment(mod, column)
+
+        return None
+
+    def __get_text(self, mod: Mod, column: int) -> str:
+        match column:
+            case ModlistModel.Column.Name:
+                return mod.display_name
+
+            case ModlistModel.Column.Version if mod.mod_type == Mod.Type.Regular:
+                return mod.metadata.version
+
+            case ModlistModel.Column.Size if mod in self.__sizes:
+                return scale_value(self.__sizes[mod])
+
+            case ModlistModel.Column.Priority if mod.mod_type != Mod.Type.Overwrite:
+                return str(self.__priorities[mod] + 1)
+
+        return ""
+
+    @staticmethod
+    def __get_alignment(mod: Mod, column: int) -> Optional[Qt.AlignmentFlag]:
+        centered: bool
+        match mod.mod_type:
+            case Mod.Type.Separator:
+                centered = column in (
+                    ModlistModel.Column.Name,
+                    ModlistModel.Column.Priority,
+                )
+            case Mod.Type.Overwrite:
+                centered = column in (
+                    ModlistModel.Column.Name,
+                    ModlistModel.Column.Size,
+                )
+            case Mod.Type.Regular:
+                centered = column != ModlistModel.Column.Name
+
+        return Qt.AlignmentFlag.AlignCenter if centered else None
+
+    @override
+    def setData(
+        self, index: ModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole
+    ) -> bool:
+        mod: Optional[Mod] = self.get_mod(index)
+
+        if (
+            mod is None
+            or role != Qt.ItemDataRole.CheckStateRole
+            or mod not in self.__checked
+        ):
+            return False
+
+        self.set_checked([mod], Qt.CheckState(value) == Qt.CheckState.Checked)
+
+        return True
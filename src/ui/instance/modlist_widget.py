@@ -5,28 +5,26 @@ Copyright (c) Cutleast
 import os
 from typing import Optional
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QModelIndex, Qt
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QHBoxLayout,
     QHeaderView,
     QLabel,
     QLCDNumber,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
 from core.instance.instance import Instance
 from core.instance.mod import Mod
-from core.utilities.filter import matches_filter
-from core.utilities.scale import scale_value
+from core.utilities.search_index import SearchIndex
 from ui.instance.modlist_menu import ModlistMenu
-from ui.utilities.tree_widget import iter_children, iter_toplevel_items
 from ui.widgets.search_bar import SearchBar
 
+from .modlist_model import ModlistModel
+
 
 class ModlistWidget(QWidget):
     """
@@ -37,13 +35,25 @@ class ModlistWidget(QWidget):
     __instance_name_label: QLabel
     __mods_num_label: QLCDNumber
     __search_bar: SearchBar
-    __tree_widget: QTreeWidget
-    __modlist_tree_items: dict[Mod, QTreeWidgetItem]
+    __tree_view: QTreeView
+    __model: ModlistModel
+    __search_index: SearchIndex[int]
+    """Search index of the loadorder positions of the displayed mods."""
+    __visible_mods: set[int]
+    __model_indexes: list[QModelIndex]
+    __separator_positions: list[Optional[int]]
+    __num_visible_checked: int = 0
+    """Number of checked mods that are not hidden by the search."""
     __modlist_menu: ModlistMenu
 
     def __init__(self) -> None:
         super().__init__()
 
+        self.__search_index = SearchIndex([])
+        self.__visible_mods = set()
+        self.__model_indexes = []
+        self.__separator_positions = []
+
         self.__init_ui()
 
     def __init_ui(self) -> None:
@@ -80,70 +90,93 @@ class ModlistWidget(QWidget):
         self.__vlayout.addWidget(self.__search_bar)
 
     def __init_tree_widget(self) -> None:
-        self.__tree_widget = QTreeWidget()
-        self.__tree_widget.setUniformRowHeights(True)
-        self.__tree_widget.setAlternatingRowColors(True)
-        self.__tree_widget.itemChanged.connect(
-            lambda _: self.__update_num_label(), Qt.ConnectionType.QueuedConnection
-        )
-        self.__vlayout.addWidget(self.__tree_widget, stretch=1)
-
-        self.__tree_widget.setHeaderLabels(
+        self.__model = ModlistModel(
             [
                 self.tr("Name"),
                 self.tr("Version"),
                 self.tr("Size"),
                 self.tr("Priority"),
-            ]
+            ],
+            self,
         )
-        self.__tree_widget.header().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.__tree_widget.setSelectionMode(
+        self.__model.checked_changed.connect(self.__on_checked_changed)
+
+        self.__tree_view = QTreeView()
+        self.__tree_view.setModel(self.__model)
+        self.__tree_view.setUniformRowHeights(True)
+        self.__tree_view.setAlternatingRowColors(True)
+        self.__vlayout.addWidget(self.__tree_view, stretch=1)
+
+        self.__tree_view.header().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.__tree_view.setSelectionMode(
             QAbstractItemView.SelectionMode.ExtendedSelection
         )
-        self.__tree_widget.header().setSectionResizeMode(
+        self.__tree_view.header().setSectionResizeMode(
             0, QHeaderView.ResizeMode.Stretch
         )
-        self.__tree_widget.header().setStretchLastSection(False)
+        self.__tree_view.header().setStretchLastSection(False)
 
     def __init_context_menu(self) -> None:
         self.__modlist_menu = ModlistMenu(self)
-        self.__tree_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.__tree_widget.customContextMenuRequested.connect(self.__modlist_menu.open)
+        self.__tree_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.__tree_view.customContextMenuRequested.connect(self.__modlist_menu.open)
 
     def __on_search(self, text: str, case_sensitive: bool) -> None:
-        for item in iter_toplevel_items(self.__tree_widget):
-            for child in iter_children(item):
-                child.setHidden(not matches_filter(child.text(0), text, case_sensitive))
+        visible_mods: set[int] = set()
+        for position in self.__search_index.search(text, case_sensitive):
+            visible_mods.add(position)
 
-            item.setHidden(
-                not matches_filter(item.text(0), text, case_sensitive)
-                and all(child.isHidden() for child in iter_children(item))
-            )
+            # Separators stay visible as long as any of their mods is visible
+            separator: Optional[int] = self.__separator_positions[position]
+            if separator is not None:
+                visible_mods.add(separator)
 
+        self.__set_visible_mods(visible_mods)
         self.__update_num_label()
 
+    def __set_visible_mods(self, visible_mods: set[int]) -> None:
+        """
+        Shows and hides only the rows whose visibility changed, with updates of the
+        tree view disabled in between.
+
+        Args:
+            visible_mods (set[int]): Loadorder positions of the visible mods.
+        """
+
+        changed_mods: set[int] = self.__visible_mods ^ visible_mods
+        self.__visible_mods = visible_mods
+
+        if not changed_mods:
+            return
+
+        mods: list[Mod] = self.__model.mods
+        self.__tree_view.setUpdatesEnabled(False)
+        for position in changed_mods:
+            visible: bool = position in visible_mods
+            index: QModelIndex = self.__model_indexes[position]
+            self.__tree_view.setRowHidden(index.row(), index.parent(), not visible)
+
+            if self.__model.is_checked(mods[position]):
+                self.__num_visible_checked += 1 if visible else -1
+        self.__tree_view.setUpdatesEnabled(True)
+
     @property
-    def checked_mods(self) -> list[Mod]:
+    def checked_mods(self) -> set[Mod]:
         """
-        A list of currently checked mods.
+        A set of currently checked mods.
         """
 
-        return [
-            mod
-            for mod, item in self.__modlist_tree_items.items()
-            if item.checkState(0) == Qt.CheckState.Checked
-        ]
+        return self.__model.checked_mods
+
+    def __on_checked_changed(self, mods: list[Mod], checked: bool) -> None:
+        for mod in mods:
+            if self.__model.get_position(mod) in self.__visible_mods:
+                self.__num_visible_checked += 1 if checked else -1
+
+        self.__update_num_label()
 
     def __update_num_label(self) -> None:
-        self.__mods_num_label.display(
-            len(
-                [
-                    i
-                    for i in self.__modlist_tree_items.values()
-                    if i.checkState(0) == Qt.CheckState.Checked and not i.isHidden()
-                ]
-            )
-        )
+        self.__mods_num_label.display(self.__num_visible_checked)
 
     def display_modinstance(self, instance: Instance) -> None:
         """
@@ -154,120 +187,47 @@ class ModlistWidget(QWidget):
         """
 
         self.__instance_name_label.setText(instance.display_name)
-        self.__mods_num_label.display(
-            len(
-                [
-                    m
-                    for m in instance.mods
-                    if m.enabled and not m.mod_type == Mod.Type.Separator
-                ]
-            )
-        )
-
-        self.__tree_widget.clear()
-        self.__modlist_tree_items = {}
-
-        cur_separator: Optional[QTreeWidgetItem] = None
-        for i, mod in enumerate(instance.loadorder):
-            match mod.mod_type:
-                # Process separator
-                case Mod.Type.Separator:
-                    cur_separator = ModlistWidget._create_separator_item(mod, i)
-                    self.__modlist_tree_items[mod] = cur_separator
-                    self.__tree_widget.addTopLevelItem(cur_separator)
-
-                # Process overwrite folder
-                case Mod.Type.Overwrite:
-                    mod_item = ModlistWidget._create_overwrite_mod_item(mod, i)
-                    self.__modlist_tree_items[mod] = mod_item
-                    self.__tree_widget.addTopLevelItem(mod_item)
-
-                # Process mod
-                case Mod.Type.Regular:
-                    mod_item = ModlistWidget._create_mod_item(mod, i)
-                    self.__modlist_tree_items[mod] = mod_item
-
-                    if cur_separator is not None:
-                        cur_separator.addChild(mod_item)
-                    else:
-                        self.__tree_widget.addTopLevelItem(mod_item)
-
-    @staticmethod
-    def _create_separator_item(separator: Mod, index: int) -> QTreeWidgetItem:
-        separator_item = QTreeWidgetItem(
-            [
-                separator.display_name,
-                "",  # Version
-                "",  # Size
-                str(index + 1),  # Mod Priority
-            ]
-        )
-        separator_item.setTextAlignment(0, Qt.AlignmentFlag.AlignCenter)
-        separator_item.setTextAlignment(3, Qt.AlignmentFlag.AlignCenter)
-        font = QFont()
-        font.setBold(True)
-        font.setItalic(True)
-        separator_item.setFont(0, font)
-        separator_item.setFlags(Qt.ItemFlag.ItemIsSelectable)
-        separator_item.setToolTip(0, separator_item.text(0))
-        separator_item.setDisabled(False)
-
-        return separator_item
-
-    @staticmethod
-    def _create_mod_item(mod: Mod, index: int) -> QTreeWidgetItem:
-        mod_item = QTreeWidgetItem(
-            [
-                mod.display_name,
-                mod.metadata.version,
-                scale_value(mod.size),
-                str(index + 1),  # Mod Priority
-            ]
-        )
-        mod_item.setToolTip(0, mod_item.text(0))
-        mod_item.setDisabled(False)
-        mod_item.setTextAlignment(1, Qt.AlignmentFlag.AlignCenter)
-        mod_item.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
-        mod_item.setTextAlignment(3, Qt.AlignmentFlag.AlignCenter)
-        mod_item.setFlags(mod_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-        mod_item.setCheckState(
-            0, Qt.CheckState.Checked if mod.enabled else Qt.CheckState.Unchecked
-        )
 
-        return mod_item
-
-    @staticmethod
-    def _create_overwrite_mod_item(mod: Mod, index: int) -> QTreeWidgetItem:
-        mod_item = QTreeWidgetItem(
-            [
-                mod.display_name,
-                "",  # Version
-                scale_value(mod.size),
-                "",  # Mod Priority
-            ]
+        self.__model.set_modlist(instance.loadorder)
+        mods: list[Mod] = self.__model.mods
+        self.__model_indexes = [self.__model.get_index(mod) for mod in mods]
+        self.__separator_positions = [
+            self.__model.get_position(separator)
+            if (separator := self.__model.get_separator(mod)) is not None
+            else None
+            for mod in mods
+        ]
+        self.__search_index = SearchIndex(
+            (i, [mod.display_name]) for i, mod in enumerate(mods)
         )
-        mod_item.setToolTip(0, mod_item.text(0))
-        mod_item.setDisabled(False)
-        mod_item.setTextAlignment(0, Qt.AlignmentFlag.AlignCenter)
-        mod_item.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
-
-        return mod_item
+        self.__visible_mods = set(range(len(mods)))
+        self.__num_visible_checked = self.__model.checked_count
+        self.__update_num_label()
 
     def expandAll(self) -> None:
-        self.__tree_widget.expandAll()
+        self.__tree_view.expandAll()
 
     def collapseAll(self) -> None:
-        self.__tree_widget.collapseAll()
+        self.__tree_view.collapseAll()
 
     def check_selected(self) -> None:
-        for item in self.__tree_widget.selectedItems():
-            if Qt.ItemFlag.ItemIsUserCheckable in item.flags():
-                item.setCheckState(0, Qt.CheckState.Checked)
+        self.__model.set_checked(self.__get_selected_mods(), True)
 
     def uncheck_selected(self) -> None:
-        for item in self.__tree_widget.selectedItems():
-            if Qt.ItemFlag.ItemIsUserCheckable in item.flags():
-                item.setCheckState(0, Qt.CheckState.Unchecked)
+        self.__model.set_checked(self.__get_selected_mods(), False)
+
+    def __get_selected_mods(self) -> list[Mod]:
+        mods: dict[Mod, None] = {}
+        for selection_range in self.__tree_view.selectionModel().selection():
+            parent: QModelIndex = selection_range.parent()
+            for row in range(selection_range.top(), selection_range.bottom() + 1):
+                mod: Optional[Mod] = self.__model.get_mod(
+                    self.__model.index(row, 0, parent)
+                )
+                if mod is not None:
+                    mods[mod] = None
+
+        return list(mods)
 
     def open_modpage(self) -> None:
         current_item: Optional[Mod] = self.get_current_item()
@@ -285,9 +245,4 @@ class ModlistWidget(QWidget):
             os.startfile(current_item.path)
 
     def get_current_item(self) -> Optional[Mod]:
-        items: dict[QTreeWidgetItem, Mod] = {
-            item: mod for mod, item in self.__modlist_tree_items.items()
-        }
-        current_item: Optional[Mod] = items.get(self.__tree_widget.currentItem())
-
-        return current_item
+        return self.__model.get_mod(self.__tree_view.currentIndex())
@@ -22,8 +22,8 @@ from PySide6.QtWidgets import (
 from core.instance.instance import Instance
 from core.instance.tool import Tool
 from core.utilities.filesystem import open_in_explorer
-from core.utilities.filter import matches_filter
-from ui.utilities.tree_widget import iter_toplevel_items
+from core.utilities.path_prober import PathProber
+from core.utilities.search_index import SearchIndex
 from ui.widgets.search_bar import SearchBar
 
 from .tools_menu import ToolsMenu
@@ -41,11 +41,27 @@ class ToolsWidget(QWidget):
     __tools_num_label: QLCDNumber
     __tree_widget: QTreeWidget
     __tools_tree_items: dict[Tool, QTreeWidgetItem]
+    __tree_item_tools: dict[QTreeWidgetItem, Tool]
+    __checked_tools: set[Tool]
+    __executable_items: dict[Path, list[QTreeWidgetItem]]
+    __path_prober: PathProber
+    __search_index: SearchIndex[Tool]
+    __visible_tools: set[Tool]
     __tools_menu: ToolsMenu
 
     def __init__(self) -> None:
         super().__init__()
 
+        self.__tools_tree_items = {}
+        self.__tree_item_tools = {}
+        self.__checked_tools = set()
+        self.__executable_items = {}
+        self.__search_index = SearchIndex([])
+        self.__visible_tools = set()
+
+        self.__path_prober = PathProber(self)
+        self.__path_prober.path_probed.connect(self.__on_path_probed)
+
         self.__init_ui()
 
     def __init_ui(self) -> None:
@@ -77,9 +93,7 @@ class ToolsWidget(QWidget):
         self.__tree_widget = QTreeWidget()
         self.__tree_widget.setUniformRowHeights(True)
         self.__tree_widget.setAlternatingRowColors(True)
-        self.__tree_widget.itemChanged.connect(
-            lambda _: self.__update_num_label(), Qt.ConnectionType.QueuedConnection
-        )
+        self.__tree_widget.itemChanged.connect(self.__on_item_changed)
         self.__vlayout.addWidget(self.__tree_widget, stretch=1)
 
         self.__tree_widget.setHeaderLabels(
@@ -102,25 +116,28 @@ class ToolsWidget(QWidget):
         self.__tree_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.__tree_widget.customContextMenuRequested.connect(self.__tools_menu.open)
 
+    def __on_item_changed(self, item: QTreeWidgetItem) -> None:
+        tool: Optional[Tool] = self.__tree_item_tools.get(item)
+        if tool is None:
+            return
+
+        if item.checkState(0) == Qt.CheckState.Checked:
+            self.__checked_tools.add(tool)
+        else:
+            self.__checked_tools.discard(tool)
+
+        self.__update_num_label()
+
     def __update_num_label(self) -> None:
-        self.__tools_num_label.display(
-            len(
-                [
-                    i
-                    for i in self.__tools_tree_items.values()
-                    if i.checkState(0) == Qt.CheckState.Checked and not i.isHidden()
-                ]
-            )
-        )
+        self.__tools_num_label.display(len(self.__checked_tools & self.__visible_tools))
 
     def __on_search(self, text: str, case_sensitive: bool) -> None:
-        for item in iter_toplevel_items(self.__tree_widget):
-            item.setHidden(
-                all(
-                    not matches_filter(item.text(i), text, case_sensitive)
-                    for i in range(5)
-                )
-            )
+        visible_tools: set[Tool] = set(self.__search_index.search(text, case_sensitive))
+
+        # Only update the items whose visibility changed
+        for tool in self.__visible_tools ^ visible_tools:
+            self.__tools_tree_items[tool].setHidden(tool not in visible_tools)
+        self.__visible_tools = visible_tools
 
         self.__update_num_label()
 
@@ -133,24 +150,65 @@ class ToolsWidget(QWidget):
         """
 
         self.__instance = instance
-        self.__tools_num_label.display(len(instance.tools))
 
         self.__tree_widget.clear()
         self.__tools_tree_items = {}
+        self.__tree_item_tools = {}
+        self.__executable_items = {}
+        self.__checked_tools = set()
         for tool in instance.tools:
+            executable: Path = tool.get_full_executable_path(instance.game_folder)
             item = ToolsWidget._create_tool_item(
-                tool, instance.game_folder, instance.last_tool == tool
+                tool,
+                instance.game_folder,
+                instance.last_tool == tool,
+                PathProber.get_cached(executable),
             )
             self.__tools_tree_items[tool] = item
+            self.__executable_items.setdefault(executable, []).append(item)
+            self.__tree_item_tools[item] = tool
+            if item.checkState(0) == Qt.CheckState.Checked:
+                self.__checked_tools.add(tool)
             self.__tree_widget.addTopLevelItem(item)
 
+        self.__search_index = SearchIndex(
+            (tool, [item.text(i) for i in range(item.columnCount())])
+            for tool, item in self.__tools_tree_items.items()
+        )
+        self.__visible_tools = set(instance.tools)
+        self.__update_num_label()
+
         self.__tree_widget.resizeColumnToContents(0)
         self.__tree_widget.resizeColumnToContents(1)
 
+        self.__path_prober.probe(self.__executable_items)
+
+    def __on_path_probed(self, path: Path, exists: bool) -> None:
+        for item in self.__executable_items.get(path, []):
+            # Only update items that are still waiting for their result
+            if item.isDisabled() and exists:
+                ToolsWidget._set_tool_available(item, True)
+
     @staticmethod
     def _create_tool_item(
-        tool: Tool, game_folder: Path, last_active: bool
+        tool: Tool, game_folder: Path, last_active: bool, exists: Optional[bool]
     ) -> QTreeWidgetItem:
+        """
+        Creates a tree item for a tool.
+
+        Args:
+            tool (Tool): The tool.
+            game_folder (Path): The game folder of the instance.
+            last_active (bool): Whether the tool was the last active one.
+            exists (Optional[bool]):
+                Whether the executable of the tool exists or None if it was not
+                checked yet. Tools with missing or unchecked executables are
+                unchecked and disabled.
+
+        Returns:
+            QTreeWidgetItem: The tree item.
+        """
+
         item = QTreeWidgetItem(
             [
                 tool.display_name,
@@ -166,11 +224,7 @@ class ToolsWidget(QWidget):
             item.setToolTip(4, str(tool.working_dir))
         item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
 
-        if tool.get_full_executable_path(game_folder).is_file():
-            item.setCheckState(0, Qt.CheckState.Checked)
-        else:
-            item.setCheckState(0, Qt.CheckState.Unchecked)
-            item.setDisabled(True)
+        ToolsWidget._set_tool_available(item, bool(exists))
 
         font = QFont()
         font.setBold(last_active)
@@ -179,17 +233,20 @@ class ToolsWidget(QWidget):
 
         return item
 
+    @staticmethod
+    def _set_tool_available(item: QTreeWidgetItem, available: bool) -> None:
+        item.setCheckState(
+            0, Qt.CheckState.Checked if available else Qt.CheckState.Unchecked
+        )
+        item.setDisabled(not available)
+
     @property
-    def checked_tools(self) -> list[Tool]:
+    def checked_tools(self) -> set[Tool]:
         """
-        A list of currently checked tools.
+        A set of currently checked tools.
         """
 
-        return [
-            tool
-            for tool, item in self.__tools_tree_items.items()
-            if item.checkState(0) == Qt.CheckState.Checked
-        ]
+        return self.__checked_tools.copy()
 
     def expandAll(self) -> None:
         self.__tree_widget.expandAll()
@@ -231,9 +288,4 @@ class ToolsWidget(QWidget):
             )
 
     def get_current_item(self) -> Optional[Tool]:
-        items: dict[QTreeWidgetItem, Tool] = {
-            item: mod for mod, item in self.__tools_tree_items.items()
-        }
-        current_item: Optional[Tool] = items.get(self.__tree_widget.currentItem())
-
-        return current_item
+        return self.__tree_item_tools.get(self.__tree_widget.currentItem())
@@ -12,6 +12,7 @@ from core.config.app_config import AppConfig
 from core.game.game import Game
 from core.instance.instance import Instance
 from core.instance.mod import Mod
+from core.instance.tool import Tool
 from core.migrator.migration_report import MigrationReport
 from core.migrator.migrator import Migrator
 from core.mod_manager.instance_info import InstanceInfo
@@ -113,6 +114,11 @@ class MainWidget(QSplitter):
             src_instance, self.__instance_widget.checked_mods
         )
 
+        checked_tools: set[Tool] = self.__instance_widget.checked_tools
+        included_tools: list[Tool] = [
+            tool for tool in src_instance.tools if tool in checked_tools
+        ]
+
         app_config: AppConfig = AppContext.get_app().app_config
 
         report: MigrationReport = LoadingDialog.run_callable(
@@ -126,11 +132,13 @@ class MainWidget(QSplitter):
                 replace=app_config.replace_when_merge,
                 modname_limit=app_config.modname_limit,
                 activate_new_instance=app_config.activate_new_instance,
-                included_tools=self.__instance_widget.checked_tools,
+                included_tools=included_tools,
+                verify_files=app_config.verify_migrated_files,
                 ldialog=ldialog,
             ),
             parent=AppContext.get_app().main_window,
         )
+        AppContext.get_app().export_trace()
 
         if report.has_errors:
             QMessageBox.warning(
@@ -158,6 +166,6 @@ class MainWidget(QSplitter):
             )
 
     @staticmethod
-    def _apply_checked_mods(instance: Instance, checked_mods: list[Mod]) -> None:
+    def _apply_checked_mods(instance: Instance, checked_mods: set[Mod]) -> None:
         for mod in instance.mods:
             mod.enabled = mod in checked_mods
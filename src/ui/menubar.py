@@ -106,9 +106,10 @@ class MenuBar(QMenuBar):
         SettingsDialog(AppContext.get_app().app_config).exec()
 
     def __check_for_updates(self) -> None:
-        upd = Updater(AppContext.get_app().APP_VERSION)
-        if upd.update_available():
-            upd.run()
+        app = AppContext.get_app()
+        upd = Updater(app.APP_VERSION, app.cache_path / "update.json", force=True)
+        if upd.check():
+            upd.show_dialog()
         else:
             messagebox = QMessageBox(AppContext.get_app().main_window)
             messagebox.setWindowTitle(self.tr("No Updates Available"))
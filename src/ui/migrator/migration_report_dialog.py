@@ -78,6 +78,7 @@ class MigrationReportDialog(QDialog):
 
     __mods_tab: ReportTab
     __tools_tab: ReportTab
+    __files_tab: ReportTab
     __other_errors_tab: ReportTab
 
     def __init__(
@@ -96,8 +97,10 @@ class MigrationReportDialog(QDialog):
             self.__tab_widget.setCurrentIndex(0)
         elif report.failed_tools:
             self.__tab_widget.setCurrentIndex(1)
-        elif report.other_errors:
+        elif report.failed_files:
             self.__tab_widget.setCurrentIndex(2)
+        elif report.other_errors:
+            self.__tab_widget.setCurrentIndex(3)
 
     def __init_ui(self) -> None:
         self.__vlayout = QVBoxLayout()
@@ -110,6 +113,7 @@ class MigrationReportDialog(QDialog):
 
         self.__init_mods_tab()
         self.__init_tools_tab()
+        self.__init_files_tab()
         self.__init_other_errors_tab()
 
         ok_button = QPushButton(self.tr("Ok"))
@@ -140,6 +144,18 @@ class MigrationReportDialog(QDialog):
         )
         self.__tab_widget.setTabEnabled(1, len(tools_errors) > 0)
 
+    def __init_files_tab(self) -> None:
+        files_errors: dict[str, str] = {
+            str(file): format_exception(e)
+            for file, e in self.__report.failed_files.items()
+        }
+
+        self.__files_tab = MigrationReportDialog.ReportTab(self, files_errors)
+        self.__tab_widget.addTab(
+            self.__files_tab, self.tr("Corrupted Files") + f" ({len(files_errors)})"
+        )
+        self.__tab_widget.setTabEnabled(2, len(files_errors) > 0)
+
     def __init_other_errors_tab(self) -> None:
         other_errors: dict[str, str] = {
             display_name: format_exception(e)
@@ -150,4 +166,4 @@ class MigrationReportDialog(QDialog):
         self.__tab_widget.addTab(
             self.__other_errors_tab, self.tr("Other Errors") + f" ({len(other_errors)})"
         )
-        self.__tab_widget.setTabEnabled(2, len(other_errors) > 0)
+        self.__tab_widget.setTabEnabled(3, len(other_errors) > 0)
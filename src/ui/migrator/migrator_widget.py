@@ -257,7 +257,7 @@ class MigratorWidget(SmoothScrollArea):
                 lambda ldialog: mod_manager.load_instance(
                     instance_data=instance_data,
                     modname_limit=self.app_config.modname_limit,
-                    file_blacklist=FileBlacklist.get_files(),
+                    file_blacklist=FileBlacklist.get_matcher(),
                     game_folder=self.__game_folders.get(game),
                     ldialog=ldialog,
                 )
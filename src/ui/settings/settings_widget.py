@@ -22,6 +22,7 @@ from PySide6.QtWidgets import (
 from core.config.app_config import AppConfig
 from core.utilities.localisation import Language
 from core.utilities.logger import Logger
+from core.utilities.tracer import Tracer
 from ui.utilities.ui_mode import UIMode
 from ui.widgets.link_button import LinkButton
 from ui.widgets.smooth_scroll_area import SmoothScrollArea
@@ -55,9 +56,13 @@ class SettingsWidget(SmoothScrollArea):
     __log_num_of_files_box: QSpinBox
     __language_box: QComboBox
     __ui_mode_box: QComboBox
+    __log_trace_box: QCheckBox
+    __log_transfer_summary_box: QCheckBox
+    __log_transfer_details_box: QCheckBox
     __use_hardlinks_box: QCheckBox
     __replace_when_merge_box: QCheckBox
     __activate_dst_instance_box: QCheckBox
+    __verify_migrated_files_box: QCheckBox
     __modname_limit_box: QSpinBox
 
     def __init__(self, app_config: AppConfig) -> None:
@@ -146,6 +151,53 @@ class SettingsWidget(SmoothScrollArea):
         )
         app_settings_glayout.addWidget(self.__ui_mode_box, 3, 1)
 
+        log_trace_label = QLabel(
+            self.tr("Record performance trace (saved to the log folder):")
+        )
+        log_trace_label.setWordWrap(True)
+        app_settings_glayout.addWidget(log_trace_label, 4, 0)
+
+        self.__log_trace_box = QCheckBox()
+        self.__log_trace_box.setChecked(self.__app_config.log_trace)
+        self.__log_trace_box.checkStateChanged.connect(lambda _: self.changed.emit())
+        app_settings_glayout.addWidget(self.__log_trace_box, 4, 1)
+
+        log_transfer_summary_label = QLabel(
+            self.tr("Log only one summary line per migrated mod:")
+        )
+        log_transfer_summary_label.setWordWrap(True)
+        app_settings_glayout.addWidget(log_transfer_summary_label, 5, 0)
+
+        self.__log_transfer_summary_box = QCheckBox()
+        self.__log_transfer_summary_box.setChecked(
+            self.__app_config.log_transfer_summary
+        )
+        self.__log_transfer_summary_box.checkStateChanged.connect(
+            lambda _: self.changed.emit()
+        )
+        self.__log_transfer_summary_box.checkStateChanged.connect(
+            lambda _: self.restart_required.emit()
+        )
+        app_settings_glayout.addWidget(self.__log_transfer_summary_box, 5, 1)
+
+        log_transfer_details_label = QLabel(
+            self.tr("Save every migrated file to a compressed file in the log folder:")
+        )
+        log_transfer_details_label.setWordWrap(True)
+        app_settings_glayout.addWidget(log_transfer_details_label, 6, 0)
+
+        self.__log_transfer_details_box = QCheckBox()
+        self.__log_transfer_details_box.setChecked(
+            self.__app_config.log_transfer_details
+        )
+        self.__log_transfer_details_box.checkStateChanged.connect(
+            lambda _: self.changed.emit()
+        )
+        self.__log_transfer_details_box.checkStateChanged.connect(
+            lambda _: self.restart_required.emit()
+        )
+        app_settings_glayout.addWidget(self.__log_transfer_details_box, 6, 1)
+
     def __init_migration_settings(self) -> None:
         migration_settings_group = QGroupBox(self.tr("Migration settings"))
         self.__vlayout.addWidget(migration_settings_group)
@@ -203,20 +255,34 @@ class SettingsWidget(SmoothScrollArea):
         )
         migration_settings_glayout.addWidget(self.__activate_dst_instance_box, 2, 1)
 
+        verify_migrated_files_label = QLabel(
+            self.tr("Verify migrated files after migration:")
+        )
+        migration_settings_glayout.addWidget(verify_migrated_files_label, 3, 0)
+
+        self.__verify_migrated_files_box = QCheckBox()
+        self.__verify_migrated_files_box.setChecked(
+            self.__app_config.verify_migrated_files
+        )
+        self.__verify_migrated_files_box.checkStateChanged.connect(
+            lambda _: self.changed.emit()
+        )
+        migration_settings_glayout.addWidget(self.__verify_migrated_files_box, 3, 1)
+
         modname_limit_label = QLabel(
             self.tr(
                 "Character limit for mod names (strongly recommended when migrating to MO2):"
             )
         )
         modname_limit_label.setWordWrap(True)
-        migration_settings_glayout.addWidget(modname_limit_label, 3, 0)
+        migration_settings_glayout.addWidget(modname_limit_label, 4, 0)
 
         self.__modname_limit_box = QSpinBox()
         self.__modname_limit_box.installEventFilter(self)
         self.__modname_limit_box.setRange(-1, 255)
         self.__modname_limit_box.setValue(self.__app_config.modname_limit)
         self.__modname_limit_box.valueChanged.connect(lambda _: self.changed.emit())
-        migration_settings_glayout.addWidget(self.__modname_limit_box, 3, 1)
+        migration_settings_glayout.addWidget(self.__modname_limit_box, 4, 1)
 
     @override
     def eventFilter(self, source: QObject, event: QEvent) -> bool:
@@ -241,9 +307,20 @@ class SettingsWidget(SmoothScrollArea):
         self.__app_config.log_num_of_files = self.__log_num_of_files_box.value()
         self.__app_config.language = Language[self.__language_box.currentText()]
         self.__app_config.ui_mode = UIMode[self.__ui_mode_box.currentText()]
+        self.__app_config.log_trace = self.__log_trace_box.isChecked()
+        Tracer.set_enabled(self.__app_config.log_trace)
+        self.__app_config.log_transfer_summary = (
+            self.__log_transfer_summary_box.isChecked()
+        )
+        self.__app_config.log_transfer_details = (
+            self.__log_transfer_details_box.isChecked()
+        )
         self.__app_config.use_hardlinks = self.__use_hardlinks_box.isChecked()
         self.__app_config.replace_when_merge = self.__replace_when_merge_box.isChecked()
         self.__app_config.activate_new_instance = (
             self.__activate_dst_instance_box.isChecked()
         )
+        self.__app_config.verify_migrated_files = (
+            self.__verify_migrated_files_box.isChecked()
+        )
         self.__app_config.modname_limit = self.__modname_limit_box.value()
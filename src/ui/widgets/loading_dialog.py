@@ -4,10 +4,10 @@ Copyright (c) Cutleast
 
 import logging
 import time
+from functools import cache
 from typing import Any, Callable, Generic, Optional, TypeVar, override
 
-import comtypes.client as cc
-from PySide6.QtCore import Qt, QTimerEvent, Signal
+from PySide6.QtCore import Qt, QTimer, QTimerEvent, Signal
 from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (
     QDialog,
@@ -20,17 +20,10 @@ from PySide6.QtWidgets import (
 )
 
 from core.utilities.datetime import get_diff
+from core.utilities.progress_aggregator import ProgressAggregator
 from core.utilities.thread import Thread
 from ui.utilities import move_to_center
 
-cc.GetModule("res/TaskbarLib.tlb")
-
-import comtypes.gen.TaskbarLib as tbl  # noqa: E402
-
-taskbar = cc.CreateObject(
-    "{56FDF344-FD6D-11d0-958A-006097C9A090}", interface=tbl.ITaskbarList3
-)
-
 T = TypeVar("T")
 V = TypeVar("V")
 
@@ -48,12 +41,18 @@ class LoadingDialog(QDialog, Generic[T]):
 
     start_signal = Signal()
     stop_signal = Signal()
-    progress_signal = Signal(dict)
     _timer: Optional[int] = None
 
+    UPDATE_INTERVAL: int = 1000 // 30
+    """Interval (in ms) in which progress updates are applied to the dialog."""
+
+    __progress: ProgressAggregator
+    __progress_timer: QTimer
+
     log = logging.getLogger("LoadingDialog")
 
     parent_hwnd: Optional[int] = None
+    taskbar: Optional[Any] = None
 
     def __init__(
         self, parent: Optional[QWidget], func: Callable[["LoadingDialog"], T]
@@ -113,14 +112,47 @@ class LoadingDialog(QDialog, Generic[T]):
         # Connect signals
         self.start_signal.connect(self.on_start)
         self.stop_signal.connect(self.on_finish)
-        self.progress_signal.connect(
-            self.setProgress, type=Qt.ConnectionType.QueuedConnection
-        )
+
+        # Apply coalesced progress updates at a fixed rate
+        self.__progress = ProgressAggregator()
+        self.__progress_timer = QTimer(self)
+        self.__progress_timer.setInterval(LoadingDialog.UPDATE_INTERVAL)
+        self.__progress_timer.timeout.connect(self.__apply_progress)
 
         # Set up Taskbar Progress API
         if parent is not None:
-            self.parent_hwnd = parent.winId()
-            taskbar.ActivateTab(self.parent_hwnd)
+            self.taskbar = LoadingDialog.get_taskbar()
+
+            if self.taskbar is not None:
+                self.parent_hwnd = parent.winId()
+                self.taskbar.ActivateTab(self.parent_hwnd)
+
+    @staticmethod
+    @cache
+    def get_taskbar() -> Optional[Any]:
+        """
+        Creates the COM object of the Windows Taskbar Progress API on first use
+        instead of at import time since loading the type library is expensive.
+
+        Returns:
+            Optional[Any]: The taskbar object or None if it could not be created.
+        """
+
+        try:
+            import comtypes.client as cc
+
+            cc.GetModule("res/TaskbarLib.tlb")
+
+            import comtypes.gen.TaskbarLib as tbl
+
+            return cc.CreateObject(
+                "{56FDF344-FD6D-11d0-958A-006097C9A090}", interface=tbl.ITaskbarList3
+            )
+        except Exception as ex:
+            LoadingDialog.log.warning(
+                f"Failed to initialize taskbar progress: {ex}", exc_info=ex
+            )
+            return None
 
     def updateProgress(
         self,
@@ -138,7 +170,8 @@ class LoadingDialog(QDialog, Generic[T]):
     ) -> None:
         """
         Updates progress of progressbars.
-        This method is thread safe for usage with Qt.
+        This method is thread safe and cheap enough to be called for every file since
+        the updates are coalesced and applied to the dialog at a fixed rate.
 
         Parameters:
             text1: str (text displayed over first progressbar)
@@ -156,22 +189,26 @@ class LoadingDialog(QDialog, Generic[T]):
             max3: int (maximum value of third progressbar)
         """
 
-        self.progress_signal.emit(
-            {
-                "text": text1,
-                "value": value1,
-                "max": max1,
-                "show2": show2,
-                "text2": text2,
-                "value2": value2,
-                "max2": max2,
-                "show3": show3,
-                "text3": text3,
-                "value3": value3,
-                "max3": max3,
-            }
+        self.__progress.update(
+            text=text1,
+            value=value1,
+            max=max1,
+            show2=show2,
+            text2=text2,
+            value2=value2,
+            max2=max2,
+            show3=show3,
+            text3=text3,
+            value3=value3,
+            max3=max3,
         )
 
+    def __apply_progress(self) -> None:
+        progress: Optional[dict[str, Any]] = self.__progress.poll()
+
+        if progress is not None:
+            self.setProgress(progress)
+
     def setProgress(self, progress: dict[str, Any]) -> None:
         """
         Sets progress from <progress>.
@@ -254,10 +291,10 @@ class LoadingDialog(QDialog, Generic[T]):
         # Update Taskbar Progress
         if self.parent_hwnd is not None:
             if self.pbar1.maximum() == 0:
-                taskbar.SetProgressState(self.parent_hwnd, 0x1)  # Indeterminate
+                self.taskbar.SetProgressState(self.parent_hwnd, 0x1)  # Indeterminate
             else:
-                taskbar.SetProgressState(self.parent_hwnd, 0x2)  # Determinate
-                taskbar.SetProgressValue(
+                self.taskbar.SetProgressState(self.parent_hwnd, 0x2)  # Determinate
+                self.taskbar.SetProgressValue(
                     self.parent_hwnd, self.pbar1.value(), self.pbar1.maximum()
                 )
 
@@ -284,6 +321,7 @@ class LoadingDialog(QDialog, Generic[T]):
         """
 
         self.start_signal.emit()
+        self.__progress_timer.start()
         self._thread.start()
 
         self.starttime = time.strftime("%H:%M:%S")
@@ -292,12 +330,14 @@ class LoadingDialog(QDialog, Generic[T]):
         super().exec()
 
         self.killTimer(self._timer)
+        self.__progress_timer.stop()
+        self.log.debug(f"Progress updates: {self.__progress.update_count}")
 
         self.log.debug(f"Time: {get_diff(self.starttime, time.strftime('%H:%M:%S'))}")
 
         # Clear taskbar state
         if self.parent_hwnd is not None:
-            taskbar.SetProgressState(self.parent_hwnd, 0x0)
+            self.taskbar.SetProgressState(self.parent_hwnd, 0x0)
 
         # if self._thread.exception is not None:
         #     # Set taskbar state to error
@@ -321,6 +361,7 @@ class LoadingDialog(QDialog, Generic[T]):
         super().show()
 
         self.start_signal.emit()
+        self.__progress_timer.start()
         self._timer = self.startTimer(1000)
 
     def stop(self) -> None:
@@ -330,6 +371,7 @@ class LoadingDialog(QDialog, Generic[T]):
 
         super().hide()
 
+        self.__progress_timer.stop()
         if self._timer is not None:
             self.killTimer(self._timer)
 
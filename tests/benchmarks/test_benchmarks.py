@@ -0,0 +1,377 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Generator
+
+import jstyleson
+import pytest
+from base_test import BaseTest
+from pytest_mock import MockerFixture
+from setup.benchmark import BenchmarkRecorder
+from setup.instance_generator import InstanceGenerator, InstanceSpec
+
+from core.instance.instance import Instance
+from core.instance.mod import Mod
+from core.migrator.file_blacklist import FileBlacklist
+from core.migrator.migration_report import MigrationReport
+from core.migrator.migrator import Migrator
+from core.mod_manager.mod_manager import ModManager
+from core.mod_manager.modorganizer.mo2_instance_info import MO2InstanceInfo
+from core.mod_manager.modorganizer.modorganizer import ModOrganizer
+from core.mod_manager.vortex.profile_info import ProfileInfo
+from core.mod_manager.vortex.vortex import Vortex
+from core.utilities.env_resolver import RESOLVER, resolve
+from core.utilities.json_codec import OrjsonCodec, StdJsonCodec
+from core.utilities.leveldb import LevelDB
+
+pytestmark = pytest.mark.benchmark
+
+
+class TestBenchmarks(BaseTest):
+    """
+    Benchmarks for loading and migrating large generated mod instances.
+
+    The benchmarks are excluded from regular test runs and can be run with
+    `pytest -m benchmark`. Their results are stored per commit in
+    `tests/benchmarks/results` and can be compared with
+    `python tests/setup/benchmark.py <old results> <new results>`.
+    """
+
+    SPECS: dict[str, InstanceSpec] = {
+        "small": InstanceSpec(num_mods=100, files_per_mod=20, num_tools=5),
+        "large": InstanceSpec(
+            num_mods=2000, files_per_mod=50, conflict_ratio=0.2, num_tools=20
+        ),
+    }
+    """Specifications of the generated instances."""
+
+    MODNAME_LIMIT: int = 100
+
+    @pytest.fixture
+    def recorder(self) -> BenchmarkRecorder:
+        """
+        Returns:
+            BenchmarkRecorder: The recorder for the benchmark results.
+        """
+
+        return BenchmarkRecorder()
+
+    @pytest.fixture
+    def appdata_folder(self, tmp_folder: Path) -> Generator[Path, None, None]:
+        """
+        Sets the APPDATA environment variable to a temporary folder and refreshes the
+        environment snapshot of the resolver before and after the test.
+
+        Yields:
+            Generator[Path]: The temporary APPDATA folder.
+        """
+
+        appdata_folder: Path = tmp_folder / "AppData"
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setenv("APPDATA", str(appdata_folder))
+            RESOLVER.refresh()
+            yield appdata_folder
+
+        RESOLVER.refresh()
+
+    @staticmethod
+    def clear_mod_caches() -> None:
+        """
+        Clears the cached files and sizes of all mods to measure cold loads.
+        """
+
+        for cached_method in ["__get_files", "__scan_files", "__get_size"]:
+            getattr(Mod, f"_Mod{cached_method}").cache_clear()
+
+    @staticmethod
+    def get_params(spec_name: str, generator: InstanceGenerator) -> dict[str, Any]:
+        return {
+            "spec": spec_name,
+            "mods": generator.spec.num_mods,
+            "files": generator.total_files,
+        }
+
+    def load_mo2_instance(
+        self, generator: InstanceGenerator, tmp_folder: Path
+    ) -> tuple[MO2InstanceInfo, Instance]:
+        """
+        Generates and loads an MO2 instance.
+
+        Args:
+            generator (InstanceGenerator): The generator of the instance.
+            tmp_folder (Path): Temporary folder for the instance.
+
+        Returns:
+            tuple[MO2InstanceInfo, Instance]: The info and the loaded instance.
+        """
+
+        instance_info: MO2InstanceInfo = generator.create_mo2_instance(
+            tmp_folder / "Source Instance", tmp_folder / "Game"
+        )
+        instance: Instance = ModOrganizer().load_instance(
+            instance_info, TestBenchmarks.MODNAME_LIMIT, FileBlacklist.get_files()
+        )
+
+        return instance_info, instance
+
+    @pytest.mark.parametrize("spec_name", SPECS)
+    def test_mo2_load_instance(
+        self, spec_name: str, tmp_folder: Path, recorder: BenchmarkRecorder
+    ) -> None:
+        """
+        Benchmarks `core.mod_manager.modorganizer.ModOrganizer.load_instance()`.
+        """
+
+        # given
+        generator = InstanceGenerator(TestBenchmarks.SPECS[spec_name])
+        instance_info: MO2InstanceInfo = generator.create_mo2_instance(
+            tmp_folder / "Source Instance", tmp_folder / "Game"
+        )
+
+        # when
+        instance: Instance = recorder.measure(
+            "mo2.load_instance",
+            lambda: ModOrganizer().load_instance(
+                instance_info,
+                TestBenchmarks.MODNAME_LIMIT,
+                FileBlacklist.get_files(),
+            ),
+            setup=TestBenchmarks.clear_mod_caches,
+            **TestBenchmarks.get_params(spec_name, generator),
+        )
+
+        # then
+        assert len(instance.mods) == generator.spec.num_mods
+        assert len(instance.tools) == generator.spec.num_tools
+
+    @pytest.mark.parametrize("spec_name", SPECS)
+    def test_vortex_load_instance(
+        self,
+        spec_name: str,
+        tmp_folder: Path,
+        recorder: BenchmarkRecorder,
+        mocker: MockerFixture,
+        appdata_folder: Path,
+    ) -> None:
+        """
+        Benchmarks `core.mod_manager.vortex.Vortex.load_instance()` with a mocked
+        database.
+        """
+
+        # given
+        generator = InstanceGenerator(TestBenchmarks.SPECS[spec_name])
+        profile_info = ProfileInfo(
+            display_name="Benchmark (1a2b3c4d)", game=generator.game, id="1a2b3c4d"
+        )
+        state: dict[str, Any] = generator.create_vortex_state(
+            tmp_folder / "Staging", tmp_folder / "Game", profile_info
+        )
+        mocker.patch("plyvel.DB", return_value=InstanceGenerator.create_mock_db(state))
+        vortex = Vortex()
+        vortex.db_path.mkdir(parents=True, exist_ok=True)
+
+        # when
+        instance: Instance = recorder.measure(
+            "vortex.load_instance",
+            lambda: vortex.load_instance(
+                profile_info, TestBenchmarks.MODNAME_LIMIT, FileBlacklist.get_files()
+            ),
+            setup=TestBenchmarks.clear_mod_caches,
+            **TestBenchmarks.get_params(spec_name, generator),
+        )
+
+        # then
+        assert len(instance.mods) == generator.spec.num_mods
+        assert len(instance.tools) == generator.spec.num_tools
+
+    @pytest.mark.parametrize("spec_name", SPECS)
+    def test_get_loadorder(
+        self, spec_name: str, tmp_folder: Path, recorder: BenchmarkRecorder
+    ) -> None:
+        """
+        Benchmarks `core.instance.instance.Instance.get_loadorder()` with sorting.
+        """
+
+        # given
+        generator = InstanceGenerator(TestBenchmarks.SPECS[spec_name])
+        _, instance = self.load_mo2_instance(generator, tmp_folder)
+
+        # when
+        loadorder: list[Mod] = recorder.measure(
+            "instance.get_loadorder",
+            lambda: instance.get_loadorder(order_matters=False),
+            **TestBenchmarks.get_params(spec_name, generator),
+        )
+
+        # then
+        assert len(loadorder) == len(instance.mods)
+
+    @pytest.mark.parametrize("spec_name", SPECS)
+    def test_index_modlist(
+        self, spec_name: str, tmp_folder: Path, recorder: BenchmarkRecorder
+    ) -> None:
+        """
+        Benchmarks `core.mod_manager.mod_manager.ModManager._index_modlist()`.
+        """
+
+        # given
+        generator = InstanceGenerator(TestBenchmarks.SPECS[spec_name])
+        _, instance = self.load_mo2_instance(generator, tmp_folder)
+        blacklist: list[str] = FileBlacklist.get_files()
+
+        # when
+        index: dict[str, list[Mod]] = recorder.measure(
+            "mod_manager.index_modlist",
+            lambda: ModManager._index_modlist(instance.mods, blacklist),
+            **TestBenchmarks.get_params(spec_name, generator),
+        )
+
+        # then
+        assert len(index) <= generator.total_files
+
+    @pytest.mark.parametrize("use_hardlinks", [True, False])
+    @pytest.mark.parametrize("spec_name", SPECS)
+    def test_migrate_mo2_to_mo2(
+        self,
+        spec_name: str,
+        use_hardlinks: bool,
+        tmp_folder: Path,
+        recorder: BenchmarkRecorder,
+    ) -> None:
+        """
+        Benchmarks a full migration with
+        `core.migrator.migrator.Migrator.migrate()` from MO2 to MO2.
+        """
+
+        # given
+        generator = InstanceGenerator(TestBenchmarks.SPECS[spec_name])
+        src_info, instance = self.load_mo2_instance(generator, tmp_folder)
+        mo2 = ModOrganizer()
+        dst_path: Path = tmp_folder / "Destination Instance"
+        dst_info = MO2InstanceInfo(
+            display_name="Destination Instance",
+            game=src_info.game,
+            profile="Default",
+            is_global=False,
+            base_folder=dst_path,
+            mods_folder=dst_path / "mods",
+            profiles_folder=dst_path / "profiles",
+            install_mo2=False,
+        )
+
+        def migrate() -> MigrationReport:
+            return Migrator().migrate(
+                src_instance=instance,
+                src_info=src_info,
+                dst_info=dst_info,
+                src_mod_manager=mo2,
+                dst_mod_manager=mo2,
+                use_hardlinks=use_hardlinks,
+                replace=True,
+                modname_limit=TestBenchmarks.MODNAME_LIMIT,
+                activate_new_instance=False,
+                included_tools=instance.tools,
+            )
+
+        # when
+        report: MigrationReport = recorder.measure(
+            "migrator.migrate",
+            migrate,
+            setup=lambda: shutil.rmtree(dst_path, ignore_errors=True),
+            hardlinks=use_hardlinks,
+            **TestBenchmarks.get_params(spec_name, generator),
+        )
+
+        # then
+        assert not report.has_errors
+
+    RESOLVE_CALLS: int = 10_000
+    """Number of calls per run of the resolver benchmarks."""
+
+    @pytest.mark.parametrize("memoized", [False, True])
+    @pytest.mark.parametrize("input_type", ["path", "str"])
+    def test_env_resolver(
+        self, input_type: str, memoized: bool, recorder: BenchmarkRecorder
+    ) -> None:
+        """
+        Benchmarks `core.utilities.env_resolver.resolve()` with and without memoized
+        results.
+        """
+
+        # given
+        value: Path | str = (
+            Path("{userdata}") / "{game}" / "mods"
+            if input_type == "path"
+            else "{userdata}\\{game}\\mods"
+        )
+        vars: dict[str, str] = {"userdata": "C:\\Vortex", "game": "skyrimse"}
+
+        def resolve_value() -> Path | str:
+            return resolve(value, sep=("{", "}"), **vars)
+
+        def run() -> None:
+            for _ in range(TestBenchmarks.RESOLVE_CALLS):
+                if not memoized:
+                    RESOLVER.refresh()
+
+                resolve_value()
+
+        # when
+        recorder.measure(
+            "env_resolver.resolve",
+            run,
+            setup=RESOLVER.refresh,
+            input_type=input_type,
+            memoized=memoized,
+            calls=TestBenchmarks.RESOLVE_CALLS,
+        )
+
+        # then
+        assert resolve_value() == (
+            Path("C:\\Vortex") / "skyrimse" / "mods"
+            if input_type == "path"
+            else "C:\\Vortex\\skyrimse\\mods"
+        )
+
+    @pytest.mark.parametrize("codec_name", ["jstyleson", "json", "orjson"])
+    def test_leveldb_decode(
+        self, codec_name: str, data_folder: Path, recorder: BenchmarkRecorder
+    ) -> None:
+        """
+        Benchmarks decoding the values of `tests/data/full_state.v2.json` with the
+        comment-tolerant parser and the available codecs of
+        `core.utilities.json_codec`.
+        """
+
+        # given
+        if codec_name == "orjson" and not OrjsonCodec.is_available():
+            pytest.skip("orjson is not installed")
+
+        loads: Callable[[str], Any]
+        if codec_name == "jstyleson":
+            loads = jstyleson.loads
+        elif codec_name == "json":
+            loads = StdJsonCodec().loads
+        else:
+            loads = OrjsonCodec().loads
+        values: list[str] = list(
+            LevelDB.flatten_nested_dict(
+                json.loads((data_folder / "full_state.v2.json").read_text("utf8"))
+            ).values()
+        )
+
+        # when
+        decoded: list[Any] = recorder.measure(
+            "leveldb.decode",
+            lambda: [loads(value) for value in values],
+            codec=codec_name,
+            values=len(values),
+            bytes=sum(map(len, values)),
+        )
+
+        # then
+        assert decoded == [json.loads(value) for value in values]
@@ -0,0 +1,214 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import os
+import zipfile
+from pathlib import Path
+
+import py7zr
+import pytest
+from pytest_mock import MockerFixture
+
+from core.archive.archive import Archive
+from core.archive.archive_index import ArchiveEntry, ArchiveIndex
+from core.archive.rar import RARArchive
+from core.utilities.progress_update import ProgressUpdate
+
+
+class TestArchive:
+    """
+    Tests `core.archive.archive.Archive` and its subclasses.
+    """
+
+    FILES: dict[str, bytes] = {
+        "plugin.esp": b"plugin" * 1000,
+        "meshes/test.nif": b"mesh" * 20000,
+        "textures/sub/test.dds": b"texture" * 50000,
+        "empty.txt": b"",
+    }
+
+    @pytest.fixture(params=[".zip", ".7z"])
+    def archive_path(self, request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+        """
+        Creates a ZIP or 7z archive with `FILES`.
+        """
+
+        src_folder: Path = tmp_path / "src"
+        for filename, content in TestArchive.FILES.items():
+            (src_folder / filename).parent.mkdir(parents=True, exist_ok=True)
+            (src_folder / filename).write_bytes(content)
+
+        archive_path: Path = tmp_path / f"test{request.param}"
+        if request.param == ".zip":
+            with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+                for filename in TestArchive.FILES:
+                    archive.write(src_folder / filename, filename)
+        else:
+            with py7zr.SevenZipFile(archive_path, "w") as archive:
+                for filename in TestArchive.FILES:
+                    archive.write(src_folder / filename, filename)
+
+        return archive_path
+
+    def test_extract_all(self, archive_path: Path, tmp_path: Path) -> None:
+        """
+        Tests `Archive.extract_all()` with progress updates.
+        """
+
+        # given
+        archive: Archive = Archive.load_archive(archive_path)
+        dest: Path = tmp_path / "dest"
+        updates: list[ProgressUpdate] = []
+
+        # when
+        archive.extract_all(dest, progress_callback=updates.append)
+
+        # then
+        for filename, content in TestArchive.FILES.items():
+            assert (dest / filename).read_bytes() == content
+        total_size: int = sum(map(len, TestArchive.FILES.values()))
+        assert updates[-1].current == updates[-1].maximum == total_size
+
+    def test_extract_files(self, archive_path: Path, tmp_path: Path) -> None:
+        """
+        Tests `Archive.extract_files()` without full paths.
+        """
+
+        # given
+        archive: Archive = Archive.load_archive(archive_path)
+        dest: Path = tmp_path / "dest"
+
+        # when
+        archive.extract_files(["meshes/test.nif", "textures/sub/test.dds"], dest, False)
+
+        # then
+        assert sorted(file.name for file in dest.iterdir()) == ["test.dds", "test.nif"]
+        assert (dest / "test.nif").read_bytes() == TestArchive.FILES["meshes/test.nif"]
+
+    def test_index_cache(self, archive_path: Path, mocker: MockerFixture) -> None:
+        """
+        Tests that the index of an archive is read once and shared between instances
+        until the archive is modified.
+        """
+
+        # given
+        archive: Archive = Archive.load_archive(archive_path)
+        read_index = mocker.spy(type(archive), "_read_index")
+
+        # when
+        index: ArchiveIndex = archive.index
+        other_index: ArchiveIndex = Archive.load_archive(archive_path).index
+
+        # then
+        assert other_index is index
+        assert read_index.call_count == 1
+        assert sorted(archive.files) == sorted(TestArchive.FILES)
+        assert index.get_entries(["plugin.esp"])[0].size == len(
+            TestArchive.FILES["plugin.esp"]
+        )
+
+        # when
+        stat: os.stat_result = archive_path.stat()
+        os.utime(archive_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        # then
+        assert archive.index is not index
+        assert read_index.call_count == 2
+
+    def test_glob(self, archive_path: Path) -> None:
+        """
+        Tests that `Archive.glob()` ignores case and returns the original filenames.
+        """
+
+        # given
+        archive: Archive = Archive.load_archive(archive_path)
+
+        # then
+        assert archive.glob("*.ESP") == ["plugin.esp"]
+        assert archive.glob("Textures/**/*.dds") == ["textures/sub/test.dds"]
+        assert archive.glob("*.bsa") == []
+
+    def test_fallback(
+        self, archive_path: Path, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """
+        Tests that the 7-zip commandline is used if the in-process extraction fails.
+        """
+
+        # given
+        archive: Archive = Archive.load_archive(archive_path)
+        dest: Path = tmp_path / "dest"
+        mocker.patch.object(
+            archive, "_extract_in_process", side_effect=OSError("test error")
+        )
+        mocker.patch.object(Archive, "get_bin_path", return_value="7z")
+        commands: list[list[str]] = []
+        mocker.patch(
+            "core.archive.archive.run_process",
+            side_effect=lambda cmd: commands.append(list(cmd)),
+        )
+
+        # when
+        archive.extract("plugin.esp", dest)
+
+        # then
+        assert len(commands) == 1
+        assert commands[0][:6] == [
+            "7z",
+            "x",
+            f"-o{dest}",
+            "-aoa",
+            "-y",
+            str(archive_path),
+        ]
+        assert commands[0][6].startswith("@")
+
+    def test_solid_rar(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """
+        Tests that solid RAR archives are extracted with the 7-zip commandline.
+        """
+
+        # given
+        archive: Archive = RARArchive(tmp_path / "test.rar")
+        dest: Path = tmp_path / "dest"
+        mocker.patch.object(
+            RARArchive,
+            "index",
+            new_callable=mocker.PropertyMock,
+            return_value=ArchiveIndex(
+                [ArchiveEntry("plugin.esp", 6000, 100, 0, None)], solid=True
+            ),
+        )
+        extract_entries = mocker.patch.object(RARArchive, "_extract_entries")
+        mocker.patch.object(Archive, "get_bin_path", return_value="7z")
+        commands: list[list[str]] = []
+        mocker.patch(
+            "core.archive.archive.run_process",
+            side_effect=lambda cmd: commands.append(list(cmd)),
+        )
+
+        # when
+        archive.extract("plugin.esp", dest)
+
+        # then
+        extract_entries.assert_not_called()
+        assert len(commands) == 1
+        assert commands[0][1] == "x"
+
+    def test_get_destination(self, tmp_path: Path) -> None:
+        """
+        Tests that paths outside of the destination folder are rejected.
+        """
+
+        assert (
+            Archive._get_destination("a\\b.txt", tmp_path, True)
+            == tmp_path / "a" / "b.txt"
+        )
+        assert (
+            Archive._get_destination("a/b.txt", tmp_path, False) == tmp_path / "b.txt"
+        )
+
+        for filename in ["../evil.txt", "/evil.txt", "C:/evil.txt", "a/../../evil.txt"]:
+            with pytest.raises(ValueError):
+                Archive._get_destination(filename, tmp_path, True)
@@ -4,7 +4,7 @@ Copyright (c) Cutleast
 
 from base_test import BaseTest
 
-from core.migrator.file_blacklist import FileBlacklist
+from core.migrator.file_blacklist import FileBlacklist, FileBlacklistMatcher
 
 
 class TestFileBlacklist(BaseTest):
@@ -23,3 +23,50 @@ class TestFileBlacklist(BaseTest):
         # then
         assert len(files) > 0
         assert ".gitignore" in files
+
+    def test_get_matcher(self) -> None:
+        """
+        Tests `core.migrator.file_blacklist.FileBlacklist.get_matcher()`.
+        """
+
+        # when
+        matcher: FileBlacklistMatcher = FileBlacklist.get_matcher()
+
+        # then
+        assert matcher is FileBlacklist.get_matcher()
+        assert ".gitignore" in matcher
+        assert "Meta.INI" in matcher
+        assert "plugin.esp" not in matcher
+
+
+class TestFileBlacklistMatcher:
+    """
+    Tests `core.migrator.file_blacklist.FileBlacklistMatcher`.
+    """
+
+    def test_contains(self) -> None:
+        """
+        Tests that plain names and glob patterns are matched ignoring case.
+        """
+
+        # given
+        matcher = FileBlacklistMatcher(
+            ["desktop.ini", "", "*.BAK", "thumbs?.db", "[~]*.tmp"]
+        )
+
+        # then
+        assert matcher.names == frozenset(["desktop.ini"])
+        assert matcher.patterns == ["*.bak", "thumbs?.db", "[~]*.tmp"]
+
+        assert "Desktop.ini" in matcher
+        assert "plugin.esp.bak" in matcher
+        assert "PLUGIN.BAK" in matcher
+        assert "thumbs1.db" in matcher
+        assert "~test.tmp" in matcher
+
+        assert "desktop.ini.txt" not in matcher
+        assert "plugin.esp" not in matcher
+        assert "thumbs.db" not in matcher
+        assert "test.tmp" not in matcher
+        assert "" not in matcher
+        assert None not in matcher
@@ -0,0 +1,79 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import os
+from pathlib import Path
+
+from core.migrator.exceptions import (
+    FileChecksumMismatchError,
+    FileMissingError,
+    FileSizeMismatchError,
+)
+from core.migrator.file_verifier import FileVerifier
+
+
+class TestFileVerifier:
+    """
+    Tests `core.migrator.file_verifier.FileVerifier`.
+    """
+
+    def test_verify(self, tmp_path: Path) -> None:
+        """
+        Tests `core.migrator.file_verifier.FileVerifier.verify()` with intact,
+        hardlinked, missing, truncated and modified files.
+        """
+
+        # given
+        src_folder: Path = tmp_path / "src"
+        dst_folder: Path = tmp_path / "dst"
+        src_folder.mkdir()
+        dst_folder.mkdir()
+
+        files: dict[Path, Path] = {}
+        for name in ["copied", "hardlinked", "missing", "truncated", "modified"]:
+            src_path: Path = src_folder / name
+            src_path.write_bytes(os.urandom(FileVerifier.CHUNK_SIZE + 123))
+            files[src_path] = dst_folder / name
+
+        (dst_folder / "copied").write_bytes((src_folder / "copied").read_bytes())
+        os.link(src_folder / "hardlinked", dst_folder / "hardlinked")
+        (dst_folder / "truncated").write_bytes(
+            (src_folder / "truncated").read_bytes()[:-1]
+        )
+        modified_data = bytearray((src_folder / "modified").read_bytes())
+        modified_data[-1] ^= 0xFF
+        (dst_folder / "modified").write_bytes(modified_data)
+
+        # when
+        failed_files: dict[Path, Exception] = FileVerifier(max_workers=2).verify(files)
+
+        # then
+        assert set(failed_files) == {
+            dst_folder / "missing",
+            dst_folder / "truncated",
+            dst_folder / "modified",
+        }
+        assert isinstance(failed_files[dst_folder / "missing"], FileMissingError)
+        assert isinstance(failed_files[dst_folder / "truncated"], FileSizeMismatchError)
+        assert isinstance(
+            failed_files[dst_folder / "modified"], FileChecksumMismatchError
+        )
+
+    def test_verify_file_hardlink(self, tmp_path: Path) -> None:
+        """
+        Tests that `core.migrator.file_verifier.FileVerifier.verify_file()` does not
+        calculate checksums for hardlinked files.
+        """
+
+        # given
+        src_path: Path = tmp_path / "src"
+        dst_path: Path = tmp_path / "dst"
+        src_path.write_bytes(b"test")
+        os.link(src_path, dst_path)
+
+        # when
+        hashed: bool = FileVerifier.verify_file(src_path, dst_path)
+
+        # then
+        assert not hashed
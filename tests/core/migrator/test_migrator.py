@@ -87,6 +87,63 @@ class TestMigrator(BaseTest):
         self.assert_tools_equal(migrated_instance.tools, instance.tools)
         assert migrated_instance.game_folder == instance.game_folder
 
+    def test_verify_mo2_to_mo2(
+        self,
+        app_config: AppConfig,
+        test_fs: FakeFilesystem,
+        mo2_instance_info: MO2InstanceInfo,
+        instance: Instance,
+    ) -> None:
+        """
+        Tests `core.migrator.migrator.Migrator.verify()` after a migration from MO2 to
+        MO2 with a corrupted file.
+        """
+
+        # given
+        mo2 = ModOrganizer()
+        migrator = Migrator()
+        dst_path = Path("E:\\Modding\\Test Instance")
+        dst_info = MO2InstanceInfo(
+            display_name="Test Instance",
+            game=mo2_instance_info.game,
+            profile="Default",
+            is_global=False,
+            base_folder=dst_path,
+            mods_folder=dst_path / "mods",
+            profiles_folder=dst_path / "profiles",
+            install_mo2=False,
+        )
+        report: MigrationReport = migrator.migrate(
+            src_instance=instance,
+            src_info=mo2_instance_info,
+            dst_info=dst_info,
+            src_mod_manager=mo2,
+            dst_mod_manager=mo2,
+            use_hardlinks=False,
+            replace=True,
+            modname_limit=app_config.modname_limit,
+            activate_new_instance=app_config.activate_new_instance,
+            included_tools=instance.tools,
+            verify_files=True,
+        )
+        migrated_instance: Instance = mo2.load_instance(
+            dst_info, app_config.modname_limit, FileBlacklist.get_files()
+        )
+
+        # then
+        assert not report.failed_files
+
+        # when
+        migrated_files: dict[Path, Path] = Migrator.get_migrated_files(
+            instance, migrated_instance, mo2, FileBlacklist.get_files()
+        )
+        corrupted_file: Path = next(iter(migrated_files.values()))
+        corrupted_file.write_bytes(corrupted_file.read_bytes() + b"corrupted")
+        report = migrator.verify(instance, migrated_instance, mo2)
+
+        # then
+        assert list(report.failed_files) == [corrupted_file]
+
     def test_migration_mo2_to_vortex(
         self,
         app_config: AppConfig,
@@ -0,0 +1,164 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import zipfile
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from pytest_mock import MockerFixture
+
+from core.archive.archive import Archive
+from core.archive.archive_index import ArchiveEntry
+from core.instance.metadata import Metadata
+from core.instance.mod import Mod
+from core.mod_manager.archive_installer import ArchiveInstaller
+
+
+class TestArchiveInstaller:
+    """
+    Tests `core.mod_manager.archive_installer.ArchiveInstaller`.
+    """
+
+    FILES: dict[str, bytes] = {
+        "Plugin.esp": b"plugin" * 100,
+        "meshes/test.nif": b"mesh" * 200,
+        "textures/test.dds": b"texture" * 300,
+    }
+
+    @pytest.fixture
+    def mod(self, tmp_path: Path) -> Mod:
+        """
+        Creates a mod with `FILES` and a ZIP archive of them.
+        """
+
+        archive_path: Path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for filename, content in TestArchiveInstaller.FILES.items():
+                archive.writestr(filename, content)
+
+                file_path: Path = tmp_path / "mod" / filename.lower()
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.write_bytes(content)
+
+        return Mod(
+            display_name="Test Mod",
+            path=tmp_path / "mod",
+            deploy_path=None,
+            metadata=Metadata(
+                mod_id=None,
+                file_id=None,
+                version="",
+                file_name=archive_path.name,
+                game_id="",
+            ),
+            installed=True,
+            enabled=True,
+            archive_path=archive_path,
+        )
+
+    @staticmethod
+    def get_files() -> dict[Path, int]:
+        return {
+            Path(filename.lower()): len(content)
+            for filename, content in TestArchiveInstaller.FILES.items()
+        }
+
+    def test_match_files(self, mod: Mod) -> None:
+        """
+        Tests that files are matched case-insensitively by path and size.
+        """
+
+        # given
+        assert mod.archive_path is not None
+        archive: Archive = Archive.load_archive(mod.archive_path)
+        files: dict[Path, int] = TestArchiveInstaller.get_files()
+
+        # when
+        matches: Optional[dict[Path, ArchiveEntry]] = ArchiveInstaller.match_files(
+            archive.index, files
+        )
+
+        # then
+        assert matches is not None
+        assert matches[Path("plugin.esp")].filename == "Plugin.esp"
+
+        # when
+        files[Path("plugin.esp")] += 1
+
+        # then
+        assert ArchiveInstaller.match_files(archive.index, files) is None
+
+        # when
+        files = TestArchiveInstaller.get_files()
+        files[Path("missing.txt")] = 0
+
+        # then
+        assert ArchiveInstaller.match_files(archive.index, files) is None
+
+    def test_plan_modified_content(self, mod: Mod, mocker: MockerFixture) -> None:
+        """
+        Tests that files which were modified without changing their size are copied
+        and that the files are only read if the extraction is estimated to be faster.
+        """
+
+        # given
+        files: dict[Path, int] = TestArchiveInstaller.get_files()
+        plugin_path: Path = mod.path / "plugin.esp"
+        plugin_path.write_bytes(b"patchd" * 100)
+        get_crc = mocker.spy(ArchiveInstaller, "get_crc")
+
+        # when
+        mocker.patch.object(ArchiveInstaller, "COPY_FILE_COST", 0.0)
+        mocker.patch.object(ArchiveInstaller, "EXTRACTION_FILE_COST", 1.0)
+
+        # then
+        assert ArchiveInstaller.plan(mod, files) is None
+        get_crc.assert_not_called()
+
+        # when
+        mocker.patch.object(ArchiveInstaller, "COPY_FILE_COST", 1.0)
+        mocker.patch.object(ArchiveInstaller, "EXTRACTION_FILE_COST", 0.0)
+
+        # then
+        assert plugin_path.stat().st_size == files[Path("plugin.esp")]
+        assert ArchiveInstaller.plan(mod, files) is None
+        assert get_crc.call_count > 0
+
+    def test_plan(self, mod: Mod, mocker: MockerFixture) -> None:
+        """
+        Tests that the archive is only used if the extraction is estimated to be
+        faster than copying.
+        """
+
+        # given
+        files: dict[Path, int] = TestArchiveInstaller.get_files()
+
+        # when
+        mocker.patch.object(ArchiveInstaller, "COPY_FILE_COST", 1.0)
+        plan = ArchiveInstaller.plan(mod, files)
+
+        # then
+        assert plan is not None
+        assert plan[0].path == mod.archive_path
+        assert set(plan[1]) == set(files)
+
+        # when
+        mocker.patch.object(ArchiveInstaller, "COPY_FILE_COST", 0.0)
+        mocker.patch.object(ArchiveInstaller, "EXTRACTION_FILE_COST", 1.0)
+
+        # then
+        assert ArchiveInstaller.plan(mod, files) is None
+
+    def test_plan_without_archive(self, mod: Mod) -> None:
+        """
+        Tests that files are copied if the archive doesn't exist.
+        """
+
+        # given
+        assert mod.archive_path is not None
+        mod.archive_path.unlink()
+
+        # then
+        assert ArchiveInstaller.plan(mod, TestArchiveInstaller.get_files()) is None
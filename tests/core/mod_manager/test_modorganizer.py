@@ -352,6 +352,62 @@ class TestModOrganizer(BaseTest):
             migrated_overwriting_mod.files, overwriting_mod.files
         )
 
+    def test_install_mod_without_replace(
+        self, app_config: AppConfig, test_fs: FakeFilesystem, instance: Instance
+    ) -> None:
+        """
+        Tests `core.mod_manager.modorganizer.modorganizer.ModOrganizer.install_mod()`
+        without replacing existing files.
+        """
+
+        self.test_create_instance(test_fs)
+
+        # given
+        mo2 = ModOrganizer()
+        test_instance_path = Path("E:\\Modding\\Test Instance")
+        instance_data = MO2InstanceInfo(
+            display_name="Test Instance",
+            game=Game.get_game_by_id("skyrimse"),
+            profile="Default",
+            is_global=False,
+            base_folder=test_instance_path,
+            mods_folder=test_instance_path / "mods",
+            profiles_folder=test_instance_path / "profiles",
+            install_mo2=False,  # This is important for now as the download is not mocked, yet
+        )
+        dst_instance: Instance = mo2.load_instance(
+            instance_data, app_config.modname_limit, FileBlacklist.get_files()
+        )
+        mod: Mod = self.get_mod_by_name("Obsidian Weathers and Seasons", instance)
+        files: list[Path] = [
+            file
+            for file in mod.files
+            if file.name.lower() not in FileBlacklist.get_files()
+            and file.suffix != ".mohidden"
+            and file.name != "meta.ini"
+        ]
+        existing_file: Path = (
+            instance_data.mods_folder / "Obsidian Weathers and Seasons" / files[0]
+        )
+        existing_file.parent.mkdir(parents=True, exist_ok=True)
+        existing_file.write_text("existing")
+
+        # when
+        mo2.install_mod(
+            mod,
+            dst_instance,
+            instance_data,
+            file_redirects=mo2.get_actual_files(mod),
+            use_hardlinks=True,
+            replace=False,
+            blacklist=FileBlacklist.get_files(),
+        )
+
+        # then
+        assert existing_file.read_text() == "existing"
+        for file in files[1:]:
+            assert (dst_instance.get_installed_mod(mod).path / file).is_file()
+
     def test_install_mod_with_separator(
         self, app_config: AppConfig, test_fs: FakeFilesystem, instance: Instance
     ) -> None:
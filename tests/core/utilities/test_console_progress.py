@@ -0,0 +1,59 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from io import StringIO
+
+from core.utilities.console_progress import ConsoleProgress
+
+
+class TestConsoleProgress:
+    """
+    Tests `core.utilities.console_progress.ConsoleProgress`.
+    """
+
+    def test_format_progress(self) -> None:
+        """
+        Tests that a progress snapshot is formatted as a single line with the visible
+        rows only.
+        """
+
+        # given
+        progress: dict = {
+            "text": "Migrating mods... (1/4)",
+            "value": 1,
+            "max": 4,
+            "show2": True,
+            "text2": "Test Mod",
+            "show3": False,
+            "text3": "hidden.nif",
+        }
+
+        # when
+        line: str = ConsoleProgress.format_progress(progress)
+
+        # then
+        assert line == "[ 25%] Migrating mods... (1/4) | Test Mod"
+
+    def test_update_progress(self) -> None:
+        """
+        Tests that frequent updates are coalesced and unchanged lines are not
+        written twice.
+        """
+
+        # given
+        stream = StringIO()
+        progress = ConsoleProgress(stream, interval=3600)
+
+        # when
+        progress.updateProgress(text1="Loading mods...", value1=0, max1=100)
+        for i in range(1, 100):
+            progress.updateProgress(value1=i, show2=True, text2=f"Mod {i}")
+        progress.flush()
+        progress.flush()
+
+        # then
+        assert stream.getvalue().splitlines() == [
+            "[  0%] Loading mods...",
+            "[ 99%] Loading mods... | Mod 99",
+        ]
@@ -0,0 +1,122 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from core.utilities.download_cache import DownloadCache
+
+
+class TestDownloadCache:
+    """
+    Tests `core.utilities.download_cache.DownloadCache`.
+    """
+
+    URL: str = "https://example.com/download/test.7z"
+
+    @staticmethod
+    def create_file(folder: Path, name: str, content: bytes) -> Path:
+        folder.mkdir(parents=True, exist_ok=True)
+        file: Path = folder / name
+        file.write_bytes(content)
+
+        return file
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        """
+        Tests that a file is stored under its checksum and found by its url.
+        """
+
+        # given
+        cache = DownloadCache(tmp_path / "cache")
+        file: Path = TestDownloadCache.create_file(
+            tmp_path / "downloads", "test.7z", b"test content"
+        )
+        checksum: str = hashlib.sha256(b"test content").hexdigest()
+
+        # when
+        cached_file: Path = cache.put(TestDownloadCache.URL, file)
+        file.unlink()
+        result: Optional[tuple[Path, str]] = cache.get(TestDownloadCache.URL)
+
+        # then
+        assert cached_file == tmp_path / "cache" / checksum
+        assert result == (cached_file, "test.7z")
+        assert cached_file.read_bytes() == b"test content"
+        assert cache.get("https://example.com/other.7z") is None
+
+        # when
+        result = cache.get(TestDownloadCache.URL, checksum="0" * 64)
+
+        # then
+        assert result is None
+
+    def test_invalid_file(self, tmp_path: Path) -> None:
+        """
+        Tests that a modified cached file is deleted.
+        """
+
+        # given
+        cache = DownloadCache(tmp_path / "cache")
+        file: Path = TestDownloadCache.create_file(
+            tmp_path / "downloads", "test.7z", b"test content"
+        )
+        cached_file: Path = cache.put(TestDownloadCache.URL, file)
+        file.unlink()
+        cached_file.write_bytes(b"Test content")
+
+        # when
+        result: Optional[tuple[Path, str]] = cache.get(TestDownloadCache.URL)
+
+        # then
+        assert result is None
+        assert not cached_file.exists()
+
+    def test_eviction(self, tmp_path: Path) -> None:
+        """
+        Tests that the least recently used files are evicted when the cache exceeds
+        its maximum size.
+        """
+
+        # given
+        cache = DownloadCache(tmp_path / "cache", max_size=25)
+        downloads: Path = tmp_path / "downloads"
+        cache.put("url1", TestDownloadCache.create_file(downloads, "1", b"1" * 10))
+        cache.put("url2", TestDownloadCache.create_file(downloads, "2", b"2" * 10))
+        cache.get("url1")
+
+        # when
+        cache.put("url3", TestDownloadCache.create_file(downloads, "3", b"3" * 10))
+
+        # then
+        assert cache.get("url1") is not None
+        assert cache.get("url2") is None
+        assert cache.get("url3") is not None
+        assert len(list((tmp_path / "cache").iterdir())) == 3  # 2 files and index
+
+    def test_eviction_without_index(self, tmp_path: Path) -> None:
+        """
+        Tests that cached files which are missing from the index are evicted, too.
+        """
+
+        # given
+        cache = DownloadCache(tmp_path / "cache", max_size=25)
+        downloads: Path = tmp_path / "downloads"
+        cache.put("url1", TestDownloadCache.create_file(downloads, "1", b"1" * 10))
+        cache.put("url2", TestDownloadCache.create_file(downloads, "2", b"2" * 10))
+        (tmp_path / "cache" / DownloadCache.INDEX_FILE_NAME).write_text("{")
+
+        # when
+        cache.put("url3", TestDownloadCache.create_file(downloads, "3", b"3" * 10))
+
+        # then
+        assert cache.get("url3") is not None
+        cached_files: list[Path] = [
+            file
+            for file in (tmp_path / "cache").iterdir()
+            if file.name != DownloadCache.INDEX_FILE_NAME
+        ]
+        assert sum(file.stat().st_size for file in cached_files) <= 25
+        assert len(cached_files) == 2  # no temporary index files
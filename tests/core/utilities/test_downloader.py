@@ -0,0 +1,228 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import hashlib
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Generator, Optional, override
+
+import pytest
+from pytest_mock import MockerFixture
+
+from core.utilities.download_cache import DownloadCache
+from core.utilities.downloader import Downloader
+from core.utilities.exceptions import ChecksumMismatchError
+from core.utilities.progress_update import ProgressUpdate
+
+
+class DownloadServer(ThreadingHTTPServer):
+    """
+    Local HTTP server that serves a single file and supports range requests.
+    """
+
+    FILE_NAME: str = "test.7z"
+    CONTENT: bytes = bytes(range(256)) * 4096  # 1 MB
+
+    supports_ranges: bool
+    """Whether range requests are supported."""
+
+    requests: list[Optional[str]]
+    """List of the `Range` headers of all requests."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), DownloadRequestHandler)
+
+        self.supports_ranges = True
+        self.requests = []
+
+    @property
+    def url(self) -> str:
+        """
+        Url of the served file.
+        """
+
+        return f"http://127.0.0.1:{self.server_address[1]}/download"
+
+
+class DownloadRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler for `DownloadServer`.
+    """
+
+    server: DownloadServer
+
+    def do_GET(self) -> None:
+        range_header: Optional[str] = self.headers.get("Range")
+        self.server.requests.append(range_header)
+
+        content: bytes = DownloadServer.CONTENT
+        match: Optional[re.Match[str]] = (
+            re.fullmatch(r"bytes=(\d+)-(\d*)", range_header) if range_header else None
+        )
+
+        if match is not None and self.server.supports_ranges:
+            start: int = int(match.group(1))
+            end: int = int(match.group(2) or len(content) - 1)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+            content = content[start : end + 1]
+        else:
+            self.send_response(200)
+
+        if self.server.supports_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.send_header(
+            "Content-Disposition", f'attachment; filename="{DownloadServer.FILE_NAME}"'
+        )
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class TestDownloader:
+    """
+    Tests `core.utilities.downloader.Downloader` against a local HTTP server.
+    """
+
+    CHECKSUM: str = hashlib.sha256(DownloadServer.CONTENT).hexdigest()
+
+    @pytest.fixture
+    def server(self) -> Generator[DownloadServer, None, None]:
+        """
+        Starts a local download server.
+        """
+
+        server = DownloadServer()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        yield server
+
+        server.shutdown()
+        server.server_close()
+
+    def test_download(self, server: DownloadServer, tmp_path: Path) -> None:
+        """
+        Tests a download with a single connection and a checksum.
+        """
+
+        # given
+        updates: list[ProgressUpdate] = []
+
+        # when
+        dl_path: Path = Downloader().download(
+            server.url,
+            tmp_path,
+            progress_callback=updates.append,
+            checksum=TestDownloader.CHECKSUM,
+        )
+
+        # then
+        assert dl_path == tmp_path / DownloadServer.FILE_NAME
+        assert dl_path.read_bytes() == DownloadServer.CONTENT
+        assert server.requests == [None]
+        assert updates[-1].current == updates[-1].maximum == len(DownloadServer.CONTENT)
+        assert list(tmp_path.iterdir()) == [dl_path]
+
+    def test_resume(self, server: DownloadServer, tmp_path: Path) -> None:
+        """
+        Tests that an interrupted download is resumed from its part file.
+        """
+
+        # given
+        part_path: Path = tmp_path / (DownloadServer.FILE_NAME + ".part")
+        part_path.write_bytes(DownloadServer.CONTENT[:1000])
+
+        # when
+        dl_path: Path = Downloader().download(
+            server.url, tmp_path, checksum=TestDownloader.CHECKSUM
+        )
+
+        # then
+        assert dl_path.read_bytes() == DownloadServer.CONTENT
+        assert server.requests == [
+            None,
+            f"bytes=1000-{len(DownloadServer.CONTENT) - 1}",
+        ]
+        assert not part_path.exists()
+
+    def test_resume_unsupported(self, server: DownloadServer, tmp_path: Path) -> None:
+        """
+        Tests that a part file is discarded if the server doesn't support range
+        requests.
+        """
+
+        # given
+        server.supports_ranges = False
+        part_path: Path = tmp_path / (DownloadServer.FILE_NAME + ".part")
+        part_path.write_bytes(b"invalid")
+
+        # when
+        dl_path: Path = Downloader().download(server.url, tmp_path)
+
+        # then
+        assert dl_path.read_bytes() == DownloadServer.CONTENT
+        assert server.requests == [None]
+
+    def test_segments(
+        self, server: DownloadServer, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """
+        Tests a download in parallel segments.
+        """
+
+        # given
+        mocker.patch.object(Downloader, "MIN_SEGMENT_SIZE", 256 * 1024)
+
+        # when
+        dl_path: Path = Downloader().download(
+            server.url, tmp_path, segments=8, checksum=TestDownloader.CHECKSUM
+        )
+
+        # then
+        assert dl_path.read_bytes() == DownloadServer.CONTENT
+        assert sorted(server.requests[1:]) == [
+            "bytes=0-262143",
+            "bytes=262144-524287",
+            "bytes=524288-786431",
+            "bytes=786432-1048575",
+        ]
+        assert list(tmp_path.iterdir()) == [dl_path]
+
+    def test_checksum_mismatch(self, server: DownloadServer, tmp_path: Path) -> None:
+        """
+        Tests that a download with a wrong checksum is deleted.
+        """
+
+        # when
+        with pytest.raises(ChecksumMismatchError):
+            Downloader().download(server.url, tmp_path, checksum="0" * 64)
+
+        # then
+        assert list(tmp_path.iterdir()) == []
+
+    def test_single_download_cache(
+        self, server: DownloadServer, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """
+        Tests that a cached download is used instead of downloading it again.
+        """
+
+        # given
+        mocker.patch.object(Downloader, "cache", DownloadCache(tmp_path / "cache"))
+        Downloader.single_download(server.url, tmp_path / "instance1")
+
+        # when
+        dl_path: Path = Downloader.single_download(server.url, tmp_path / "instance2")
+
+        # then
+        assert dl_path == tmp_path / "instance2" / DownloadServer.FILE_NAME
+        assert dl_path.read_bytes() == DownloadServer.CONTENT
+        assert server.requests == [None]
@@ -5,7 +5,9 @@ Copyright (c) Cutleast
 import os
 from pathlib import Path
 
-from core.utilities.env_resolver import resolve
+import pytest
+
+from core.utilities.env_resolver import EnvResolver, resolve
 
 
 class TestEnvResolver:
@@ -99,3 +101,44 @@ class TestEnvResolver:
 
         # then
         assert expected_output == real_output
+
+    def test_resolve_str_custom_sep(self) -> None:
+        """
+        Tests `core.utilities.env_resolver.resolve()` on a string with custom variable
+        indicators.
+        """
+
+        # given
+        input_value: str = "{game}\\mods\\{game}"
+        expected_output: str = "C:\\Modding\\game\\mods\\C:\\Modding\\game"
+
+        # when
+        real_output: str = resolve(
+            input_value, sep=("{", "}"), game="C:\\Modding\\game"
+        )
+
+        # then
+        assert expected_output == real_output
+
+    def test_memoization(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that `core.utilities.env_resolver.EnvResolver` memoizes its results
+        until it is refreshed.
+        """
+
+        # given
+        resolver = EnvResolver()
+        monkeypatch.setenv("MMM_TEST_VAR", "first")
+
+        # when
+        first_output: Path = resolver.resolve_path(Path("%MMM_TEST_VAR%") / "test")
+        monkeypatch.setenv("MMM_TEST_VAR", "second")
+        cached_output: Path = resolver.resolve_path(Path("%MMM_TEST_VAR%") / "test")
+        resolver.refresh()
+        refreshed_output: Path = resolver.resolve_path(Path("%MMM_TEST_VAR%") / "test")
+
+        # then
+        assert first_output == cached_output == Path("first") / "test"
+        assert refreshed_output == Path("second") / "test"
+        assert resolver.resolve_str("%MMM_TEST_VAR%") == "second"
+        assert resolver.resolve_str("%MMM_TEST_VAR%", test="x") == "second"
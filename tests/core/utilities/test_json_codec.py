@@ -0,0 +1,68 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import Any
+
+import pytest
+
+from core.utilities.json_codec import (
+    JsonCodec,
+    OrjsonCodec,
+    StdJsonCodec,
+    get_default_codec,
+)
+
+
+class TestJsonCodec:
+    """
+    Tests `core.utilities.json_codec`.
+    """
+
+    VALUE: dict[str, Any] = {
+        "name": "Test Mod - Ümlaut",
+        "version": "1.0",
+        "enabled": True,
+        "size": 12345,
+        "rules": [{"type": "before", "reference": {"id": "other"}}],
+        "empty": None,
+    }
+
+    @staticmethod
+    def get_codecs() -> list[JsonCodec]:
+        codecs: list[JsonCodec] = [StdJsonCodec()]
+        if OrjsonCodec.is_available():
+            codecs.append(OrjsonCodec())
+
+        return codecs
+
+    @pytest.mark.parametrize("codec", get_codecs(), ids=lambda c: type(c).__name__)
+    def test_round_trip(self, codec: JsonCodec) -> None:
+        """
+        Tests that encoded values are compact and decoded to the original value.
+        """
+
+        # when
+        encoded: str = codec.dumps(TestJsonCodec.VALUE)
+
+        # then
+        assert ", " not in encoded and ": " not in encoded
+        assert codec.loads(encoded) == TestJsonCodec.VALUE
+        assert codec.loads(encoded.encode()) == TestJsonCodec.VALUE
+        assert codec.dumps("value") == '"value"'
+
+        with pytest.raises(ValueError):
+            codec.loads("// comment\n{}")
+
+    def test_get_default_codec(self) -> None:
+        """
+        Tests that orjson is used if it is installed.
+        """
+
+        # when
+        codec: JsonCodec = get_default_codec()
+
+        # then
+        assert isinstance(
+            codec, OrjsonCodec if OrjsonCodec.is_available() else StdJsonCodec
+        )
@@ -0,0 +1,47 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import sys
+from types import ModuleType
+
+import pytest
+
+from core.utilities.lazy_import import lazy_import
+
+
+class TestLazyImport:
+    """
+    Tests `core.utilities.lazy_import.lazy_import()`.
+    """
+
+    def test_lazy_import(self) -> None:
+        """
+        Tests that a module is only executed on first attribute access.
+        """
+
+        # given
+        sys.modules.pop("colorsys", None)
+
+        # when
+        module: ModuleType = lazy_import("colorsys")
+
+        # then
+        assert sys.modules["colorsys"] is module
+        assert module.__spec__ is not None
+        assert module.__spec__.loader_state is not None
+
+        # when
+        result: tuple[float, float, float] = module.rgb_to_hsv(1.0, 0.0, 0.0)
+
+        # then
+        assert result == (0.0, 1.0, 1.0)
+        assert lazy_import("colorsys") is module
+
+    def test_lazy_import_not_found(self) -> None:
+        """
+        Tests that importing a non-existing module raises a `ModuleNotFoundError`.
+        """
+
+        with pytest.raises(ModuleNotFoundError):
+            lazy_import("non_existing_module")
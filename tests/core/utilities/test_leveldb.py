@@ -7,6 +7,7 @@ from typing import Any
 
 import pytest
 from base_test import BaseTest
+from pytest_mock import MockerFixture
 from setup.mock_plyvel import MockPlyvelDB
 
 from core.utilities.leveldb import LevelDB
@@ -79,6 +80,114 @@ class TestLevelDB(BaseTest):
             == "gog"
         )
 
+    def test_dump_with_original(
+        self, mods_db: MockPlyvelDB, mocker: MockerFixture
+    ) -> None:
+        """
+        Tests `core.utilities.leveldb.LevelDB.dump()` with the original data.
+        """
+
+        # given
+        leveldb = LevelDB(Path(), use_symlink=False)
+        prefix: str = "persistent###mods###skyrimse###"
+        original: dict[str, Any] = {
+            "modA": {"state": "installed", "attributes": {"version": "1.0"}},
+            "modB": {"state": "installed"},
+        }
+        data: dict[str, Any] = {
+            "modA": {"state": "installed", "attributes": {"version": "1.1"}},
+            "modD": {"state": "installed"},
+        }
+        put_spy = mocker.spy(mods_db, "put")
+
+        # when
+        leveldb.dump(data, prefix=prefix, original=original)
+
+        # then
+        assert [call.args[0] for call in put_spy.call_args_list] == [
+            b"persistent###mods###skyrimse###modA###attributes###version",
+            b"persistent###mods###skyrimse###modD###state",
+        ]
+        assert leveldb.get_key(prefix + "modA###attributes###version") == "1.1"
+        assert leveldb.get_key(prefix + "modA###state") == "installed"
+        assert leveldb.get_key(prefix + "modB###state") is None
+        assert leveldb.get_key(prefix + "modD###state") == "installed"
+
+    @pytest.fixture
+    def mods_db(self, mocker: MockerFixture) -> MockPlyvelDB:
+        """
+        Mocks the plyvel.DB class with a small database of mods.
+        """
+
+        mock_instance = MockPlyvelDB(
+            {
+                b"persistent###mods###skyrimse###modA###state": b'"installed"',
+                b"persistent###mods###skyrimse###modA###attributes###version": b'"1.0"',
+                b"persistent###mods###skyrimse###modAB###state": b'"installed"',
+                b"persistent###mods###skyrimse###modB###state": b'"installed"',
+                b"persistent###mods###fallout4###modC###state": b'"installed"',
+                b"persistent###mods###skyrimse###invalid": b"{invalid",
+            }
+        )
+        mocker.patch("plyvel.DB", return_value=mock_instance)
+
+        return mock_instance
+
+    def test_iter_prefix(self, mods_db: MockPlyvelDB) -> None:
+        """
+        Tests `core.utilities.leveldb.LevelDB.iter_prefix()`.
+        """
+
+        # given
+        leveldb = LevelDB(Path(), use_symlink=False)
+
+        # when
+        items: list[tuple[tuple[str, ...], Any]] = list(
+            leveldb.iter_prefix("persistent###mods###skyrimse###modA")
+        )
+
+        # then
+        assert items == [
+            (
+                ("persistent", "mods", "skyrimse", "modA", "attributes", "version"),
+                "1.0",
+            ),
+            (("persistent", "mods", "skyrimse", "modA", "state"), "installed"),
+            (("persistent", "mods", "skyrimse", "modAB", "state"), "installed"),
+        ]
+
+    def test_load_prefixes(self, mods_db: MockPlyvelDB) -> None:
+        """
+        Tests `core.utilities.leveldb.LevelDB.load_prefixes()`.
+        """
+
+        # given
+        leveldb = LevelDB(Path(), use_symlink=False)
+
+        # when
+        data: dict[str, Any] = leveldb.load_prefixes(
+            [
+                "persistent###mods###skyrimse###modA###",
+                "persistent###mods###skyrimse###modB###",
+                "persistent###mods###skyrimse###missing###",
+            ]
+        )
+
+        # then
+        assert data == {
+            "persistent": {
+                "mods": {
+                    "skyrimse": {
+                        "modA": {
+                            "state": "installed",
+                            "attributes": {"version": "1.0"},
+                        },
+                        "modB": {"state": "installed"},
+                    }
+                }
+            }
+        }
+
     def test_flatten_nested_dict(self) -> None:
         """
         Tests `core.utilities.leveldb.LevelDB.flatten_nested_dict()`.
@@ -0,0 +1,82 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+import threading
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from core.utilities.logger import Logger
+
+
+class TestLogger:
+    """
+    Tests `core.utilities.logger.Logger`.
+    """
+
+    def test_logging(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """
+        Tests that messages from several threads are written to the log file and
+        passed to the callback and that only the newest messages are kept in memory.
+        """
+
+        # given
+        mocker.patch.object(Logger, "BUFFER_SIZE", 10)
+        log_file: Path = tmp_path / "logs" / "test.log"
+        logger = Logger(log_file, "%(name)s: %(message)s")
+        logger.setLevel(Logger.Level.DEBUG)
+        messages: list[str] = []
+        logger.set_callback(messages.append)
+        test_logger: logging.Logger = logging.getLogger("TestLogger")
+
+        def log_messages(thread_id: int) -> None:
+            for i in range(100):
+                test_logger.debug("Message %d-%d", thread_id, i)
+
+        threads: list[threading.Thread] = [
+            threading.Thread(target=log_messages, args=(i,)) for i in range(4)
+        ]
+
+        try:
+            # when
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            test_logger.info("Last message")
+            content: str = logger.get_content()
+
+            # then
+            lines: list[str] = log_file.read_text(encoding="utf8").splitlines()
+            assert len(lines) == 401
+            assert "TestLogger: Message 3-99" in lines
+            assert lines[-1] == "TestLogger: Last message"
+            assert len(messages) == 401
+            assert messages[-1] == "TestLogger: Last message\n"
+            assert len(content.splitlines()) == 10
+            assert content.endswith("TestLogger: Last message\n")
+
+        finally:
+            logger.close()
+
+    def test_close(self, tmp_path: Path) -> None:
+        """
+        Tests that pending messages are written when the logger is closed.
+        """
+
+        # given
+        log_file: Path = tmp_path / "test.log"
+        logger = Logger(log_file, "%(message)s")
+        logger.setLevel(Logger.Level.INFO)
+
+        # when
+        for i in range(1000):
+            logging.getLogger("TestLogger").info(f"Message {i}")
+        logger.close()
+
+        # then
+        lines: list[str] = log_file.read_text(encoding="utf8").splitlines()
+        assert len(lines) == 1000
+        assert lines[-1] == "Message 999"
@@ -0,0 +1,195 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from core.utilities.path_prober import PathProber
+
+
+class TestPathProber:
+    """
+    Tests `core.utilities.path_prober.PathProber`.
+    """
+
+    def test_probe(self, tmp_path: Path, qtbot: QtBot) -> None:
+        """
+        Tests that existing and missing files are reported and cached.
+        """
+
+        # given
+        existing_file: Path = tmp_path / "tool.exe"
+        existing_file.touch()
+        missing_file: Path = tmp_path / "missing.exe"
+        prober = PathProber()
+        results: dict[Path, bool] = {}
+        prober.path_probed.connect(lambda path, exists: results.update({path: exists}))
+
+        # when
+        prober.probe([existing_file, missing_file, existing_file])
+        qtbot.waitUntil(lambda: len(results) == 2, timeout=5000)
+
+        # then
+        assert results == {existing_file: True, missing_file: False}
+        assert PathProber.get_cached(existing_file) is True
+        assert PathProber.get_cached(missing_file) is False
+        assert PathProber.get_cached(tmp_path / "other.exe") is None
+
+        # when
+        results.clear()
+        prober.probe([existing_file])
+        qtbot.wait(50)
+
+        # then
+        assert results == {}
+
+    def test_timeout(self, tmp_path: Path, qtbot: QtBot, mocker: MockerFixture) -> None:
+        """
+        Tests that paths that take too long are reported as missing until their
+        actual result arrives.
+        """
+
+        # given
+        slow_file: Path = tmp_path / "slow.exe"
+        slow_file.touch()
+        release = threading.Event()
+        is_file = Path.is_file
+
+        def slow_is_file(path: Path) -> bool:
+            if path == slow_file:
+                release.wait(5)
+            return is_file(path)
+
+        mocker.patch.object(Path, "is_file", slow_is_file)
+        mocker.patch.object(PathProber, "TIMEOUT", 0.1)
+        prober = PathProber()
+        results: list[tuple[Path, bool]] = []
+        prober.path_probed.connect(lambda path, exists: results.append((path, exists)))
+
+        # when
+        prober.probe([slow_file])
+        qtbot.waitUntil(lambda: len(results) == 1, timeout=5000)
+
+        # then
+        assert results == [(slow_file, False)]
+        assert PathProber.get_cached(slow_file) is None
+
+        # when
+        release.set()
+        qtbot.waitUntil(lambda: len(results) == 2, timeout=5000)
+
+        # then
+        assert results[1] == (slow_file, True)
+        assert PathProber.get_cached(slow_file) is True
+
+    def test_queue(self, tmp_path: Path, qtbot: QtBot, mocker: MockerFixture) -> None:
+        """
+        Tests that queued paths don't time out while they wait behind a hanging path.
+        """
+
+        # given
+        hanging_file: Path = tmp_path / "hanging.exe"
+        local_file: Path = tmp_path / "local.exe"
+        local_file.touch()
+        release = threading.Event()
+        is_file = Path.is_file
+
+        def hanging_is_file(path: Path) -> bool:
+            if path == hanging_file:
+                release.wait(5)
+            return is_file(path)
+
+        mocker.patch.object(Path, "is_file", hanging_is_file)
+        mocker.patch.object(PathProber, "TIMEOUT", 0.2)
+        mocker.patch.object(PathProber, "MAX_WORKERS", 1)
+        prober = PathProber()
+        results: list[tuple[Path, bool]] = []
+        prober.path_probed.connect(lambda path, exists: results.append((path, exists)))
+
+        # when
+        prober.probe([hanging_file, local_file])
+        qtbot.waitUntil(lambda: len(results) == 2, timeout=5000)
+        release.set()
+
+        # then
+        assert results == [(hanging_file, False), (local_file, True)]
+
+    def test_deleted_prober(
+        self, tmp_path: Path, qtbot: QtBot, mocker: MockerFixture
+    ) -> None:
+        """
+        Tests that a deleted prober doesn't report results of its pending paths.
+        """
+
+        # given
+        slow_file: Path = tmp_path / "deleted.exe"
+        slow_file.touch()
+        release = threading.Event()
+        is_file = Path.is_file
+
+        def slow_is_file(path: Path) -> bool:
+            if path == slow_file:
+                release.wait(5)
+            return is_file(path)
+
+        mocker.patch.object(Path, "is_file", slow_is_file)
+        prober = PathProber()
+        results: list[tuple[Path, bool]] = []
+        prober.path_probed.connect(lambda path, exists: results.append((path, exists)))
+
+        # when
+        prober.probe([slow_file])
+        with qtbot.waitSignal(prober.destroyed, timeout=5000):
+            prober.deleteLater()
+        release.set()
+        qtbot.waitUntil(lambda: PathProber.get_cached(slow_file) is not None)
+        qtbot.wait(2 * PathProber.POLL_INTERVAL)
+
+        # then
+        assert results == []
+
+    def test_saturated_pool(
+        self, tmp_path: Path, qtbot: QtBot, mocker: MockerFixture
+    ) -> None:
+        """
+        Tests that paths that wait for a free thread time out, too, if all threads of
+        the pool hang.
+        """
+
+        # given
+        hanging_file: Path = tmp_path / "saturated.exe"
+        hanging_file.touch()
+        waiting_file: Path = tmp_path / "waiting.exe"
+        waiting_file.touch()
+        release = threading.Event()
+        is_file = Path.is_file
+
+        def hanging_is_file(path: Path) -> bool:
+            if path == hanging_file:
+                release.wait(5)
+            return is_file(path)
+
+        mocker.patch.object(Path, "is_file", hanging_is_file)
+        mocker.patch.object(PathProber, "TIMEOUT", 0.2)
+        executor = ThreadPoolExecutor(max_workers=1)
+        mocker.patch.object(PathProber, "_PathProber__executor", executor)
+        prober = PathProber()
+        results: list[tuple[Path, bool]] = []
+        prober.path_probed.connect(lambda path, exists: results.append((path, exists)))
+
+        # when
+        prober.probe([hanging_file, waiting_file])
+        qtbot.waitUntil(lambda: len(results) == 2, timeout=5000)
+        release.set()
+        qtbot.waitUntil(lambda: len(results) == 3, timeout=5000)
+        executor.shutdown()
+
+        # then
+        assert sorted(results[:2]) == [(hanging_file, False), (waiting_file, False)]
+        assert results[2] == (hanging_file, True)
+        assert PathProber.get_cached(waiting_file) is None
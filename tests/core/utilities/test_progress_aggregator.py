@@ -0,0 +1,65 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from threading import Thread
+from typing import Any, Optional
+
+from core.utilities.progress_aggregator import ProgressAggregator
+
+
+class TestProgressAggregator:
+    """
+    Tests `core.utilities.progress_aggregator.ProgressAggregator`.
+    """
+
+    def test_poll(self) -> None:
+        """
+        Tests that `ProgressAggregator.poll()` returns the coalesced latest values
+        only once.
+        """
+
+        # given
+        progress = ProgressAggregator()
+
+        # when
+        progress.update(text="Migrating mods...", value=0, max=3)
+        progress.update(value=1, text2="Mod 1")
+        progress.update(value=2, text2=None)
+        snapshot: Optional[dict[str, Any]] = progress.poll()
+
+        # then
+        assert snapshot == {
+            "text": "Migrating mods...",
+            "value": 2,
+            "max": 3,
+            "text2": "Mod 1",
+        }
+        assert progress.poll() is None
+        assert progress.update_count == 3
+
+    def test_concurrent_updates(self) -> None:
+        """
+        Tests that the latest value of a worker thread is visible to the reader.
+        """
+
+        # given
+        progress = ProgressAggregator()
+        num_of_updates: int = 100_000
+
+        def worker() -> None:
+            for i in range(num_of_updates):
+                progress.update(value=i + 1, max=num_of_updates)
+
+        thread = Thread(target=worker)
+
+        # when
+        snapshot: Optional[dict[str, Any]] = None
+        thread.start()
+        while thread.is_alive():
+            snapshot = progress.poll() or snapshot
+        thread.join()
+        snapshot = progress.poll() or snapshot
+
+        # then
+        assert snapshot == {"value": num_of_updates, "max": num_of_updates}
@@ -0,0 +1,81 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from core.utilities.search_index import SearchIndex
+
+
+class TestSearchIndex:
+    """
+    Tests `core.utilities.search_index.SearchIndex`.
+    """
+
+    def test_search(self) -> None:
+        """
+        Tests searching with and without case sensitivity.
+        """
+
+        # given
+        index: SearchIndex[int] = SearchIndex(
+            [
+                (1, ["Unofficial Skyrim Patch"]),
+                (2, ["SkyUI"]),
+                (3, [" skyrim 202X "]),
+                (4, ["Static Mesh Improvement Mod"]),
+            ]
+        )
+
+        # when/then
+        assert index.search(None) == [1, 2, 3, 4]
+        assert index.search("") == [1, 2, 3, 4]
+        assert index.search("sky") == [1, 2, 3]
+        assert index.search("Sky", case_sensitive=True) == [1, 2]
+        assert index.search(" skyrim ") == [1, 3]
+        assert index.search("nothing") == []
+
+    def test_search_multiple_texts(self) -> None:
+        """
+        Tests that an item matches if any of its texts matches, but not across the
+        boundary of two texts.
+        """
+
+        # given
+        index: SearchIndex[str] = SearchIndex(
+            [
+                ("xEdit", ["SSEEdit", "tools/SSEEdit.exe", "-quickautoclean"]),
+                ("BodySlide", ["BodySlide", "CalienteTools/BodySlide.exe", ""]),
+            ]
+        )
+
+        # when/then
+        assert index.search("quickauto") == ["xEdit"]
+        assert index.search(".exe") == ["xEdit", "BodySlide"]
+        assert index.search("exe-quick") == []
+
+    def test_incremental_search(self) -> None:
+        """
+        Tests that extending, shortening and replacing the search text return the
+        same results as a fresh search.
+        """
+
+        # given
+        names: list[str] = ["alpha", "alphabet", "beta", "Alpine", "gamma"]
+        index: SearchIndex[str] = SearchIndex((name, [name]) for name in names)
+
+        # when/then
+        for text, case_sensitive in [
+            ("a", False),
+            ("al", False),
+            ("alp", False),
+            ("alph", False),
+            ("alp", False),
+            ("Alp", True),
+            ("alp", False),
+            ("e", False),
+            ("et", False),
+            ("", False),
+        ]:
+            expected: list[str] = SearchIndex((n, [n]) for n in names).search(
+                text, case_sensitive
+            )
+            assert index.search(text, case_sensitive) == expected
@@ -0,0 +1,81 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import threading
+
+from pytestqt.qtbot import QtBot
+
+from core.utilities.startup_scheduler import StartupScheduler
+
+
+class TestStartupScheduler:
+    """
+    Tests `core.utilities.startup_scheduler.StartupScheduler`.
+    """
+
+    def test_measure(self) -> None:
+        """
+        Tests that synchronous startup phases are measured in order.
+        """
+
+        # given
+        scheduler = StartupScheduler()
+
+        # when
+        with scheduler.measure("config"):
+            pass
+        with scheduler.measure("main window"):
+            pass
+
+        # then
+        assert [(kind, name) for kind, name, _ in scheduler.get_timings()] == [
+            ("startup", "config"),
+            ("startup", "main window"),
+        ]
+        assert scheduler.ready_time is None
+
+    def test_start(self, qtbot: QtBot) -> None:
+        """
+        Tests that deferred tasks run in the main thread after the scheduler was
+        started and that the results of background tasks are passed to their
+        callbacks in the main thread.
+        """
+
+        # given
+        scheduler = StartupScheduler()
+        main_thread: threading.Thread = threading.current_thread()
+        calls: list[tuple[str, threading.Thread]] = []
+
+        def background_task() -> str:
+            calls.append(("background", threading.current_thread()))
+            return "result"
+
+        def callback(result: str) -> None:
+            calls.append((result, threading.current_thread()))
+
+        def failing_task() -> None:
+            raise ValueError
+
+        scheduler.defer(
+            "deferred", lambda: calls.append(("deferred", threading.current_thread()))
+        )
+        scheduler.defer("failing", failing_task)
+        scheduler.run_in_background("background", background_task, callback)
+
+        # when
+        scheduler.start()
+        qtbot.waitUntil(lambda: len(scheduler.get_timings()) == 3, timeout=5000)
+
+        # then
+        assert scheduler.ready_time is not None
+        assert ("deferred", main_thread) in calls
+        assert ("result", main_thread) in calls
+        assert any(
+            name == "background" and thread is not main_thread for name, thread in calls
+        )
+        assert sorted(name for _, name, _ in scheduler.get_timings()) == [
+            "background",
+            "deferred",
+            "failing",
+        ]
@@ -0,0 +1,99 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Generator
+
+import pytest
+
+from core.utilities.tracer import Tracer
+
+
+class TestTracer:
+    """
+    Tests `core.utilities.tracer.Tracer`.
+    """
+
+    @pytest.fixture(autouse=True)
+    def reset_tracer(self) -> Generator[None, None, None]:
+        """
+        Resets the tracer before and after each test.
+        """
+
+        Tracer.reset()
+        yield
+        Tracer.set_enabled(False)
+        Tracer.reset()
+
+    def test_disabled(self) -> None:
+        """
+        Tests that nothing is recorded while tracing is disabled.
+        """
+
+        # given
+        Tracer.set_enabled(False)
+
+        # when
+        with Tracer.span("migrate.transfer") as span:
+            span.add("files")
+        Tracer.count("leveldb.keys_read", 10)
+
+        # then
+        assert not Tracer.has_data()
+
+    def test_span_and_export(self, tmp_path: Path) -> None:
+        """
+        Tests that nested spans, their values and counters are exported as trace.
+        """
+
+        # given
+        Tracer.set_enabled(True)
+        trace_file: Path = tmp_path / "test.trace.json"
+
+        @Tracer.traced("migrate")
+        def migrate() -> None:
+            for _ in range(2):
+                with Tracer.span("migrate.transfer", mod="Test Mod") as span:
+                    span.add("files", 3)
+                    span.add("bytes", 1024)
+
+        # when
+        migrate()
+        Tracer.count("leveldb.keys_read", 5)
+        Tracer.export(trace_file)
+
+        # then
+        trace: dict[str, Any] = json.loads(trace_file.read_text("utf8"))
+        events: list[dict[str, Any]] = trace["traceEvents"]
+        assert [event["name"] for event in events] == [
+            "migrate.transfer",
+            "migrate.transfer",
+            "migrate",
+        ]
+        assert events[0]["args"] == {"mod": "Test Mod", "files": 3, "bytes": 1024}
+        assert events[2]["ts"] <= events[0]["ts"]
+        assert events[2]["dur"] >= events[0]["dur"] + events[1]["dur"]
+
+        summary: dict[str, dict[str, int | float]] = trace["otherData"]["summary"]
+        assert summary["migrate.transfer"]["calls"] == 2
+        assert summary["migrate.transfer"]["files"] == 6
+        assert summary["migrate.transfer"]["bytes"] == 2048
+        assert trace["otherData"]["counters"] == {"leveldb.keys_read": 5}
+
+    def test_span_with_exception(self) -> None:
+        """
+        Tests that a span is recorded even if its block raises an exception.
+        """
+
+        # given
+        Tracer.set_enabled(True)
+
+        # when
+        with pytest.raises(ValueError):
+            with Tracer.span("load.scan"):
+                raise ValueError
+
+        # then
+        assert Tracer.get_summary()["load.scan"]["calls"] == 1
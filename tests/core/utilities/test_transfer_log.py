@@ -0,0 +1,107 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import gzip
+import logging
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from core.utilities.transfer_log import Transfer, TransferLog
+
+
+class TestTransferLog:
+    """
+    Tests `core.utilities.transfer_log.TransferLog`.
+    """
+
+    @pytest.fixture(autouse=True)
+    def reset(self) -> Generator[None, None, None]:
+        """
+        Restores the default configuration after each test.
+        """
+
+        yield
+
+        TransferLog.configure(summary=True)
+
+    @staticmethod
+    def record_files(transfer: Transfer) -> None:
+        transfer.linked(Path("src/a.esp"), Path("dst/a.esp"), 100)
+        transfer.copied(Path("src/b.bsa"), Path("dst/b.bsa"), 50)
+        transfer.replaced(Path("dst/b.bsa"))
+        transfer.skipped(Path("dst/c.ini"), "existing file")
+        transfer.blacklisted(Path("desktop.ini"))
+
+    def test_summary(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """
+        Tests that only one summary line is logged per transfer and that every file
+        is written to the detail file.
+        """
+
+        # given
+        detail_path: Path = tmp_path / "test.transfers.gz"
+        TransferLog.configure(summary=True, detail_path=detail_path)
+        caplog.set_level(logging.INFO, logger="TransferLog")
+
+        # when
+        with TransferLog.transfer("Test Mod") as transfer:
+            TestTransferLog.record_files(transfer)
+        TransferLog.close()
+
+        # then
+        assert transfer.stats.linked == 1
+        assert transfer.stats.copied == 1
+        assert transfer.stats.replaced == 1
+        assert transfer.stats.skipped == 1
+        assert transfer.stats.blacklisted == 1
+        assert transfer.stats.bytes == 150
+
+        messages: list[str] = [
+            record.getMessage()
+            for record in caplog.records
+            if record.name == "TransferLog" and "Test Mod" in record.getMessage()
+        ]
+        assert len(messages) == 1
+        assert messages[0].startswith(
+            "Transferred 'Test Mod': linked=1 copied=1 skipped=1 replaced=1 "
+            "blacklisted=1 bytes=150 duration="
+        )
+
+        with gzip.open(detail_path, "rt", encoding="utf8") as file:
+            lines: list[str] = file.read().splitlines()
+        assert len(lines) == 5
+        assert lines[0] == (
+            f"[Test Mod] linked: {str(Path('src/a.esp'))!r} -> "
+            f"{str(Path('dst/a.esp'))!r} (100)"
+        )
+        assert lines[4] == "[Test Mod] blacklisted: 'desktop.ini'"
+
+    def test_per_file(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """
+        Tests that skipped, replaced and blacklisted files are logged separately if
+        the summary is disabled and that no detail file is created by default.
+        """
+
+        # given
+        TransferLog.configure(summary=False)
+        caplog.set_level(logging.INFO, logger="TransferLog")
+
+        # when
+        with TransferLog.transfer("Test Mod") as transfer:
+            TestTransferLog.record_files(transfer)
+
+        # then
+        messages: list[str] = [
+            record.getMessage()
+            for record in caplog.records
+            if record.name == "TransferLog"
+        ]
+        assert messages == [
+            f"Deleted existing file: {str(Path('dst/b.bsa'))!r}",
+            f"Skipped existing file: {str(Path('dst/c.ini'))!r}",
+            "Skipped file due to configured blacklist: 'desktop.ini'",
+        ]
+        assert list(tmp_path.iterdir()) == []
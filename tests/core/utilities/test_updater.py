@@ -0,0 +1,216 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Generator, Optional, override
+
+import pytest
+from pytest_mock import MockerFixture
+
+from core.utilities.updater import Updater
+
+
+class UpdateServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the GitHub repository that serves `update.json` and
+    `Changelog.md` with an ETag.
+    """
+
+    UPDATE_JSON: bytes = (
+        b'{"version": "3.0.1", "download_url": "https://example.com/download"}'
+    )
+    CHANGELOG: bytes = b"# 3.0.1\n- Changes"
+    ETAG: str = '"v1"'
+
+    requests: list[tuple[str, Optional[str]]]
+    """List of requested paths and their `If-None-Match` headers."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), UpdateRequestHandler)
+
+        self.requests = []
+
+    @property
+    def url(self) -> str:
+        """
+        Base url of the server.
+        """
+
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class UpdateRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler for `UpdateServer`.
+    """
+
+    server: UpdateServer
+
+    def do_GET(self) -> None:
+        etag: Optional[str] = self.headers.get("If-None-Match")
+        self.server.requests.append((self.path, etag))
+
+        content: bytes
+        match self.path:
+            case "/update.json":
+                content = UpdateServer.UPDATE_JSON
+            case "/Changelog.md":
+                content = UpdateServer.CHANGELOG
+            case _:
+                self.send_response(404)
+                self.end_headers()
+                return
+
+        if etag == UpdateServer.ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", UpdateServer.ETAG)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class TestUpdater:
+    """
+    Tests `core.utilities.updater.Updater` against a local HTTP server.
+    """
+
+    @pytest.fixture
+    def server(self, mocker: MockerFixture) -> Generator[UpdateServer, None, None]:
+        """
+        Starts a local update server and redirects the updater to it.
+        """
+
+        server = UpdateServer()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        mocker.patch.object(Updater, "UPDATE_URL", f"{server.url}/update.json")
+        mocker.patch.object(Updater, "CHANGELOG_URL", f"{server.url}/Changelog.md")
+
+        yield server
+
+        server.shutdown()
+        server.server_close()
+
+    def test_check(self, server: UpdateServer, tmp_path: Path) -> None:
+        """
+        Tests that an available update and its changelog are requested and cached.
+        """
+
+        # given
+        cache_path: Path = tmp_path / "cache" / "update.json"
+        updater = Updater("3.0.0", cache_path)
+
+        # when
+        update_available: bool = updater.check()
+
+        # then
+        assert update_available
+        assert str(updater.latest_version) == "3.0.1"
+        assert updater.download_url == "https://example.com/download"
+        assert updater.changelog == UpdateServer.CHANGELOG.decode()
+        assert server.requests == [("/update.json", None), ("/Changelog.md", None)]
+        assert cache_path.is_file()
+
+    def test_check_no_update(self, server: UpdateServer) -> None:
+        """
+        Tests that the changelog is not requested when there is no update.
+        """
+
+        # given
+        updater = Updater("3.0.1")
+
+        # when
+        update_available: bool = updater.check()
+
+        # then
+        assert not update_available
+        assert server.requests == [("/update.json", None)]
+
+    def test_cache_interval(self, server: UpdateServer, tmp_path: Path) -> None:
+        """
+        Tests that cached responses are used without a request within the cache
+        interval.
+        """
+
+        # given
+        cache_path: Path = tmp_path / "update.json"
+        Updater("3.0.0", cache_path).check()
+        server.requests.clear()
+        updater = Updater("3.0.0", cache_path)
+
+        # when
+        update_available: bool = updater.check()
+
+        # then
+        assert update_available
+        assert updater.changelog == UpdateServer.CHANGELOG.decode()
+        assert server.requests == []
+
+    def test_etag(
+        self, server: UpdateServer, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """
+        Tests that expired cached responses are revalidated with their ETag.
+        """
+
+        # given
+        cache_path: Path = tmp_path / "update.json"
+        Updater("3.0.0", cache_path).check()
+        server.requests.clear()
+        mocker.patch.object(Updater, "CACHE_INTERVAL", 0)
+        updater = Updater("3.0.0", cache_path)
+
+        # when
+        update_available: bool = updater.check()
+
+        # then
+        assert update_available
+        assert str(updater.latest_version) == "3.0.1"
+        assert updater.changelog == UpdateServer.CHANGELOG.decode()
+        assert server.requests == [
+            ("/update.json", UpdateServer.ETAG),
+            ("/Changelog.md", UpdateServer.ETAG),
+        ]
+
+    def test_offline(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """
+        Tests that a failed request is handled and that cached responses are used
+        as fallback.
+        """
+
+        # given
+        mocker.patch.object(Updater, "UPDATE_URL", "http://127.0.0.1:1/update.json")
+        cache_path: Path = tmp_path / "update.json"
+
+        # when
+        update_available: bool = Updater("3.0.0", cache_path).check()
+
+        # then
+        assert not update_available
+
+        # given
+        cache_path.write_text(
+            '{"http://127.0.0.1:1/update.json": {"etag": null, "timestamp": 0, '
+            '"content": "{\\"version\\": \\"3.0.1\\", \\"download_url\\": \\"\\"}"}}',
+            encoding="utf8",
+        )
+        updater = Updater("3.0.0", cache_path)
+
+        # when
+        update_available = updater.update_available()
+
+        # then
+        assert update_available
+        assert str(updater.latest_version) == "3.0.1"
@@ -0,0 +1,211 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+class BenchmarkRecorder:
+    """
+    Class for timing benchmarks and storing their results per commit, so that they
+    can be compared across commits.
+
+    The results are stored as JSON files named after the current commit in the
+    results folder. Each benchmark is identified by its name and parameters.
+    """
+
+    log: logging.Logger = logging.getLogger("BenchmarkRecorder")
+
+    RESULTS_FOLDER: Path = Path("tests") / "benchmarks" / "results"
+    """Default folder for the result files."""
+
+    results_folder: Path
+    commit: str
+
+    def __init__(
+        self, results_folder: Optional[Path] = None, commit: Optional[str] = None
+    ) -> None:
+        """
+        Args:
+            results_folder (Optional[Path], optional):
+                Folder for the result files. Defaults to `RESULTS_FOLDER`.
+            commit (Optional[str], optional):
+                Name of the result file. Defaults to the current commit.
+        """
+
+        self.results_folder = results_folder or BenchmarkRecorder.RESULTS_FOLDER
+        self.commit = commit or BenchmarkRecorder.get_commit()
+
+    @property
+    def results_file(self) -> Path:
+        """
+        Path to the result file of the current commit.
+        """
+
+        return self.results_folder / f"{self.commit}.json"
+
+    def measure[T](
+        self,
+        name: str,
+        func: Callable[[], T],
+        runs: int = 3,
+        setup: Optional[Callable[[], None]] = None,
+        **params: Any,
+    ) -> T:
+        """
+        Times the specified function and stores the result.
+
+        Args:
+            name (str): Name of the benchmark, for eg. `mo2.load_instance`.
+            func (Callable[[], T]): The function to measure.
+            runs (int, optional): Number of measured runs. Defaults to 3.
+            setup (Optional[Callable[[], None]], optional):
+                Function that is called before every run and not measured.
+                Defaults to None.
+            **params (Any): Parameters of the benchmark, for eg. the number of mods.
+
+        Returns:
+            T: The return value of the last run.
+        """
+
+        timings: list[float] = []
+        result: T
+        for _ in range(runs):
+            if setup is not None:
+                setup()
+
+            start: float = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+
+        self.record(name, timings, **params)
+
+        return result
+
+    def record(self, name: str, timings: list[float], **params: Any) -> None:
+        """
+        Stores the timings of a benchmark in the result file of the current commit.
+
+        Args:
+            name (str): Name of the benchmark.
+            timings (list[float]): Measured timings in seconds.
+            **params (Any): Parameters of the benchmark.
+        """
+
+        key: str = BenchmarkRecorder.get_key(name, params)
+        entry: dict[str, Any] = {
+            "name": name,
+            "params": params,
+            "runs": len(timings),
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "mean": statistics.mean(timings),
+        }
+        self.log.info(
+            f"{key}: min {entry['min']:.3f}s, median {entry['median']:.3f}s "
+            f"({len(timings)} run(s))"
+        )
+
+        results: dict[str, Any] = BenchmarkRecorder.load_results(self.results_file)
+        results[key] = entry
+
+        self.results_folder.mkdir(parents=True, exist_ok=True)
+        self.results_file.write_text(json.dumps(results, indent=4), encoding="utf8")
+
+    @staticmethod
+    def get_key(name: str, params: dict[str, Any]) -> str:
+        """
+        Creates a unique key for a benchmark and its parameters.
+
+        Args:
+            name (str): Name of the benchmark.
+            params (dict[str, Any]): Parameters of the benchmark.
+
+        Returns:
+            str: Key, for eg. `mo2.load_instance[mods=100,spec=small]`.
+        """
+
+        if not params:
+            return name
+
+        return f"{name}[{','.join(f'{k}={v}' for k, v in sorted(params.items()))}]"
+
+    @staticmethod
+    def get_commit() -> str:
+        """
+        Returns:
+            str:
+                Short hash of the current commit with a `-dirty` suffix if there are
+                uncommitted changes or `unknown` if git is not available.
+        """
+
+        try:
+            commit: str = subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], text=True
+            ).strip()
+            changes: str = subprocess.check_output(
+                ["git", "status", "--porcelain", "--untracked-files=no"], text=True
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return "unknown"
+
+        return commit + ("-dirty" if changes else "")
+
+    @staticmethod
+    def load_results(results_file: Path) -> dict[str, Any]:
+        """
+        Loads the results from a result file.
+
+        Args:
+            results_file (Path): Path to the result file.
+
+        Returns:
+            dict[str, Any]: Map of benchmark keys to their results.
+        """
+
+        if not results_file.is_file():
+            return {}
+
+        return json.loads(results_file.read_text(encoding="utf8"))
+
+    @staticmethod
+    def compare(old_file: Path, new_file: Path) -> dict[str, float]:
+        """
+        Compares the median timings of two result files.
+
+        Args:
+            old_file (Path): The result file of the baseline.
+            new_file (Path): The result file to compare.
+
+        Returns:
+            dict[str, float]:
+                Map of benchmark keys (that are in both files) to the ratio of the new
+                to the old median timing (< 1.0 means faster).
+        """
+
+        old_results: dict[str, Any] = BenchmarkRecorder.load_results(old_file)
+        new_results: dict[str, Any] = BenchmarkRecorder.load_results(new_file)
+
+        return {
+            key: new_results[key]["median"] / old_results[key]["median"]
+            for key in sorted(old_results.keys() & new_results.keys())
+            if old_results[key]["median"] > 0
+        }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python tests/setup/benchmark.py <old results> <new results>")
+        sys.exit(1)
+
+    for key, ratio in BenchmarkRecorder.compare(
+        Path(sys.argv[1]), Path(sys.argv[2])
+    ).items():
+        print(f"{ratio:6.2f}x  {key}")
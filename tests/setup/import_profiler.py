@@ -0,0 +1,173 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """
+    Class for the import time of a single module as reported by `-X importtime`.
+    """
+
+    module: str
+    """The full name of the module."""
+
+    self_time: float
+    """Time in seconds spent executing the module itself."""
+
+    cumulative_time: float
+    """Time in seconds spent executing the module including its imports."""
+
+    depth: int
+    """Nesting level of the import (0 for top-level imports)."""
+
+
+class ImportProfiler:
+    """
+    Class for measuring the import time of modules in a fresh interpreter with
+    Python's `-X importtime` option.
+    """
+
+    LINE_PATTERN: re.Pattern[str] = re.compile(
+        r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$"
+    )
+    """Pattern for a single line of the `-X importtime` output."""
+
+    SOURCE_PATH: Path = Path(__file__).parents[2] / "src"
+    """Path to the source folder of the application."""
+
+    @staticmethod
+    def profile(
+        module: str, python_path: Optional[list[Path]] = None
+    ) -> list[ImportTiming]:
+        """
+        Imports a module in a new interpreter and measures the import times of all
+        modules that are imported by it.
+
+        Args:
+            module (str): The module to import, for eg. `app`.
+            python_path (Optional[list[Path]], optional):
+                Additional paths for `PYTHONPATH`. Defaults to the source folder.
+
+        Raises:
+            RuntimeError: when the module could not be imported.
+
+        Returns:
+            list[ImportTiming]: The timings in import order.
+        """
+
+        paths: list[str] = [
+            str(path) for path in (python_path or [ImportProfiler.SOURCE_PATH])
+        ]
+        if os.environ.get("PYTHONPATH"):
+            paths.append(os.environ["PYTHONPATH"])
+
+        process: subprocess.CompletedProcess[str] = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            env=os.environ | {"PYTHONPATH": os.pathsep.join(paths)},
+            capture_output=True,
+            text=True,
+        )
+
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"Failed to import {module!r}:\n{process.stderr.splitlines()[-1]}"
+            )
+
+        return ImportProfiler.parse(process.stderr)
+
+    @staticmethod
+    def parse(output: str) -> list[ImportTiming]:
+        """
+        Parses the output of `-X importtime`.
+
+        Args:
+            output (str): The output, written to stderr by the interpreter.
+
+        Returns:
+            list[ImportTiming]: The timings in import order.
+        """
+
+        timings: list[ImportTiming] = []
+        for line in output.splitlines():
+            match: Optional[re.Match[str]] = ImportProfiler.LINE_PATTERN.match(line)
+            if match is None:
+                continue
+
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(
+                ImportTiming(
+                    module=module,
+                    self_time=int(self_us) / 1_000_000,
+                    cumulative_time=int(cumulative_us) / 1_000_000,
+                    depth=(len(indent) - 1) // 2,
+                )
+            )
+
+        return timings
+
+    @staticmethod
+    def get_total_time(timings: list[ImportTiming], module: str) -> float:
+        """
+        Args:
+            timings (list[ImportTiming]): The measured timings.
+            module (str): The name of the module.
+
+        Raises:
+            KeyError: when the module was not imported.
+
+        Returns:
+            float: The cumulative import time of the module in seconds.
+        """
+
+        for timing in timings:
+            if timing.module == module:
+                return timing.cumulative_time
+
+        raise KeyError(module)
+
+    @staticmethod
+    def format_report(timings: list[ImportTiming], top: int = 25) -> str:
+        """
+        Creates a report of the slowest modules.
+
+        Args:
+            timings (list[ImportTiming]): The measured timings.
+            top (int, optional): Number of modules to include. Defaults to 25.
+
+        Returns:
+            str: The report, sorted by self time.
+        """
+
+        lines: list[str] = [f"{'self [ms]':>10} {'cumulative [ms]':>16}  module"]
+        for timing in sorted(timings, key=lambda t: t.self_time, reverse=True)[:top]:
+            lines.append(
+                f"{timing.self_time * 1000:>10.1f} "
+                f"{timing.cumulative_time * 1000:>16.1f}  {timing.module}"
+            )
+
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python tests/setup/import_profiler.py <module> [<top>]")
+        sys.exit(1)
+
+    module: str = sys.argv[1]
+    top: int = int(sys.argv[2]) if len(sys.argv) == 3 else 25
+    timings: list[ImportTiming] = ImportProfiler.profile(module)
+
+    print(ImportProfiler.format_report(timings, top))
+    print(
+        f"\nTotal import time of {module!r}: "
+        f"{ImportProfiler.get_total_time(timings, module) * 1000:.1f} ms"
+    )
@@ -0,0 +1,416 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from core.game.game import Game
+from core.mod_manager.modorganizer.mo2_instance_info import MO2InstanceInfo
+from core.mod_manager.vortex.profile_info import ProfileInfo
+from core.utilities.ini_file import INIFile
+from core.utilities.leveldb import LevelDB
+
+from .mock_plyvel import MockPlyvelDB
+
+
+@dataclass(frozen=True)
+class InstanceSpec:
+    """
+    Class for configuring the size and shape of a generated mod instance.
+    """
+
+    num_mods: int = 100
+    """Number of mods in the instance."""
+
+    files_per_mod: int = 50
+    """Number of files per mod."""
+
+    conflict_ratio: float = 0.1
+    """Share of files (0.0 - 1.0) that are also contained in other mods."""
+
+    median_file_size: int = 4 * 1024
+    """Median size of the generated files in bytes."""
+
+    file_size_sigma: float = 1.5
+    """Spread of the log-normal distribution of the file sizes."""
+
+    max_file_size: int = 4 * 1024 * 1024
+    """Maximum size of a generated file in bytes."""
+
+    num_tools: int = 5
+    """Number of tools in the instance."""
+
+    seed: int = 0
+    """Seed for the random number generator, makes the instance reproducible."""
+
+
+@dataclass(frozen=True)
+class GeneratedMod:
+    """
+    Class for a single mod of a generated instance.
+    """
+
+    name: str
+    """Display name of the mod."""
+
+    mod_id: int
+    """Fake Nexus Mods id of the mod."""
+
+    files: dict[Path, int]
+    """Map of relative file paths to their sizes in bytes."""
+
+    @property
+    def file_name(self) -> str:
+        """
+        Name of the (fake) downloaded archive of the mod.
+        """
+
+        return f"{self.name}-{self.mod_id}-1-0-1700000000.7z"
+
+    @property
+    def vortex_id(self) -> str:
+        """
+        Id of the mod in a Vortex database (the archive name without extension).
+        """
+
+        return self.file_name.rsplit(".", 1)[0]
+
+
+class InstanceGenerator:
+    """
+    Class for fabricating large MO2 instances and Vortex profiles with a
+    configurable number of mods, files, conflicts and tools for benchmarks.
+    """
+
+    FOLDERS: list[str] = [
+        "meshes",
+        "textures",
+        "scripts",
+        "sound/fx",
+        "interface/translations",
+        "skse/plugins",
+    ]
+    """Top-level folders the generated files are distributed to."""
+
+    spec: InstanceSpec
+    game: Game
+
+    __mods: Optional[list[GeneratedMod]] = None
+    __content: Optional[bytes] = None
+
+    def __init__(self, spec: InstanceSpec, game: Optional[Game] = None) -> None:
+        """
+        Args:
+            spec (InstanceSpec): Specification of the generated instance.
+            game (Optional[Game], optional):
+                Game of the instance. Defaults to Skyrim Special Edition.
+        """
+
+        self.spec = spec
+        self.game = game or Game.get_game_by_id("skyrimse")
+
+    @property
+    def mods(self) -> list[GeneratedMod]:
+        """
+        The planned mods of the instance, from lowest to highest priority.
+        """
+
+        if self.__mods is None:
+            self.__mods = self.__plan_mods()
+
+        return self.__mods
+
+    @property
+    def total_files(self) -> int:
+        """
+        Total number of files of all mods.
+        """
+
+        return sum(len(mod.files) for mod in self.mods)
+
+    @property
+    def total_size(self) -> int:
+        """
+        Total size of all files of all mods in bytes.
+        """
+
+        return sum(sum(mod.files.values()) for mod in self.mods)
+
+    def __plan_mods(self) -> list[GeneratedMod]:
+        rng = random.Random(self.spec.seed)
+        shared_files: list[Path] = [
+            self.__get_file_path(rng, f"shared_{i}")
+            for i in range(max(1, self.spec.files_per_mod))
+        ]
+
+        mods: list[GeneratedMod] = []
+        for m in range(self.spec.num_mods):
+            files: dict[Path, int] = {}
+            for f in range(self.spec.files_per_mod):
+                file: Path
+                if rng.random() < self.spec.conflict_ratio:
+                    file = rng.choice(shared_files)
+                else:
+                    file = self.__get_file_path(rng, f"mod_{m}_file_{f}")
+
+                files[file] = self.__get_file_size(rng)
+
+            mods.append(
+                GeneratedMod(
+                    name=f"Generated Mod {m:05d}", mod_id=1000 + m, files=files
+                )
+            )
+
+        return mods
+
+    def __get_file_path(self, rng: random.Random, name: str) -> Path:
+        folder: str = rng.choice(InstanceGenerator.FOLDERS)
+        extension: str = rng.choice([".nif", ".dds", ".pex", ".wav", ".txt", ".dll"])
+
+        return Path(folder) / f"{name}{extension}"
+
+    def __get_file_size(self, rng: random.Random) -> int:
+        size: float = rng.lognormvariate(
+            math.log(max(1, self.spec.median_file_size)), self.spec.file_size_sigma
+        )
+
+        return min(int(size), self.spec.max_file_size)
+
+    def write_mod_files(self, mod: GeneratedMod, mod_folder: Path) -> None:
+        """
+        Writes the files of the specified mod to a folder.
+
+        Args:
+            mod (GeneratedMod): The mod.
+            mod_folder (Path): The folder to write the files to.
+        """
+
+        if self.__content is None:
+            self.__content = random.Random(self.spec.seed).randbytes(
+                self.spec.max_file_size
+            )
+
+        content = memoryview(self.__content)
+        for file, size in mod.files.items():
+            path: Path = mod_folder / file
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content[:size])
+
+    def create_mo2_instance(
+        self, base_folder: Path, game_folder: Path
+    ) -> MO2InstanceInfo:
+        """
+        Creates a portable MO2 instance with all planned mods and tools.
+
+        Args:
+            base_folder (Path): The base folder of the instance.
+            game_folder (Path): The game folder of the instance.
+
+        Returns:
+            MO2InstanceInfo: The info of the created instance.
+        """
+
+        mods_folder: Path = base_folder / "mods"
+        profiles_folder: Path = base_folder / "profiles"
+        (profiles_folder / "Default").mkdir(parents=True, exist_ok=True)
+        (base_folder / "overwrite").mkdir(parents=True, exist_ok=True)
+
+        for mod in self.mods:
+            mod_folder: Path = mods_folder / mod.name
+            self.write_mod_files(mod, mod_folder)
+
+            meta_ini = INIFile(mod_folder / "meta.ini")
+            meta_ini.data = {
+                "General": {
+                    "gameName": self.game.short_name,
+                    "modid": mod.mod_id,
+                    "version": "1.0",
+                    "installationFile": mod.file_name,
+                },
+                "installedFiles": {
+                    "1\\modid": mod.mod_id,
+                    "size": "1",
+                    "1\\fileid": mod.mod_id * 10,
+                },
+            }
+            meta_ini.save_file()
+
+        # MO2 lists the mod with the highest priority first
+        (profiles_folder / "Default" / "modlist.txt").write_text(
+            "".join(f"+{mod.name}\n" for mod in reversed(self.mods)),
+            encoding="utf8",
+        )
+
+        custom_executables: dict[str, Any] = {"size": self.spec.num_tools}
+        for t, (exe_path, working_dir) in enumerate(
+            self.__get_tool_paths(mods_folder, game_folder), start=1
+        ):
+            custom_executables.update(
+                {
+                    f"{t}\\arguments": "",
+                    f"{t}\\binary": str(exe_path).replace("\\", "/"),
+                    f"{t}\\hide": "false",
+                    f"{t}\\ownicon": "false",
+                    f"{t}\\steamAppID": "",
+                    f"{t}\\title": f"Generated Tool {t}",
+                    f"{t}\\toolbar": "false",
+                    f"{t}\\workingDirectory": str(working_dir or ""),
+                }
+            )
+
+        mo2_ini = INIFile(base_folder / "ModOrganizer.ini")
+        mo2_ini.data = {
+            "General": {
+                "gameName": self.game.display_name,
+                "selected_profile": "@ByteArray(Default)",
+                "gamePath": f"@ByteArray({game_folder})",
+            },
+            "Settings": {
+                "base_directory": str(base_folder).replace("\\", "/"),
+            },
+            "customExecutables": custom_executables,
+        }
+        mo2_ini.save_file()
+
+        return MO2InstanceInfo(
+            display_name=base_folder.name,
+            game=self.game,
+            profile="Default",
+            is_global=False,
+            base_folder=base_folder,
+            mods_folder=mods_folder,
+            profiles_folder=profiles_folder,
+        )
+
+    def create_vortex_state(
+        self, staging_folder: Path, game_folder: Path, profile_info: ProfileInfo
+    ) -> dict[str, Any]:
+        """
+        Creates the staging folder with all planned mods and returns the matching
+        Vortex database in the format of a `state.v2.json` export.
+
+        Conflicts between mods are stored as "before" rules like Vortex does.
+
+        Args:
+            staging_folder (Path): The staging folder of the mods.
+            game_folder (Path): The game folder of the profile.
+            profile_info (ProfileInfo):
+                The info of the generated profile, its display name has to end with
+                the profile id in parentheses, for eg. `Benchmark (1a2b3c4d)`.
+
+        Returns:
+            dict[str, Any]: The nested database.
+        """
+
+        game_id: str = self.game.id.lower()
+
+        owners: dict[Path, list[GeneratedMod]] = {}
+        for mod in self.mods:
+            self.write_mod_files(mod, staging_folder / mod.vortex_id)
+
+            for file in mod.files:
+                owners.setdefault(file, []).append(mod)
+
+        rules: dict[str, set[str]] = {}
+        for mod_list in owners.values():
+            for mod, overwriting_mod in zip(mod_list, mod_list[1:]):
+                rules.setdefault(mod.vortex_id, set()).add(overwriting_mod.vortex_id)
+
+        mods_data: dict[str, Any] = {}
+        mod_state: dict[str, Any] = {}
+        for mod in self.mods:
+            mods_data[mod.vortex_id] = {
+                "attributes": {
+                    "customFileName": mod.name,
+                    "downloadGame": game_id,
+                    "fileId": mod.mod_id * 10,
+                    "fileName": mod.file_name,
+                    "logicalFileName": mod.name,
+                    "modId": mod.mod_id,
+                    "source": "nexus",
+                    "version": "1.0",
+                },
+                "id": mod.vortex_id,
+                "installationPath": mod.vortex_id,
+                "state": "installed",
+                "type": "",
+                "rules": [
+                    {"reference": {"id": ref_id}, "type": "before"}
+                    for ref_id in sorted(rules.get(mod.vortex_id, []))
+                ],
+            }
+            mod_state[mod.vortex_id] = {"enabled": True, "enabledTime": 1700000000000}
+
+        tools_data: dict[str, Any] = {}
+        for t, (exe_path, working_dir) in enumerate(
+            self.__get_tool_paths(staging_folder, game_folder, vortex=True), start=1
+        ):
+            tool_id: str = f"generated{t:05d}"
+            tools_data[tool_id] = {
+                "custom": True,
+                "id": tool_id,
+                "name": f"Generated Tool {t}",
+                "path": str(exe_path),
+                "parameters": [],
+                "workingDir": str(working_dir or ""),
+            }
+
+        return {
+            "persistent": {
+                "mods": {game_id: mods_data},
+                "profiles": {
+                    profile_info.id: {
+                        "gameId": game_id,
+                        "id": profile_info.id,
+                        "name": profile_info.display_name.removesuffix(
+                            f" ({profile_info.id})"
+                        ),
+                        "modState": mod_state,
+                        "lastActivated": 1700000000000,
+                    }
+                },
+            },
+            "settings": {
+                "mods": {"installPath": {game_id: str(staging_folder)}},
+                "gameMode": {
+                    "discovered": {
+                        game_id: {"path": str(game_folder), "tools": tools_data}
+                    }
+                },
+            },
+        }
+
+    def __get_tool_paths(
+        self, mods_folder: Path, game_folder: Path, vortex: bool = False
+    ) -> list[tuple[Path, Optional[Path]]]:
+        # Every second tool is located in a mod, the others in the game folder
+        paths: list[tuple[Path, Optional[Path]]] = []
+        for t in range(self.spec.num_tools):
+            if t % 2 and self.mods:
+                mod: GeneratedMod = self.mods[t % len(self.mods)]
+                mod_folder: Path = mods_folder / (mod.vortex_id if vortex else mod.name)
+                paths.append((mod_folder / f"tool_{t}" / f"tool_{t}.exe", None))
+            else:
+                paths.append((game_folder / f"tool_{t}.exe", game_folder))
+
+        return paths
+
+    @staticmethod
+    def create_mock_db(state: dict[str, Any]) -> MockPlyvelDB:
+        """
+        Creates a mocked LevelDB database from a nested database.
+
+        Args:
+            state (dict[str, Any]): The nested database.
+
+        Returns:
+            MockPlyvelDB: The mocked database.
+        """
+
+        flat_data: dict[str, str] = LevelDB.flatten_nested_dict(state)
+
+        return MockPlyvelDB({k.encode(): v.encode() for k, v in flat_data.items()})
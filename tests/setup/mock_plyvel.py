@@ -2,6 +2,7 @@
 Copyright (c) Cutleast
 """
 
+import bisect
 from types import TracebackType
 from typing import Generator, Optional, Self
 
@@ -9,23 +10,44 @@ from typing import Generator, Optional, Self
 class MockPlyvelDB:
     """
     Mock implementation of plyvel.DB to use JSON for storage instead of LevelDB.
+
+    Like LevelDB, keys are iterated in sorted order and prefix iterations seek to
+    the first matching key.
     """
 
     __data: dict[bytes, bytes]
+    __sorted_keys: Optional[list[bytes]]
 
     def __init__(self, data: dict[bytes, bytes] = {}) -> None:
         self.__data = data
+        self.__sorted_keys = None
 
     def iterator(
         self, prefix: Optional[bytes] = None
     ) -> Generator[tuple[bytes, bytes], None, None]:
-        for key, value in self.__data.items():
-            if not prefix or key.startswith(prefix):
-                yield key, value
+        if self.__sorted_keys is None:
+            self.__sorted_keys = sorted(self.__data)
+
+        keys: list[bytes] = self.__sorted_keys
+        for i in range(bisect.bisect_left(keys, prefix) if prefix else 0, len(keys)):
+            key: bytes = keys[i]
+            if prefix and not key.startswith(prefix):
+                break
+
+            if key in self.__data:
+                yield key, self.__data[key]
 
     def put(self, key: bytes, value: bytes) -> None:
+        if key not in self.__data:
+            self.__sorted_keys = None
+
         self.__data[key] = value
 
+    def delete(self, key: bytes) -> None:
+        if key in self.__data:
+            del self.__data[key]
+            self.__sorted_keys = None
+
     def get(self, key: bytes) -> Optional[bytes]:
         if key in self.__data:
             return self.__data[key]
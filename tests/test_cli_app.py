@@ -0,0 +1,133 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import json
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+import pytest
+from base_test import BaseTest
+from setup.instance_generator import InstanceGenerator, InstanceSpec
+
+from cli_app import CliApp
+
+
+class TestCliApp(BaseTest):
+    """
+    Tests `cli_app.CliApp`.
+    """
+
+    @staticmethod
+    def parse_args(*args: str) -> Namespace:
+        """
+        Parses the specified commandline arguments.
+
+        Args:
+            *args (str): Commandline arguments.
+
+        Returns:
+            Namespace: Parsed arguments.
+        """
+
+        parser = ArgumentParser()
+        CliApp.add_commands(parser)
+
+        return parser.parse_args(args)
+
+    def test_parse_args(self) -> None:
+        """
+        Tests that unspecified options fall back to the app settings.
+        """
+
+        # when
+        args: Namespace = TestCliApp.parse_args(
+            "migrate",
+            "--game",
+            "skyrimse",
+            "--src-vortex",
+            "Default",
+            "--dst-mo2",
+            "Test",
+            "--no-hardlinks",
+        )
+
+        # then
+        assert args.command == "migrate"
+        assert args.src_vortex == "Default"
+        assert args.dst_mo2 == Path("Test")
+        assert args.hardlinks is False
+        assert args.replace is None
+        assert args.verify is None
+
+    def test_parse_args_without_source(self) -> None:
+        """
+        Tests that a source instance is required.
+        """
+
+        # when/then
+        with pytest.raises(SystemExit):
+            TestCliApp.parse_args("load", "--game", "skyrimse")
+
+    def test_migrate_and_verify(
+        self,
+        tmp_folder: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Tests a headless migration of a portable MO2 instance and its verification.
+        """
+
+        # given
+        # Keep the config, logs and caches of the app out of the real data folder
+        monkeypatch.chdir(tmp_folder)
+        generator = InstanceGenerator(InstanceSpec(num_mods=5, files_per_mod=5))
+        game_folder: Path = tmp_folder / "game"
+        game_folder.mkdir()
+        src_path: Path = tmp_folder / "source"
+        generator.create_mo2_instance(src_path, game_folder)
+        dst_path: Path = tmp_folder / "destination"
+        common_args: list[str] = [
+            "--game",
+            "skyrimse",
+            "--json",
+            "--log-file",
+            str(tmp_folder / "test.log"),
+            "--src-mo2",
+            str(src_path),
+            "--dst-mo2",
+            str(dst_path),
+        ]
+
+        # when
+        migrate_app = CliApp(
+            TestCliApp.parse_args(
+                "migrate", *common_args, "--no-install-mo2", "--verify"
+            ),
+            "Mod Manager Migrator",
+            "test",
+        )
+        migrate_app.init()
+        migrate_retcode: int = migrate_app.exec()
+        migrate_result: dict = json.loads(capsys.readouterr().out)
+
+        # then
+        assert migrate_retcode == CliApp.RETURN_OK
+        assert migrate_app.data_path == tmp_folder / "data"
+        assert migrate_result["success"]
+        assert len(list((dst_path / "mods").iterdir())) == 5
+
+        # when
+        verify_app = CliApp(
+            TestCliApp.parse_args("verify", *common_args),
+            "Mod Manager Migrator",
+            "test",
+        )
+        verify_app.init()
+        verify_retcode: int = verify_app.exec()
+        verify_result: dict = json.loads(capsys.readouterr().out)
+
+        # then
+        assert verify_retcode == CliApp.RETURN_OK
+        assert verify_result["failed_files"] == {}
@@ -0,0 +1,79 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import pytest
+from setup.import_profiler import ImportProfiler, ImportTiming
+
+
+@pytest.fixture(scope="module")
+def timings() -> list[ImportTiming]:
+    """
+    Measures the import time of the `app` module in a new interpreter.
+    """
+
+    pytest.importorskip("win32api", reason="the app requires Windows")
+
+    return ImportProfiler.profile("app")
+
+
+class TestImportTime:
+    """
+    Tests the import time of the application at startup.
+    """
+
+    BUDGET: float = 1.5
+    """Maximum import time of the `app` module in seconds."""
+
+    LAZY_MODULES: list[str] = ["plyvel", "pyuac", "requests", "urllib3"]
+    """Optional backends that must not be executed at startup."""
+
+    def test_import_budget(self, timings: list[ImportTiming]) -> None:
+        """
+        Tests that the `app` module is imported within the budget.
+        """
+
+        # when
+        total_time: float = ImportProfiler.get_total_time(timings, "app")
+
+        # then
+        assert total_time < TestImportTime.BUDGET, (
+            f"Import time of {total_time:.3f}s exceeds budget of "
+            f"{TestImportTime.BUDGET:.3f}s:\n{ImportProfiler.format_report(timings)}"
+        )
+
+    def test_lazy_modules(self, timings: list[ImportTiming]) -> None:
+        """
+        Tests that optional backends are not imported at startup.
+        """
+
+        # when
+        imported_modules: set[str] = {timing.module for timing in timings}
+
+        # then
+        for module in TestImportTime.LAZY_MODULES:
+            assert module not in imported_modules
+
+    def test_parse(self) -> None:
+        """
+        Tests `setup.import_profiler.ImportProfiler.parse()`.
+        """
+
+        # given
+        output: str = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     core.utilities\n"
+            "import time:      2000 |       2120 |   core\n"
+            "import time:      3000 |       5120 | app\n"
+        )
+
+        # when
+        timings: list[ImportTiming] = ImportProfiler.parse(output)
+
+        # then
+        assert timings == [
+            ImportTiming("core.utilities", 0.00012, 0.00012, 2),
+            ImportTiming("core", 0.002, 0.00212, 1),
+            ImportTiming("app", 0.003, 0.00512, 0),
+        ]
+        assert ImportProfiler.get_total_time(timings, "app") == 0.00512
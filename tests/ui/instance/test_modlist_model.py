@@ -0,0 +1,158 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QModelIndex, Qt
+from pytestqt.qtbot import QtBot
+
+from core.instance.mod import Mod
+from tests.base_test import BaseTest
+from ui.instance.modlist_model import ModlistModel
+
+os.environ["QT_QPA_PLATFORM"] = "offscreen"  # render widgets off-screen
+
+
+class TestModlistModel(BaseTest):
+    """
+    Tests `ui.instance.modlist_model.ModlistModel`.
+    """
+
+    @pytest.fixture
+    def loadorder(self) -> list[Mod]:
+        """
+        Creates a loadorder with a mod without separator, two separators with mods
+        and an overwrite folder.
+        """
+
+        loadorder: list[Mod] = [
+            BaseTest.create_blank_mod("Mod A", [Path("a.esp")]),
+            BaseTest.create_blank_mod("Separator 1"),
+            BaseTest.create_blank_mod("Mod B", [Path("b.esp"), Path("b.bsa")]),
+            BaseTest.create_blank_mod("Mod C"),
+            BaseTest.create_blank_mod("Separator 2"),
+            BaseTest.create_blank_mod("Overwrite"),
+        ]
+        loadorder[1].mod_type = Mod.Type.Separator
+        loadorder[3].enabled = False
+        loadorder[4].mod_type = Mod.Type.Separator
+        loadorder[5].mod_type = Mod.Type.Overwrite
+
+        return loadorder
+
+    @pytest.fixture
+    def model(self, loadorder: list[Mod], qtbot: QtBot) -> ModlistModel:
+        """
+        Creates a model displaying the loadorder.
+        """
+
+        model = ModlistModel(["Name", "Version", "Size", "Priority"])
+        model.set_modlist(loadorder)
+
+        return model
+
+    def test_set_modlist(self, model: ModlistModel, loadorder: list[Mod]) -> None:
+        """
+        Tests the tree structure of the model and the mapping between mods and
+        model indexes.
+        """
+
+        # then
+        assert model.rowCount() == 4
+        assert model.toplevel_mods == [
+            loadorder[0],
+            loadorder[1],
+            loadorder[4],
+            loadorder[5],
+        ]
+        assert model.rowCount(model.index(1, 0)) == 2
+        assert model.get_child_mods(loadorder[1]) == [loadorder[2], loadorder[3]]
+        assert model.rowCount(model.index(2, 0)) == 0
+
+        for mod in loadorder:
+            index: QModelIndex = model.get_index(mod)
+            assert model.get_mod(index) is mod
+            assert model.index(index.row(), 0, index.parent()) == index
+
+        assert model.get_index(loadorder[3]).parent() == model.get_index(loadorder[1])
+        assert model.get_mod(QModelIndex()) is None
+
+    def test_data(self, model: ModlistModel, loadorder: list[Mod]) -> None:
+        """
+        Tests the displayed data of separators, mods and the overwrite folder.
+        """
+
+        # when
+        mod_c: QModelIndex = model.get_index(loadorder[3])
+        separator: QModelIndex = model.get_index(loadorder[1])
+        overwrite: QModelIndex = model.get_index(loadorder[5])
+
+        # then
+        assert mod_c.data() == "Mod C"
+        assert (
+            mod_c.siblingAtColumn(ModlistModel.Column.Priority).data()
+            == "4"  # 1-based priority
+        )
+        assert mod_c.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Unchecked
+        assert separator.data(Qt.ItemDataRole.CheckStateRole) is None
+        assert separator.data(Qt.ItemDataRole.FontRole).bold()
+        assert overwrite.siblingAtColumn(ModlistModel.Column.Priority).data() == ""
+        assert Qt.ItemFlag.ItemIsUserCheckable in model.flags(mod_c)
+        assert Qt.ItemFlag.ItemIsUserCheckable not in model.flags(separator)
+
+    def test_sizes(
+        self, model: ModlistModel, loadorder: list[Mod], qtbot: QtBot
+    ) -> None:
+        """
+        Tests that the sizes of the mods are filled in asynchronously.
+        """
+
+        # given
+        size: QModelIndex = model.get_index(loadorder[2], ModlistModel.Column.Size)
+
+        # when
+        qtbot.waitUntil(lambda: size.data() != "", timeout=5000)
+
+        # then
+        assert size.data() == "2 B"
+        assert model.get_index(loadorder[1], ModlistModel.Column.Size).data() == ""
+
+    def test_set_checked(
+        self, model: ModlistModel, loadorder: list[Mod], qtbot: QtBot
+    ) -> None:
+        """
+        Tests checking and unchecking mods.
+        """
+
+        # given
+        assert model.checked_mods == {loadorder[0], loadorder[2]}
+        assert model.checked_count == 2
+
+        # when
+        with qtbot.waitSignal(model.checked_changed) as blocker:
+            model.set_checked(loadorder, False)
+
+        # then
+        assert blocker.args == [[loadorder[0], loadorder[2]], False]
+        assert model.checked_mods == set()
+        assert model.checked_count == 0
+        assert not model.is_checked(loadorder[0])
+
+        # when
+        success: bool = model.setData(
+            model.get_index(loadorder[3]),
+            Qt.CheckState.Checked,
+            Qt.ItemDataRole.CheckStateRole,
+        )
+
+        # then
+        assert success
+        assert model.checked_mods == {loadorder[3]}
+        assert not model.setData(
+            model.get_index(loadorder[1]),
+            Qt.CheckState.Checked,
+            Qt.ItemDataRole.CheckStateRole,
+        )